@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""
+Compare the per-invocation overhead of running the Flask app for an API Gateway
+event through a new Mangum(WsgiToAsgi(app)) each time, as lambda_handler used to,
+with the cached WsgiLambdaAdapter it uses now.
+
+A trivial route is used, so the times are almost all adapter overhead.
+
+    PYTHONPATH=src python scripts/benchmark_lambda_adapter.py --invocations 5000
+"""
+
+import argparse
+import timeit
+
+from asgiref.wsgi import WsgiToAsgi
+from flask import Flask
+from mangum import Mangum
+
+from eligibility_signposting_api.common.wsgi_lambda_adapter import WsgiLambdaAdapter
+
+EVENT = {
+    "resource": "/{proxy+}",
+    "path": "/patient-check/9990001112",
+    "httpMethod": "GET",
+    "headers": {"Accept": "application/json", "nhs-login-nhs-number": "9990001112"},
+    "multiValueHeaders": {},
+    "queryStringParameters": {"conditions": "RSV"},
+    "multiValueQueryStringParameters": {"conditions": ["RSV"]},
+    "requestContext": {"identity": {"sourceIp": "192.0.0.1"}},
+    "body": None,
+    "isBase64Encoded": False,
+}
+
+
+def create_app():
+    app = Flask(__name__)
+
+    @app.get("/patient-check/<nhs_number>")
+    def check(nhs_number):
+        return {"nhsNumber": nhs_number}
+
+    return app
+
+
+def mangum_per_invocation(app):
+    handler = Mangum(WsgiToAsgi(app), lifespan="off")
+    handler.config["text_mime_types"].append("application/fhir+json")
+    return handler(EVENT, {})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--invocations", type=int, default=5000)
+    args = parser.parse_args()
+
+    app = create_app()
+    adapter = WsgiLambdaAdapter(app, text_mime_types=["application/fhir+json"])
+    assert mangum_per_invocation(app) == adapter(EVENT, {})
+
+    for name, invoke in [
+        ("Mangum(WsgiToAsgi(app)) per invocation", lambda: mangum_per_invocation(app)),
+        ("cached WsgiLambdaAdapter", lambda: adapter(EVENT, {})),
+    ]:
+        best = min(timeit.repeat(invoke, number=args.invocations, repeat=5))
+        print(f"{name:<40} {best / args.invocations * 1e6:8.1f} us per invocation")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,22 @@
+import atexit
 import logging
 import os
 from typing import Any
 
 import wireup.integration.flask
-from asgiref.wsgi import WsgiToAsgi
 from aws_xray_sdk.core import patch_all
 from flask import Flask
-from mangum import Mangum
 from mangum.types import LambdaContext, LambdaEvent
 
 from eligibility_signposting_api import audit, repos, services
-from eligibility_signposting_api.common.cache_manager import FLASK_APP_CACHE_KEY, cache_manager
+from eligibility_signposting_api.audit.audit_service import AuditService
+from eligibility_signposting_api.common.cache_manager import (
+    FLASK_APP_CACHE_KEY,
+    LAMBDA_ADAPTER_CACHE_KEY,
+    cache_manager,
+)
 from eligibility_signposting_api.common.error_handler import handle_exception
+from eligibility_signposting_api.common.wsgi_lambda_adapter import WsgiLambdaAdapter
 from eligibility_signposting_api.config.config import config
 from eligibility_signposting_api.config.constants import URL_PREFIX
 from eligibility_signposting_api.logging.logs_helper import log_request_ids_from_headers
@@ -30,6 +35,9 @@ logger = logging.getLogger(__name__)
 def main() -> None:  # pragma: no cover
     """Run the Flask app as a local process."""
     app = create_app()
+    audit_service = wireup.integration.flask.get_app_container(app).get(AuditService)
+    audit_service.start_background_flush()
+    atexit.register(audit_service.flush)
     app.run(debug=config()["log_level"] == logging.DEBUG)
 
 
@@ -47,6 +55,16 @@ def get_or_create_app() -> Flask:
     return app  # type: ignore[return-value]
 
 
+def get_or_create_lambda_adapter(app: Flask) -> WsgiLambdaAdapter:
+    """Get the adapter running the Flask app for Lambda events, creating it if it doesn't exist or was for another app,
+    so that it too is only built once per Lambda container."""
+    adapter = cache_manager.get(LAMBDA_ADAPTER_CACHE_KEY)
+    if not isinstance(adapter, WsgiLambdaAdapter) or adapter.app is not app:
+        adapter = WsgiLambdaAdapter(app, text_mime_types=["application/fhir+json"])
+        cache_manager.set(LAMBDA_ADAPTER_CACHE_KEY, adapter)
+    return adapter
+
+
 @add_lambda_request_id_to_logger()
 @tracing_setup()
 @log_request_ids_from_headers()
@@ -54,9 +72,7 @@ def lambda_handler(event: LambdaEvent, context: LambdaContext) -> dict[str, Any]
     """Run the Flask app as an AWS Lambda."""
     app = get_or_create_app()
     app.debug = config()["log_level"] == logging.DEBUG
-    handler = Mangum(WsgiToAsgi(app), lifespan="off")
-    handler.config["text_mime_types"].append("application/fhir+json")
-    return handler(event, context)
+    return get_or_create_lambda_adapter(app)(event, context)
 
 
 def create_app() -> Flask:
@@ -0,0 +1,27 @@
+"""Packing several audit records into one Kinesis record, and unpacking them again.
+
+Each audit record is a line of JSON, so an aggregate is just the lines one after another, which Firehose delivers to S3
+exactly as it would the separate records. An aggregate may also be gzipped, which consumers tell apart from plain
+JSON lines by its magic number, as a JSON line always starts with `{`.
+"""
+
+import gzip
+import json
+from collections.abc import Iterable
+from typing import Any
+
+GZIP_MAGIC = b"\x1f\x8b"
+GZIP_COMPRESS_LEVEL = 6
+
+
+def aggregate_records(records: Iterable[bytes], *, compress: bool = False) -> bytes:
+    """Pack newline terminated audit records into a single Kinesis record's data, gzipped if `compress`."""
+    data = b"".join(records)
+    return gzip.compress(data, compresslevel=GZIP_COMPRESS_LEVEL, mtime=0) if compress else data
+
+
+def deaggregate_records(data: bytes) -> list[dict[str, Any]]:
+    """The audit records in a Kinesis record's data, whether it holds one record or an aggregate, gzipped or not."""
+    if data.startswith(GZIP_MAGIC):
+        data = gzip.decompress(data)
+    return [json.loads(line) for line in data.split(b"\n") if line.strip()]
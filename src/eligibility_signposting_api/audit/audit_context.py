@@ -142,7 +142,18 @@ class AuditContext:
 
     @staticmethod
     def write_audit_record(service: AuditService) -> None:
-        service.audit(g.audit_log.model_dump(by_alias=True))
+        service.audit_event(g.audit_log)
+
+    @staticmethod
+    def write_batch_audit_record(service: AuditService, nhs_number: str) -> None:
+        """Write the audit record for one person in a batch request."""
+        g.audit_log.request.nhs_number = nhs_number
+        service.audit_event(g.audit_log)
+
+    @staticmethod
+    def start_next_batch_audit_record() -> None:
+        """Start a new audit record for the next person in a batch request, with the same request details."""
+        g.audit_log = AuditEvent(request=g.audit_log.request.model_copy(update={"nhs_number": None}))
 
     @staticmethod
     def create_audit_actions(suggested_actions: list[SuggestedAction] | None) -> list[AuditAction] | None:
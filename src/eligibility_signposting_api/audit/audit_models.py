@@ -1,9 +1,14 @@
+import json
 from datetime import UTC, datetime
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
 from pydantic.alias_generators import to_camel
 
+AuditTimestamp = Annotated[datetime, PlainSerializer(str, return_type=str, when_used="json")]
+"""A datetime written to audit records as `str()` gives it, as the audit pipeline has always received them."""
+
 
 class CamelCaseBaseModel(BaseModel):
     model_config = ConfigDict(
@@ -27,7 +32,7 @@ class RequestAuditQueryParams(CamelCaseBaseModel):
 
 
 class RequestAuditData(CamelCaseBaseModel):
-    request_timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    request_timestamp: AuditTimestamp = Field(default_factory=lambda: datetime.now(UTC))
     headers: RequestAuditHeader = Field(default_factory=RequestAuditHeader)
     query_params: RequestAuditQueryParams = Field(default_factory=RequestAuditQueryParams)
     nhs_number: str | None = None
@@ -88,10 +93,18 @@ class AuditCondition(CamelCaseBaseModel):
 
 class ResponseAuditData(CamelCaseBaseModel):
     response_id: UUID | None = None
-    last_updated: datetime | None = None
+    last_updated: AuditTimestamp | None = None
     condition: list[AuditCondition] = Field(default_factory=list)
 
 
 class AuditEvent(CamelCaseBaseModel):
     request: RequestAuditData = Field(default_factory=RequestAuditData)
     response: ResponseAuditData = Field(default_factory=ResponseAuditData)
+
+    def to_json_line(self) -> bytes:
+        """The audit record as a line of JSON, byte for byte as `json.dumps(self.model_dump(by_alias=True),
+        default=str) + "\\n"` gives it, the format the audit pipeline has always received.
+
+        Pydantic dumps the record in JSON mode, so timestamps are already `str()`ed and UUIDs are strings, and the
+        `json` module's shared encoder writes it with no `default` to fall back on."""
+        return (json.dumps(self.model_dump(mode="json", by_alias=True)) + "\n").encode("utf-8")
@@ -1,20 +1,83 @@
+import base64
 import hashlib
-import json
 import logging
+import threading
+import time
 import uuid
-from typing import Annotated
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Annotated, Any
 
 from aws_xray_sdk.core import xray_recorder
 from botocore.client import BaseClient
+from botocore.exceptions import BotoCoreError, ClientError
 from wireup import Inject, service
 
+from eligibility_signposting_api.audit.aggregation import aggregate_records
+from eligibility_signposting_api.audit.audit_models import AuditEvent
 from eligibility_signposting_api.config.config import AwsKinesisStreamName
+from eligibility_signposting_api.config.constants import (
+    AUDIT_AGGREGATE_MAX_BYTES,
+    AUDIT_AGGREGATION,
+    AUDIT_BATCH_MAX_BYTES,
+    AUDIT_BATCH_MAX_RECORDS,
+    AUDIT_FLUSH_INTERVAL_SECONDS,
+    AUDIT_MAX_BUFFERED_RECORDS,
+    AUDIT_PUT_ATTEMPTS,
+)
 
 logger = logging.getLogger(__name__)
 
+KINESIS_PUT_RECORDS_MAX_RECORDS = 500
+KINESIS_PUT_RECORDS_MAX_BYTES = 5 * 1024 * 1024
+RETRY_BACKOFF_SECONDS = 0.05
+
+
+class AuditDeliveryError(Exception):
+    """Audit records could not be sent to the kinesis data stream."""
+
+
+@dataclass(frozen=True, eq=False)
+class _PendingRecord:
+    data: bytes
+    partition_key: str
+    aggregated: bool = False
+    parts: tuple["_PendingRecord", ...] = ()
+    """The records an aggregate was packed from. Records are compared by identity, as two requests may audit identical
+    ones."""
+
+    @property
+    def size(self) -> int:
+        return len(self.data) + len(self.partition_key)
+
+    def as_entry(self) -> dict[str, Any]:
+        return {"Data": self.data, "PartitionKey": self.partition_key}
+
+    def audited(self) -> tuple["_PendingRecord", ...]:
+        """The records as they were audited, those it was packed from if it's an aggregate."""
+        return self.parts or (self,)
+
 
 @service
-class AuditService:  # pragma: no cover
+class AuditService:
+    """Sends audit records to the configured kinesis data stream.
+
+    Records are queued as they're audited and sent in batches with `put_records`, rather than one `put_record` call
+    each. A batch is sent once AUDIT_BATCH_MAX_RECORDS records or AUDIT_BATCH_MAX_BYTES bytes are waiting, and whatever
+    is left is sent before each request is answered, so that no records are left behind in a Lambda container which is
+    then frozen or recycled. Once `start_background_flush` has been called, as it is by the local server, records are
+    instead sent from a background thread every AUDIT_FLUSH_INTERVAL_SECONDS, or as soon as a batch is full, and
+    requests don't wait for Kinesis at all.
+
+    Records Kinesis fails to accept are sent again, up to AUDIT_PUT_ATTEMPTS times, and then kept for the next flush,
+    up to AUDIT_MAX_BUFFERED_RECORDS waiting in all, beyond which the oldest are written to the error log. A request
+    whose own records could not be sent fails with an `AuditDeliveryError`, but not one which only found records of
+    earlier requests still failing.
+
+    With AUDIT_AGGREGATION set to "lines" or "gzip", the records in each flush sharing a partition key are packed into
+    as few Kinesis records as AUDIT_AGGREGATE_MAX_BYTES allows, gzipped for "gzip", so that far fewer records use the
+    shards' throughput. `aggregation.deaggregate_records` unpacks them again."""
+
     def __init__(
         self,
         kinesis: Annotated[BaseClient, Inject(qualifier="kinesis")],
@@ -23,6 +86,13 @@ class AuditService:  # pragma: no cover
         super().__init__()
         self.kinesis = kinesis
         self.audit_stream = audit_stream
+        self._pending: deque[_PendingRecord] = deque()
+        self._pending_bytes = 0
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._background_flush: threading.Thread | None = None
+        self._request = threading.local()
 
     @staticmethod
     def get_partition_key(response_id: str) -> str:
@@ -30,30 +100,205 @@ class AuditService:  # pragma: no cover
         bucket = h % 32
         return f"audit-{bucket:02d}"
 
-    @xray_recorder.capture("AuditService.audit")  # pyright: ignore[reportCallIssue]
-    def audit(self, audit_record: dict) -> None:
+    @xray_recorder.capture("AuditService.audit_event")  # pyright: ignore[reportCallIssue]
+    def audit_event(self, audit_event: AuditEvent) -> None:
         """
-        Sends an audit record to the configured kinesis data stream.
+        Queues an audit event to be sent to the configured kinesis data stream, as a line of JSON.
 
         Args:
-            audit_record (dict): The audit data to send.
+            audit_event (AuditEvent): The audit event to send.
         """
-        data = json.dumps(audit_record, default=str)
-        response_id = audit_record.get("response", {}).get("responseId")
+        self._enqueue(audit_event.to_json_line(), audit_event.response.response_id)
+
+    def _enqueue(self, data: bytes, response_id: object) -> None:
         if response_id is None:
             response_id = str(uuid.uuid4())
             logger.warning("Missing responseId in audit record; using UUID fallback")
-        partition_key = self.get_partition_key(str(response_id))
-        response = self.kinesis.put_record(
-            StreamName=self.audit_stream,
-            Data=(data + "\n").encode("utf-8"),
-            PartitionKey=partition_key,
-        )
-        logger.info(
-            "Successfully sent to kinesis",
-            extra={
-                "stream_name": self.audit_stream,
-                "kinesis_sequence_number": response.get("SequenceNumber"),
-                "kinesis_shard_id": response.get("ShardId"),
-            },
+        record = _PendingRecord(data, self.get_partition_key(str(response_id)))
+        self._audited_by_request().append(record)
+
+        with self._pending_lock:
+            self._pending.append(record)
+            self._pending_bytes += record.size
+            batch_is_full = (
+                len(self._pending) >= AUDIT_BATCH_MAX_RECORDS or self._pending_bytes >= AUDIT_BATCH_MAX_BYTES
+            )
+        if not batch_is_full:
+            return
+        if self._background_flush is not None:
+            self._flush_requested.set()
+        else:
+            # Any which fail are kept, and request_finished tries them again.
+            self._flush()
+
+    def _audited_by_request(self) -> list[_PendingRecord]:
+        """The records audited by the request being handled in this thread, so far."""
+        if not hasattr(self._request, "audited"):
+            self._request.audited = []
+        return self._request.audited
+
+    def request_finished(self) -> None:
+        """Send the queued records before the request is answered, as the Lambda container may be frozen or recycled
+        once it has been. Does nothing once `start_background_flush` has been called, leaving the records to it.
+
+        Raises:
+            AuditDeliveryError: If any of the records this request audited could not be sent. They're kept to be sent
+                again by the next flush. Records of earlier requests which still can't be sent don't fail this one.
+        """
+        audited = set(self._audited_by_request())
+        self._request.audited = []
+        if self._background_flush is not None:
+            return
+
+        failed = [record for record in self._flush() if not audited.isdisjoint(record.audited())]
+        if failed:
+            msg = f"{len(failed)} audit records could not be sent to kinesis"
+            raise AuditDeliveryError(msg)
+
+    def flush(self) -> None:
+        """Send every queued record.
+
+        Raises:
+            AuditDeliveryError: If any records could not be sent. They're kept to be sent again by the next flush.
+        """
+        failed = self._flush()
+        if failed:
+            msg = f"{len(failed)} audit records could not be sent to kinesis"
+            raise AuditDeliveryError(msg)
+
+    def _flush(self) -> list[_PendingRecord]:
+        """Send every queued record, keeping any which could not be sent for the next flush. Returns those."""
+        with self._flush_lock:
+            with self._pending_lock:
+                records = list(self._pending)
+                self._pending.clear()
+                self._pending_bytes = 0
+            if not records:
+                return []
+            if AUDIT_AGGREGATION != "none":
+                records = self._aggregate(records, compress=AUDIT_AGGREGATION == "gzip")
+
+            failed = [record for batch in self._batches(records) for record in self._put_batch(batch)]
+            if failed:
+                self._requeue(failed)
+            return failed
+
+    def start_background_flush(self, interval: float = AUDIT_FLUSH_INTERVAL_SECONDS) -> None:
+        """Send queued records from a background thread every `interval` seconds, or as soon as a batch is full,
+        instead of before each request is answered."""
+        if self._background_flush is not None:
+            return
+
+        def flush_periodically() -> None:
+            while True:
+                self._flush_requested.wait(interval)
+                self._flush_requested.clear()
+                try:
+                    self.flush()
+                except Exception:
+                    logger.exception("Background audit flush failed")
+
+        self._background_flush = threading.Thread(target=flush_periodically, name="audit-flush", daemon=True)
+        self._background_flush.start()
+
+    @property
+    def pending(self) -> int:
+        """How many records are waiting to be sent."""
+        return len(self._pending)
+
+    @staticmethod
+    def _aggregate(records: list[_PendingRecord], *, compress: bool) -> list[_PendingRecord]:
+        """Pack the records into aggregates of up to AUDIT_AGGREGATE_MAX_BYTES, each holding records with the same
+        partition key in the order they were audited. Aggregates kept from an earlier flush are sent as they are."""
+        by_partition_key: dict[str, list[_PendingRecord]] = defaultdict(list)
+        for record in records:
+            by_partition_key[record.partition_key].append(record)
+
+        def aggregate(partition_key: str, parts: list[_PendingRecord]) -> _PendingRecord:
+            data = aggregate_records((part.data for part in parts), compress=compress)
+            return _PendingRecord(data, partition_key, aggregated=True, parts=tuple(parts))
+
+        aggregates: list[_PendingRecord] = []
+        for partition_key, keyed_records in by_partition_key.items():
+            parts: list[_PendingRecord] = []
+            parts_bytes = 0
+            for record in keyed_records:
+                if parts and (record.aggregated or parts_bytes + len(record.data) > AUDIT_AGGREGATE_MAX_BYTES):
+                    aggregates.append(aggregate(partition_key, parts))
+                    parts, parts_bytes = [], 0
+                if record.aggregated:
+                    aggregates.append(record)
+                else:
+                    parts.append(record)
+                    parts_bytes += len(record.data)
+            if parts:
+                aggregates.append(aggregate(partition_key, parts))
+        return aggregates
+
+    @staticmethod
+    def _batches(records: list[_PendingRecord]) -> list[list[_PendingRecord]]:
+        batches: list[list[_PendingRecord]] = [[]]
+        batch_bytes = 0
+        for record in records:
+            if batches[-1] and (
+                len(batches[-1]) >= KINESIS_PUT_RECORDS_MAX_RECORDS
+                or batch_bytes + record.size > KINESIS_PUT_RECORDS_MAX_BYTES
+            ):
+                batches.append([])
+                batch_bytes = 0
+            batches[-1].append(record)
+            batch_bytes += record.size
+        return batches
+
+    def _put_batch(self, batch: list[_PendingRecord]) -> list[_PendingRecord]:
+        """Send a batch of records, sending any Kinesis fails to accept again. Returns those which never were."""
+        for attempt in range(AUDIT_PUT_ATTEMPTS):
+            if attempt:
+                time.sleep(RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            try:
+                response = self.kinesis.put_records(
+                    StreamName=self.audit_stream, Records=[record.as_entry() for record in batch]
+                )
+            except (BotoCoreError, ClientError):
+                logger.warning("Failed to send audit records to kinesis", exc_info=True, extra={"records": len(batch)})
+                continue
+
+            sent = len(batch) - response.get("FailedRecordCount", 0)
+            logger.info("Successfully sent to kinesis", extra={"stream_name": self.audit_stream, "records": sent})
+            failed = [
+                (record, result)
+                for record, result in zip(batch, response["Records"], strict=True)
+                if result.get("ErrorCode") is not None
+            ]
+            if not failed:
+                return []
+            batch = [record for record, _ in failed]
+            logger.warning(
+                "Kinesis failed to accept some audit records",
+                extra={"records": len(batch), "error_code": failed[0][1]["ErrorCode"]},
+            )
+        return batch
+
+    def _requeue(self, records: list[_PendingRecord]) -> None:
+        """Keep records which could not be sent for the next flush. Beyond AUDIT_MAX_BUFFERED_RECORDS, the oldest are
+        written to the error log instead, so that they can still be recovered."""
+        dropped: list[_PendingRecord] = []
+        with self._pending_lock:
+            self._pending.extendleft(reversed(records))
+            self._pending_bytes += sum(record.size for record in records)
+            while len(self._pending) > AUDIT_MAX_BUFFERED_RECORDS:
+                dropped.append(self._pending.popleft())
+                self._pending_bytes -= dropped[-1].size
+        logger.error(
+            "Audit records could not be sent to kinesis, and will be tried again",
+            extra={"records": len(records) - len(dropped), "dropped": len(dropped)},
         )
+        for record in dropped:
+            logger.error(
+                "Audit record dropped from the full kinesis queue",
+                extra={
+                    "partition_key": record.partition_key,
+                    "aggregated": record.aggregated,
+                    "data_base64": base64.b64encode(record.data).decode("ascii"),
+                },
+            )
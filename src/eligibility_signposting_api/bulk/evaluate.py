@@ -0,0 +1,173 @@
+"""Evaluate the eligibility of everyone in an extract of the person table against a directory of campaign configs,
+offline.
+
+People are read from a JSONL file of person table items (one item per line, with all the items for a person on
+adjacent lines, as written by the manual upload scripts), evaluated with the same EligibilityCalculator the API uses
+across a pool of processes, and written as JSONL results in the order they were read. Nothing is read from or sent to
+AWS, so no audit records are written.
+
+    bulk-evaluate --people people.jsonl --config-dir configs/ --output results.jsonl
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from itertools import batched, groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, TextIO
+
+from flask import Flask, g
+
+from eligibility_signposting_api.audit.audit_models import AuditEvent
+from eligibility_signposting_api.bulk.processes import map_in_processes
+from eligibility_signposting_api.model.campaign_config import CampaignConfig, Rules
+from eligibility_signposting_api.model.campaign_index import CATEGORY_TYPES, CampaignIndex
+from eligibility_signposting_api.model.person import Person
+from eligibility_signposting_api.services.calculators.eligibility_calculator import EligibilityCalculator
+from eligibility_signposting_api.views.eligibility import build_eligibility_payload
+
+logger = logging.getLogger(__name__)
+
+PersonRows = tuple[str, list[dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class EvaluationOptions:
+    """The query parameters an API request would have given."""
+
+    include_actions: str = "Y"
+    conditions: tuple[str, ...] = ("ALL",)
+    category: str = "ALL"
+
+
+def load_campaign_configs(config_path: Path) -> list[CampaignConfig]:
+    """The campaign config in the file, or every campaign config in the directory, in the format they are stored in
+    S3."""
+    paths = sorted(config_path.glob("*.json")) if config_path.is_dir() else [config_path]
+    return [Rules.model_validate(json.loads(path.read_text())).campaign_config for path in paths]
+
+
+def read_people(lines: Iterable[str]) -> Iterator[PersonRows]:
+    """Each person's NHS number and rows, grouping adjacent lines with the same NHS_NUMBER."""
+    rows = (json.loads(line) for line in lines if line.strip())
+    seen: set[str] = set()
+    for nhs_number, person_rows in groupby(rows, key=itemgetter("NHS_NUMBER")):
+        if nhs_number in seen:
+            logger.warning(
+                "Rows for %s are not adjacent, so they will be evaluated as more than one person", nhs_number
+            )
+        seen.add(nhs_number)
+        yield nhs_number, list(person_rows)
+
+
+def evaluate_person(
+    nhs_number: str, rows: list[dict[str, Any]], campaign_index: CampaignIndex, options: EvaluationOptions
+) -> dict[str, Any]:
+    """The person's processed suggestions, as they would appear in the API response. Must be called in an app
+    context."""
+    g.audit_log = AuditEvent()
+    try:
+        eligibility_status = EligibilityCalculator(Person(rows), campaign_index).get_eligibility_status(
+            options.include_actions, list(options.conditions), options.category
+        )
+    except Exception as e:
+        logger.exception("Failed to evaluate %s", nhs_number)
+        return {"nhsNumber": nhs_number, "error": str(e)}
+
+    response = build_eligibility_payload(eligibility_status)
+    return {"nhsNumber": nhs_number, "processedSuggestions": response["processedSuggestions"]}
+
+
+class _Worker:
+    """The campaign configs and app context each process evaluates people with, loaded once per process."""
+
+    app = Flask(__name__)
+    campaign_index: CampaignIndex | None = None
+    options = EvaluationOptions()
+
+    @classmethod
+    def initialise(cls, config_dir: Path, options: EvaluationOptions) -> None:
+        cls.campaign_index = CampaignIndex(load_campaign_configs(config_dir))
+        cls.options = options
+
+    @classmethod
+    def evaluate(cls, people: tuple[PersonRows, ...]) -> list[str]:
+        if cls.campaign_index is None:
+            message = "Worker used before it was initialised"
+            raise RuntimeError(message)
+        with cls.app.app_context():
+            return [
+                json.dumps(evaluate_person(nhs_number, rows, cls.campaign_index, cls.options))
+                for nhs_number, rows in people
+            ]
+
+
+def evaluate_people(
+    people: Iterable[PersonRows],
+    config_dir: Path,
+    options: EvaluationOptions,
+    *,
+    workers: int = 1,
+    chunk_size: int = 200,
+) -> Iterator[str]:
+    """A JSON result line for each person, in order.
+
+    With more than one worker, people are evaluated in chunks across a pool of processes."""
+    chunks = batched(people, chunk_size, strict=False)
+    for lines in map_in_processes(
+        _Worker.evaluate, chunks, workers=workers, initializer=_Worker.initialise, initargs=(config_dir, options)
+    ):
+        yield from lines
+
+
+def write_lines(lines: Iterable[str], output: TextIO) -> int:
+    count = 0
+    for line in lines:
+        output.write(line)
+        output.write("\n")
+        count += 1
+    return count
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Evaluate eligibility for a JSONL extract of the person table.")
+    parser.add_argument("--people", required=True, type=Path, help="JSONL file of person table items")
+    parser.add_argument("--config-dir", required=True, type=Path, help="Directory of campaign config JSON files")
+    parser.add_argument("--output", type=Path, help="JSONL file to write results to (default: stdout)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of processes to use")
+    parser.add_argument("--chunk-size", type=int, default=200, help="People evaluated per task")
+    parser.add_argument("--category", default="ALL", choices=sorted(CATEGORY_TYPES))
+    parser.add_argument("--conditions", default="ALL", help="Comma separated conditions, or ALL")
+    parser.add_argument("--include-actions", default="Y", choices=["Y", "N"])
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+    args = parse_args(argv)
+    options = EvaluationOptions(
+        include_actions=args.include_actions,
+        conditions=tuple(condition.strip() for condition in args.conditions.split(",")),
+        category=args.category,
+    )
+
+    with args.people.open() as people_file:
+        results = evaluate_people(
+            read_people(people_file), args.config_dir, options, workers=args.workers, chunk_size=args.chunk_size
+        )
+        if args.output is None:
+            count = write_lines(results, sys.stdout)
+        else:
+            with args.output.open("w") as output:
+                count = write_lines(results, output)
+
+    logger.info("Evaluated %d people", count)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
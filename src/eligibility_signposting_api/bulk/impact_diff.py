@@ -0,0 +1,175 @@
+"""Compare how two versions of the campaign configs would treat a population, before publishing the new one.
+
+People are read from a JSONL file of person table items, as for `bulk-evaluate`, and streamed in chunks across a pool
+of processes. Each chunk is loaded into a `Population` once and evaluated with a `PopulationCalculator` against both
+versions, which share its columns. The report gives, for each condition, how many people move from each status to
+each other, and the rules giving the reasons for their status before and after the change.
+
+    config-impact-diff --people people.jsonl --before test_config_v1.0.0.json --after test_config_v1.1.0.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import batched
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from eligibility_signposting_api.bulk.evaluate import EvaluationOptions, PersonRows, load_campaign_configs, read_people
+from eligibility_signposting_api.bulk.processes import map_in_processes
+from eligibility_signposting_api.model.campaign_index import CATEGORY_TYPES, CampaignIndex
+from eligibility_signposting_api.model.person import Person
+from eligibility_signposting_api.model.population import Mask, Population
+from eligibility_signposting_api.services.calculators.population_calculator import (
+    PopulationCalculator,
+    PopulationConditionResult,
+    RuleKey,
+)
+from eligibility_signposting_api.views.eligibility import STATUS_MAPPING
+
+if TYPE_CHECKING:
+    from eligibility_signposting_api.model.eligibility_status import ConditionName
+
+logger = logging.getLogger(__name__)
+
+NOT_EVALUATED = "NotEvaluated"
+"""The status for a condition with no live campaign in one of the versions."""
+
+
+@dataclass
+class ImpactCounts:
+    """How many people moved between statuses for each condition, and the rules behind their moves."""
+
+    people: int = 0
+    transitions: Counter[tuple[str, str, str]] = field(default_factory=Counter)
+    """People for each condition, status before and status after."""
+    reasons: Counter[tuple[str, str, str, str, str]] = field(default_factory=Counter)
+    """People who changed status for each condition, status before, status after, version and rule."""
+
+    def update(self, other: ImpactCounts) -> None:
+        self.people += other.people
+        self.transitions.update(other.transitions)
+        self.reasons.update(other.reasons)
+
+    def to_report(self) -> dict[str, Any]:
+        conditions: dict[str, Any] = {}
+        for (condition, before, after), count in sorted(self.transitions.items()):
+            report = conditions.setdefault(condition, {"transitions": {}, "changes": {}})
+            report["transitions"].setdefault(before, {})[after] = count
+            if before != after:
+                report["changes"][f"{before} -> {after}"] = {"people": count, "before": {}, "after": {}}
+        for (condition, before, after, version, rule), count in sorted(self.reasons.items()):
+            conditions[condition]["changes"][f"{before} -> {after}"][version][rule] = count
+        return {"people": self.people, "conditions": conditions}
+
+
+def _status_masks(result: PopulationConditionResult | None, everyone: Mask) -> dict[str, Mask]:
+    if result is None:
+        return {NOT_EVALUATED: everyone}
+    return {STATUS_MAPPING[status].value: mask for status, mask in result.statuses.items()}
+
+
+def _rule_label(rule_key: RuleKey) -> str:
+    return f"{rule_key.type.value}:{rule_key.priority}:{rule_key.name}"
+
+
+def diff_population(
+    population: Population, before: CampaignIndex, after: CampaignIndex, options: EvaluationOptions
+) -> ImpactCounts:
+    """Evaluate the population against both versions of the campaign configs, and count the differences."""
+    results: list[dict[ConditionName, PopulationConditionResult]] = [
+        {
+            result.condition_name: result
+            for result in PopulationCalculator(population, campaign_configs).get_condition_results(
+                list(options.conditions), options.category
+            )
+        }
+        for campaign_configs in (before, after)
+    ]
+
+    counts = ImpactCounts(people=len(population))
+    for condition in sorted(results[0].keys() | results[1].keys()):
+        before_result, after_result = (versions.get(condition) for versions in results)
+        after_statuses = _status_masks(after_result, population.everyone)
+        for before_status, before_mask in _status_masks(before_result, population.everyone).items():
+            for after_status, after_mask in after_statuses.items():
+                moved = before_mask & after_mask
+                if not moved:
+                    continue
+                counts.transitions[(condition, before_status, after_status)] += moved.bit_count()
+                if before_status == after_status:
+                    continue
+                for version, result in (("before", before_result), ("after", after_result)):
+                    for rule_key, reason_mask in result.rule_reasons.items() if result else ():
+                        if people := (reason_mask & moved).bit_count():
+                            reason = (condition, before_status, after_status, version, _rule_label(rule_key))
+                            counts.reasons[reason] += people
+    return counts
+
+
+class _Worker:
+    """The two versions of the campaign configs each process compares, loaded once per process."""
+
+    before = CampaignIndex([])
+    after = CampaignIndex([])
+    options = EvaluationOptions()
+
+    @classmethod
+    def initialise(cls, before_path: Path, after_path: Path, options: EvaluationOptions) -> None:
+        cls.before = CampaignIndex(load_campaign_configs(before_path))
+        cls.after = CampaignIndex(load_campaign_configs(after_path))
+        cls.options = options
+
+    @classmethod
+    def diff(cls, people: tuple[PersonRows, ...]) -> ImpactCounts:
+        population = Population(Person(rows) for _, rows in people)
+        return diff_population(population, cls.before, cls.after, cls.options)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare two versions of the campaign configs across a population.")
+    parser.add_argument("--people", required=True, type=Path, help="JSONL file of person table items")
+    parser.add_argument("--before", required=True, type=Path, help="Current campaign config file or directory")
+    parser.add_argument("--after", required=True, type=Path, help="New campaign config file or directory")
+    parser.add_argument("--output", type=Path, help="JSON file to write the report to (default: stdout)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of processes to use")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="People evaluated per task")
+    parser.add_argument("--category", default="ALL", choices=sorted(CATEGORY_TYPES))
+    parser.add_argument("--conditions", default="ALL", help="Comma separated conditions, or ALL")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+    args = parse_args(argv)
+    options = EvaluationOptions(
+        conditions=tuple(condition.strip() for condition in args.conditions.split(",")), category=args.category
+    )
+
+    counts = ImpactCounts()
+    with args.people.open() as people_file:
+        for chunk_counts in map_in_processes(
+            _Worker.diff,
+            batched(read_people(people_file), args.chunk_size, strict=False),
+            workers=args.workers,
+            initializer=_Worker.initialise,
+            initargs=(args.before, args.after, options),
+        ):
+            counts.update(chunk_counts)
+            logger.info("Compared %d people", counts.people)
+
+    report = json.dumps(counts.to_report(), indent=2)
+    if args.output is None:
+        sys.stdout.write(report + "\n")
+    else:
+        args.output.write_text(report + "\n")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
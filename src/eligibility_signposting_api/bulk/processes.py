@@ -0,0 +1,33 @@
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+
+def map_in_processes[T, R](
+    function: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    workers: int,
+    initializer: Callable[..., None],
+    initargs: tuple[Any, ...] = (),
+) -> Iterator[R]:
+    """The function's result for each item, in order, spread across a pool of processes each set up by the
+    initializer.
+
+    Only a couple of items per worker are submitted ahead of the results being consumed, so a large input is streamed
+    through the pool rather than read into memory up front, as `ProcessPoolExecutor.map` would. With a single worker,
+    everything runs in this process."""
+    if workers <= 1:
+        initializer(*initargs)
+        yield from map(function, items)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        pending: deque[Future[R]] = deque()
+        for item in items:
+            pending.append(pool.submit(function, item))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -110,6 +110,14 @@ INVALID_CONDITION_FORMAT_ERROR = APIErrorResponse(
     fhir_display_message="The given conditions were not in the expected format.",
 )
 
+INVALID_BATCH_REQUEST_ERROR = APIErrorResponse(
+    status_code=HTTPStatus.BAD_REQUEST,
+    fhir_issue_code=FHIRIssueCode.VALUE,
+    fhir_issue_severity=FHIRIssueSeverity.ERROR,
+    fhir_error_code=FHIRSpineErrorCode.INVALID_PARAMETER,
+    fhir_display_message="The request body was not in the expected format.",
+)
+
 NHS_NUMBER_NOT_FOUND_ERROR = APIErrorResponse(
     status_code=HTTPStatus.NOT_FOUND,
     fhir_issue_code=FHIRIssueCode.PROCESSING,
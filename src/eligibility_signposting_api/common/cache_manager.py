@@ -1,6 +1,11 @@
 """Cache management utilities for Lambda container optimization."""
 
 import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
 from typing import TypeVar
 
 logger = logging.getLogger(__name__)
@@ -61,6 +66,207 @@ class CacheManager:
         return len(self._caches)
 
 
+@dataclass
+class RefreshMetrics:
+    """Timings and counts for the refreshes of a `RefreshingCache`."""
+
+    refreshes: int = 0
+    failures: int = 0
+    stale_hits: int = 0
+    last_refresh_seconds: float | None = None
+    total_refresh_seconds: float = 0.0
+
+
+@dataclass(frozen=True)
+class _Entry[V]:
+    value: V
+    loaded_at: float
+
+
+class RefreshingCache[V]:
+    """A single value, loaded on demand and kept for `ttl` seconds.
+
+    Only one load runs at a time (per container): callers arriving while a load is in progress wait for it and use its
+    result rather than loading again. With `serve_stale` set, an expired value keeps being returned while a refresh
+    runs on a background thread, so no request waits for a reload once the value has first been loaded. If that
+    refresh fails, the stale value is kept and the next request tries again."""
+
+    def __init__(
+        self, name: str, ttl: float, *, serve_stale: bool = False, timer: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.serve_stale = serve_stale
+        self.metrics = RefreshMetrics()
+        self._timer = timer
+        self._entry: _Entry[V] | None = None
+        self._lock = threading.Lock()
+
+    def get(self, loader: Callable[[], V]) -> V:
+        """Get the cached value, calling `loader` to load it if it's missing or has expired."""
+        entry = self._entry
+        if entry is not None:
+            if self._timer() - entry.loaded_at < self.ttl:
+                return entry.value
+            if self.serve_stale:
+                self.metrics.stale_hits += 1
+                self._refresh_in_background(loader)
+                return entry.value
+
+        with self._lock:
+            current = self._entry
+            if current is not None and current is not entry:
+                return current.value
+            return self._load(loader)
+
+    def peek(self) -> V | None:
+        """The value currently held, even if it has expired, without loading it."""
+        entry = self._entry
+        return None if entry is None else entry.value
+
+    def clear(self) -> None:
+        """Discard the cached value, so that the next `get` loads it again."""
+        self._entry = None
+
+    def __len__(self) -> int:
+        return 0 if self._entry is None else 1
+
+    def _refresh_in_background(self, loader: Callable[[], V]) -> None:
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(target=self._load_and_release, args=(loader,), name=f"refresh-{self.name}").start()
+        except RuntimeError:
+            self._lock.release()
+            raise
+
+    def _load_and_release(self, loader: Callable[[], V]) -> None:
+        try:
+            self._load(loader)
+        except Exception:
+            logger.exception("Background cache refresh failed", extra={"cache_key": self.name})
+        finally:
+            self._lock.release()
+
+    def _load(self, loader: Callable[[], V]) -> V:
+        started = self._timer()
+        try:
+            value = loader()
+        except Exception:
+            self.metrics.failures += 1
+            raise
+        finished = self._timer()
+
+        self._entry = _Entry(value, finished)
+        self.metrics.refreshes += 1
+        self.metrics.last_refresh_seconds = finished - started
+        self.metrics.total_refresh_seconds += finished - started
+        logger.info(
+            "Cache refreshed",
+            extra={"cache_key": self.name, "refresh_seconds": finished - started, "refreshes": self.metrics.refreshes},
+        )
+        return value
+
+
+@dataclass
+class LookupMetrics:
+    """Counts of the lookups in an `ExpiringLruCache`, and of the entries it has dropped."""
+
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+
+
+@dataclass(frozen=True)
+class _SizedEntry[V]:
+    value: V
+    size: int
+    stored_at: float
+
+
+class ExpiringLruCache[K: Hashable, V]:
+    """Values kept by key for `ttl` seconds each, up to `max_bytes` in all.
+
+    The size of each value is given by `sizer`. When a new value doesn't fit, the least recently used entries are
+    evicted to make room, and a value larger than `max_bytes` on its own isn't kept at all. With a `ttl` or `max_bytes`
+    of zero the cache is disabled: nothing is kept, and lookups aren't counted."""
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        max_bytes: int,
+        *,
+        sizer: Callable[[V], int],
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.metrics = LookupMetrics()
+        self._sizer = sizer
+        self._timer = timer
+        self._entries: OrderedDict[K, _SizedEntry[V]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_bytes > 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def get(self, key: K) -> V | None:
+        """The value kept for the key, or None if there isn't one or it has expired."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._timer() - entry.stored_at >= self.ttl:
+                self._remove(key)
+                self.metrics.expirations += 1
+                entry = None
+            if entry is None:
+                self.metrics.misses += 1
+                logger.debug("Cache miss", extra={"cache_key": self.name})
+                return None
+            self._entries.move_to_end(key)
+            self.metrics.hits += 1
+            logger.debug("Cache hit", extra={"cache_key": self.name})
+            return entry.value
+
+    def put(self, key: K, value: V) -> None:
+        """Keep the value for the key, replacing any value already kept for it."""
+        if not self.enabled:
+            return
+        size = self._sizer(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+            while self._size + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.metrics.evictions += 1
+            self._entries[key] = _SizedEntry(value, size, self._timer())
+            self._size += size
+
+    def clear(self) -> None:
+        """Discard every value kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: K) -> None:
+        self._size -= self._entries.pop(key).size
+
+
 # Global cache manager instance
 _cache_manager = CacheManager()
 
@@ -69,4 +275,7 @@ cache_manager = _cache_manager
 
 # Cache keys constants
 FLASK_APP_CACHE_KEY = "flask_app"
+LAMBDA_ADAPTER_CACHE_KEY = "lambda_adapter"
 CAMPAIGN_CONFIGS_CACHE_KEY = "campaign_configs"
+CONSUMER_MAPPING_CACHE_KEY = "consumer_mapping"
+PERSON_RECORDS_CACHE_KEY = "person_records"
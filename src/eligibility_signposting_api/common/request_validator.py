@@ -8,12 +8,13 @@ from flask.typing import ResponseReturnValue
 
 from eligibility_signposting_api.common.api_error_response import (
     CONSUMER_ID_NOT_PROVIDED_ERROR,
+    INVALID_BATCH_REQUEST_ERROR,
     INVALID_CATEGORY_ERROR,
     INVALID_CONDITION_FORMAT_ERROR,
     INVALID_INCLUDE_ACTIONS_ERROR,
     NHS_NUMBER_ERROR,
 )
-from eligibility_signposting_api.config.constants import CONSUMER_ID, NHS_NUMBER_HEADER
+from eligibility_signposting_api.config.constants import BATCH_MAX_NHS_NUMBERS, CONSUMER_ID, NHS_NUMBER_HEADER
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +89,49 @@ def validate_request_params() -> Callable:
     return decorator
 
 
+def validate_batch_request_params() -> Callable:
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> ResponseReturnValue:  # noqa:ANN002,ANN003
+            consumer_id = request.headers.get(CONSUMER_ID)
+            if not consumer_id:
+                message = "You are not authorised to request"
+                return CONSUMER_ID_NOT_PROVIDED_ERROR.log_and_generate_response(
+                    log_message=message, diagnostics=message
+                )
+
+            if NHS_NUMBER_HEADER in request.headers:
+                message = "You are not authorised to request information for more than one NHS Number"
+                return NHS_NUMBER_ERROR.log_and_generate_response(log_message=message, diagnostics=message)
+
+            query_params = request.args
+            if query_params:
+                is_valid, problem = validate_query_params(query_params)
+                if not is_valid and problem is not None:
+                    return problem
+
+            body = request.get_json(silent=True)
+            nhs_numbers = body.get("nhsNumbers") if isinstance(body, dict) else None
+            if (
+                not isinstance(nhs_numbers, list)
+                or not 0 < len(nhs_numbers) <= BATCH_MAX_NHS_NUMBERS
+                or not all(isinstance(nhs_number, str) and nhs_number for nhs_number in nhs_numbers)
+            ):
+                diagnostics = (
+                    f"The request body should be a JSON object with nhsNumbers, a list of between 1 and "
+                    f"{BATCH_MAX_NHS_NUMBERS} NHS numbers"
+                )
+                return INVALID_BATCH_REQUEST_ERROR.log_and_generate_response(
+                    log_message="Invalid batch request body", diagnostics=diagnostics, location_param="nhsNumbers"
+                )
+
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 def get_include_actions_error_response(include_actions: str) -> ResponseReturnValue:
     diagnostics = f"{include_actions} is not a value that is supported by the API"
     return INVALID_INCLUDE_ACTIONS_ERROR.log_and_generate_response(
@@ -0,0 +1,107 @@
+import io
+import sys
+from collections.abc import Callable, Iterable
+from types import TracebackType
+from typing import Any
+from wsgiref.types import WSGIApplication
+
+# Not part of mangum's public API, so mangum is pinned to an exact version, and a unit test checks they're still there.
+from mangum.adapter import DEFAULT_TEXT_MIME_TYPES, HANDLERS
+from mangum.types import LambdaConfig, LambdaContext, LambdaEvent, LambdaHandler, Response, Scope
+
+
+class WsgiLambdaAdapter:
+    """Runs a WSGI app for AWS Lambda events from API Gateway, function URLs and the like.
+
+    Events and responses are translated by Mangum's handlers, exactly as `Mangum(WsgiToAsgi(app))` would, but the app is
+    called directly in the invoking thread, rather than through an ASGI shim which runs it in an executor thread and
+    waits for it on an event loop. Build it once and reuse it across invocations."""
+
+    def __init__(self, app: WSGIApplication, text_mime_types: Iterable[str] = ()) -> None:
+        self.app = app
+        self.config = LambdaConfig(
+            api_gateway_base_path="/",
+            text_mime_types=[*DEFAULT_TEXT_MIME_TYPES, *text_mime_types],
+            exclude_headers=[],
+        )
+
+    def __call__(self, event: LambdaEvent, context: LambdaContext) -> dict[str, Any]:
+        handler = self.infer(event, context)
+        return handler(self.run(handler.scope, handler.body))
+
+    def infer(self, event: LambdaEvent, context: LambdaContext) -> LambdaHandler:
+        for handler_cls in HANDLERS:
+            if handler_cls.infer(event, context, self.config):
+                return handler_cls(event, context, self.config)
+        msg = "Unable to infer a handler for the event. Is it from a supported source, such as API Gateway?"
+        raise RuntimeError(msg)
+
+    def run(self, scope: Scope, body: bytes) -> Response:
+        """Call the app with the request, and collect its whole response."""
+        started: list[tuple[str, list[tuple[str, str]]]] = []
+        chunks: list[bytes] = []
+
+        def start_response(
+            status: str,
+            headers: list[tuple[str, str]],
+            exc_info: tuple[type[BaseException], BaseException, TracebackType] | tuple[None, None, None] | None = None,
+        ) -> Callable[[bytes], None]:
+            if exc_info and exc_info[1] is not None and started:
+                raise exc_info[1].with_traceback(exc_info[2])
+            started[:] = [(status, headers)]
+            return chunks.append
+
+        app_iter = self.app(build_environ(scope, body), start_response)  # pyright: ignore[reportArgumentType]
+        try:
+            chunks.extend(app_iter)
+        finally:
+            if hasattr(app_iter, "close"):
+                app_iter.close()  # pyright: ignore[reportAttributeAccessIssue]
+
+        [(status, headers)] = started
+        return {
+            "status": int(status.split(" ", 1)[0]),
+            "headers": [[name.lower().encode("ascii"), value.encode("latin1")] for name, value in headers],
+            "body": b"".join(chunks),
+        }
+
+
+def build_environ(scope: Scope, body: bytes) -> dict[str, Any]:
+    """The WSGI environ for an ASGI HTTP scope, following asgiref's `WsgiToAsgi`. The whole body is already here, so the
+    input is marked as terminated for it to be read even without a Content-Length."""
+    script_name = scope.get("root_path", "").encode("utf8").decode("latin1")
+    path_info = scope["path"].encode("utf8").decode("latin1")
+    path_info = path_info.removeprefix(script_name)
+    server_name, server_port = scope.get("server") or ("localhost", 80)
+    environ: dict[str, Any] = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": script_name,
+        "PATH_INFO": path_info,
+        "QUERY_STRING": scope["query_string"].decode("ascii"),
+        "SERVER_NAME": server_name,
+        "SERVER_PORT": str(server_port),
+        "SERVER_PROTOCOL": f"HTTP/{scope['http_version']}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.input_terminated": True,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    if scope.get("client") is not None:
+        environ["REMOTE_ADDR"] = scope["client"][0]
+
+    headers: dict[str, list[str]] = {}
+    for name, value in scope.get("headers", []):
+        key = name.decode("latin1")
+        if key == "content-length":
+            key = "CONTENT_LENGTH"
+        elif key == "content-type":
+            key = "CONTENT_TYPE"
+        else:
+            key = f"HTTP_{key.upper().replace('-', '_')}"
+        headers.setdefault(key, []).append(value.decode("latin1"))
+    environ.update((key, ",".join(values)) for key, values in headers.items())
+    return environ
@@ -1,5 +1,16 @@
 import os
-from typing import Literal
+from typing import Any, Literal, get_args
+
+
+def env_choice(name: str, choices: Any, default: str) -> Any:  # noqa: ANN401
+    """The environment variable's value, which must be one of the `Literal` type's choices, so that a typo fails at
+    import rather than silently meaning something else."""
+    value = os.getenv(name, default)
+    if value not in get_args(choices):
+        msg = f"{name} must be one of {', '.join(get_args(choices))}, not {value!r}"
+        raise ValueError(msg)
+    return value
+
 
 URL_PREFIX = "patient-check"
 RULE_STOP_DEFAULT = False
@@ -9,4 +20,22 @@ ALLOWED_CONDITIONS = Literal["COVID", "FLU", "MMR", "RSV"]
 CONSUMER_MAPPING_FILE_NAME = "consumer_mapping_config.json"
 
 CACHE_TTL_SECONDS = int(os.getenv("CONFIG_CACHE_TTL_SECONDS", "1800"))
+CACHE_SERVE_STALE = os.getenv("CONFIG_CACHE_SERVE_STALE", "false").lower() == "true"
+CAMPAIGN_CONFIG_FETCH_WORKERS = int(os.getenv("CAMPAIGN_CONFIG_FETCH_WORKERS", "8"))
+SECRET_CACHE_TTL_SECONDS = int(os.getenv("SECRET_CACHE_TTL_SECONDS", "300"))
+SECRET_MIN_REFRESH_SECONDS = int(os.getenv("SECRET_MIN_REFRESH_SECONDS", "30"))
+HashRotationState = Literal["unknown", "rotating", "complete"]
+HASH_ROTATION_STATE: HashRotationState = env_choice("HASH_ROTATION_STATE", HashRotationState, "unknown")
+BATCH_MAX_NHS_NUMBERS = int(os.getenv("BATCH_MAX_NHS_NUMBERS", "100"))
+PERSON_BATCH_FETCH_WORKERS = int(os.getenv("PERSON_BATCH_FETCH_WORKERS", "16"))
+PERSON_CACHE_TTL_SECONDS = int(os.getenv("PERSON_CACHE_TTL_SECONDS", "0"))
+PERSON_CACHE_MAX_BYTES = int(os.getenv("PERSON_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+AUDIT_BATCH_MAX_RECORDS = int(os.getenv("AUDIT_BATCH_MAX_RECORDS", "500"))
+AUDIT_BATCH_MAX_BYTES = int(os.getenv("AUDIT_BATCH_MAX_BYTES", str(4 * 1024 * 1024)))
+AUDIT_FLUSH_INTERVAL_SECONDS = float(os.getenv("AUDIT_FLUSH_INTERVAL_SECONDS", "1"))
+AUDIT_PUT_ATTEMPTS = int(os.getenv("AUDIT_PUT_ATTEMPTS", "3"))
+AUDIT_MAX_BUFFERED_RECORDS = int(os.getenv("AUDIT_MAX_BUFFERED_RECORDS", "10000"))
+AuditAggregation = Literal["none", "lines", "gzip"]
+AUDIT_AGGREGATION: AuditAggregation = env_choice("AUDIT_AGGREGATION", AuditAggregation, "none")
+AUDIT_AGGREGATE_MAX_BYTES = int(os.getenv("AUDIT_AGGREGATE_MAX_BYTES", str(512 * 1024)))
 STATUS_TEXT_OVERRIDE_ACTION_TYPE = "norender_StatusTextOverride"
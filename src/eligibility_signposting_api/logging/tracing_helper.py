@@ -19,3 +19,22 @@ def tracing_setup() -> Callable:
         return wrapper
 
     return decorator
+
+
+def in_current_trace[**P, R](function: Callable[P, R]) -> Callable[P, R]:
+    """Wrap a function to be called in another thread, such as an executor's, so that it runs in this thread's X-Ray
+    trace entity. X-Ray keeps the entity in a thread local, so without it the subsegments recorded there, such as for
+    patched boto3 calls, would have no segment to join and be dropped from the trace."""
+    trace_entity = xray_recorder.get_trace_entity()
+
+    @wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if trace_entity is None:
+            return function(*args, **kwargs)
+        xray_recorder.set_trace_entity(trace_entity)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            xray_recorder.clear_trace_entities()
+
+    return wrapper
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import typing
+from bisect import bisect_right
 from collections import Counter
 from datetime import date, datetime, time
 from enum import StrEnum
@@ -32,6 +33,8 @@ from eligibility_signposting_api.config.constants import ALLOWED_CONDITIONS, RUL
 if typing.TYPE_CHECKING:  # pragma: no cover
     from pydantic import SerializationInfo
 
+    from eligibility_signposting_api.services.operators.operators import Operator
+
 
 CampaignName = NewType("CampaignName", str)
 CampaignVersion = NewType("CampaignVersion", int)
@@ -172,10 +175,19 @@ class IterationRule(BaseModel):
         return v
 
     _parent: Iteration | None = PrivateAttr(default=None)
+    _matcher: Operator | None = PrivateAttr(default=None)
 
     def set_parent(self, parent: Iteration) -> None:
         self._parent = parent
 
+    def set_matcher(self, matcher: Operator) -> None:
+        self._matcher = matcher
+
+    @property
+    def matcher(self) -> Operator | None:
+        """The compiled operator for this rule, if one has been built. See `RuleCalculator.get_matcher`."""
+        return self._matcher
+
     @property
     def rule_code(self) -> str:
         """
@@ -186,11 +198,8 @@ class IterationRule(BaseModel):
 
         If no match is found, rule code is returned if it exists, otherwise the rule name is returned.
         """
-        rule_code = None
-        if self._parent and self._parent.rules_mapper:
-            for rule_entry in self._parent.rules_mapper.values():
-                if rule_entry and self.name in rule_entry.rule_names:
-                    rule_code = rule_entry.rule_code
+        rule_entry = self._parent.rule_entry_for(self.name) if self._parent else None
+        rule_code = rule_entry.rule_code if rule_entry else None
         return rule_code or self.code or self.name
 
     @property
@@ -203,11 +212,8 @@ class IterationRule(BaseModel):
 
         If no match is found, the rule description is returned.
         """
-        rule_text = None
-        if self._parent and self._parent.rules_mapper:
-            for rule_entry in self._parent.rules_mapper.values():
-                if rule_entry and self.name in rule_entry.rule_names:
-                    rule_text = rule_entry.rule_text
+        rule_entry = self._parent.rule_entry_for(self.name) if self._parent else None
+        rule_text = rule_entry.rule_text if rule_entry else None
         return rule_text or self.description
 
     @cached_property
@@ -290,12 +296,28 @@ class Iteration(BaseModel):
 
     model_config = {"populate_by_name": True, "arbitrary_types_allowed": True, "extra": "ignore"}
 
+    _rule_entries_by_name: dict[RuleName, RuleEntry] = PrivateAttr(default_factory=dict)
+
     @model_validator(mode="after")
     def _link_parent_to_iteration_rules(self) -> typing.Self:
         for iteration in self.iteration_rules:
             iteration.set_parent(self)
         return self
 
+    @model_validator(mode="after")
+    def _index_rules_mapper_by_rule_name(self) -> typing.Self:
+        # Where a rule name is in more than one entry, the last entry wins.
+        self._rule_entries_by_name = {
+            rule_name: rule_entry
+            for rule_entry in (self.rules_mapper.values() if self.rules_mapper else [])
+            for rule_name in rule_entry.rule_names
+        }
+        return self
+
+    def rule_entry_for(self, rule_name: RuleName) -> RuleEntry | None:
+        """The rules_mapper entry for the named rule, if there is one, from an index built when validated."""
+        return self._rule_entries_by_name.get(rule_name)
+
     @field_validator("iteration_date", mode="before")
     @classmethod
     def parse_dates_as_uk_local(cls, v: str | date) -> date:
@@ -341,6 +363,33 @@ class Iteration(BaseModel):
         return json.dumps(self.model_dump(by_alias=True), indent=2)
 
 
+class IterationSchedule:
+    """A campaign's iterations in order of iteration datetime, so that the iteration current at a given time is found
+    by bisecting. The last one found is remembered until the next iteration starts."""
+
+    def __init__(self, iterations: list[Iteration]) -> None:
+        self.iterations = sorted(iterations, key=attrgetter("iteration_datetime"))
+        self.iteration_datetimes = [iteration.iteration_datetime for iteration in self.iterations]
+        self._current: tuple[datetime | None, datetime | None, Iteration | None] | None = None
+
+    def current_at(self, at: datetime) -> Iteration | None:
+        """The latest iteration to have started by the given time, if any has."""
+        current = self._current
+        if current is None or not self._is_within(at, current[0], current[1]):
+            index = bisect_right(self.iteration_datetimes, at)
+            current = (
+                self.iteration_datetimes[index - 1] if index else None,
+                self.iteration_datetimes[index] if index < len(self.iteration_datetimes) else None,
+                self.iterations[index - 1] if index else None,
+            )
+            self._current = current
+        return current[2]
+
+    @staticmethod
+    def _is_within(at: datetime, valid_from: datetime | None, valid_until: datetime | None) -> bool:
+        return (valid_from is None or valid_from <= at) and (valid_until is None or at < valid_until)
+
+
 class CampaignConfig(BaseModel):
     id: CampaignID = Field(..., alias="ID")
     version: CampaignVersion = Field(..., alias="Version")
@@ -421,14 +470,20 @@ class CampaignConfig(BaseModel):
 
         return self
 
-    @cached_property
+    @property
     def campaign_live(self) -> bool:
         return self.start_date <= now_uk().date() <= self.end_date
 
     @cached_property
+    def iteration_schedule(self) -> IterationSchedule:
+        return IterationSchedule(self.iterations)
+
+    @property
     def current_iteration(self) -> Iteration:
-        iterations_by_date_descending = sorted(self.iterations, key=attrgetter("iteration_datetime"), reverse=True)
-        return next(i for i in iterations_by_date_descending if i.iteration_datetime <= now_uk())
+        iteration = self.iteration_schedule.current_at(now_uk())
+        if iteration is None:
+            raise StopIteration
+        return iteration
 
     def __str__(self) -> str:
         return json.dumps(self.model_dump(by_alias=True), indent=2)
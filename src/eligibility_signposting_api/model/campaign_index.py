@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from eligibility_signposting_api.model.campaign_config import CampaignConfig, CampaignID
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+CATEGORY_TYPES: dict[str, frozenset[str]] = {
+    "ALL": frozenset({"V", "S"}),
+    "VACCINATIONS": frozenset({"V"}),
+    "SCREENING": frozenset({"S"}),
+}
+
+
+class CampaignIndex(Collection[CampaignConfig]):
+    """Campaign configs, indexed by type and target when they are loaded so that selecting the campaigns for a request
+    doesn't need to filter, sort and group them all again.
+
+    Campaigns for the same target with an iteration at the same datetime are found here too, as they make the latest
+    iteration for that target ambiguous whenever both are current. Restricting the index to the campaigns a consumer
+    is permitted to see gives another index, which is kept so it's only built once per set of campaigns."""
+
+    def __init__(self, campaign_configs: Iterable[CampaignConfig]) -> None:
+        self._campaign_configs = list(campaign_configs)
+        by_type_and_target: dict[tuple[str, str], list[CampaignConfig]] = defaultdict(list)
+        for campaign_config in self._campaign_configs:
+            by_type_and_target[(campaign_config.type, campaign_config.target)].append(campaign_config)
+        self._by_type_and_target = dict(by_type_and_target)
+        self._targets = sorted({campaign_config.target for campaign_config in self._campaign_configs})
+        self._shared_iteration_datetimes = self._find_shared_iteration_datetimes(self._campaign_configs)
+        self._restricted: dict[frozenset[CampaignID], CampaignIndex] = {}
+
+    def __iter__(self) -> Iterator[CampaignConfig]:
+        return iter(self._campaign_configs)
+
+    def __len__(self) -> int:
+        return len(self._campaign_configs)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._campaign_configs
+
+    def restricted_to(self, campaign_ids: Collection[CampaignID]) -> CampaignIndex:
+        """The index of only those campaigns with the given IDs."""
+        key = frozenset(campaign_ids)
+        if (restricted := self._restricted.get(key)) is None:
+            restricted = CampaignIndex(cc for cc in self._campaign_configs if cc.id in key)
+            self._restricted[key] = restricted
+        return restricted
+
+    def campaigns_by_target(
+        self, category: str, conditions: Collection[str]
+    ) -> Iterator[tuple[str, list[CampaignConfig]]]:
+        """The campaigns of the types in the category for each target in the conditions (or every target, if the
+        conditions include "ALL"), in order of target."""
+        allowed_types = CATEGORY_TYPES.get(category, frozenset())
+        all_conditions = "ALL" in conditions
+        for target in self._targets:
+            if not all_conditions and target not in conditions:
+                continue
+            campaigns = [
+                campaign_config
+                for campaign_type in sorted(allowed_types)
+                for campaign_config in self._by_type_and_target.get((campaign_type, target), [])
+            ]
+            if campaigns:
+                yield target, campaigns
+
+    def campaigns_sharing_iteration_datetime(self, target: str, iteration_datetime: datetime) -> list[CampaignConfig]:
+        """The campaigns for the target which have more than one campaign with an iteration at the datetime."""
+        return self._shared_iteration_datetimes.get((target, iteration_datetime), [])
+
+    @staticmethod
+    def _find_shared_iteration_datetimes(
+        campaign_configs: list[CampaignConfig],
+    ) -> dict[tuple[str, datetime], list[CampaignConfig]]:
+        by_target_and_datetime: dict[tuple[str, datetime], list[CampaignConfig]] = defaultdict(list)
+        for campaign_config in campaign_configs:
+            for iteration_datetime in {iteration.iteration_datetime for iteration in campaign_config.iterations}:
+                by_target_and_datetime[(campaign_config.target, iteration_datetime)].append(campaign_config)
+
+        shared = {key: campaigns for key, campaigns in by_target_and_datetime.items() if len(campaigns) > 1}
+        for (target, iteration_datetime), campaigns in shared.items():
+            logger.warning(
+                "Campaigns %s for target %s all have an iteration at '%s'",
+                [cc.id for cc in campaigns],
+                target,
+                iteration_datetime,
+            )
+        return shared
@@ -15,3 +15,9 @@ class ConsumerCampaign(BaseModel):
 class ConsumerMapping(RootModel[dict[ConsumerId, list[ConsumerCampaign]]]):
     def get(self, key: ConsumerId, default: list[ConsumerCampaign] | None = None) -> list[ConsumerCampaign] | None:
         return self.root.get(key, default)
+
+    def campaign_ids_by_consumer(self) -> dict[ConsumerId, frozenset[CampaignID]]:
+        return {
+            consumer_id: frozenset(campaign.campaign_config_id for campaign in campaigns)
+            for consumer_id, campaigns in self.root.items()
+        }
@@ -1,7 +1,84 @@
-from dataclasses import dataclass
+from collections.abc import KeysView
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field
+from heapq import merge
 from typing import Any
 
 
 @dataclass
 class Person:
+    """The rows held about a person, as read from the person table.
+
+    Rows are indexed by ATTRIBUTE_TYPE (PERSON, COHORTS, COVID, RSV...) when the person is built, so finding a row is
+    a dict lookup rather than a scan of `data` for every rule and token. Rows appended to `data` afterwards are indexed
+    on the next lookup.
+
+    `data` is never changed while evaluating the person. Cohorts they're added to during an evaluation, such as virtual
+    cohorts, are held apart from it, so the same rows can be shared by any number of people being evaluated - from a
+    cache, or across conditions evaluated in parallel - each built with `Person(data)`."""
+
     data: list[dict[str, Any]]
+
+    _positions_by_type: dict[str, list[int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _indexed_rows: int = field(default=0, init=False, repr=False, compare=False)
+    _cohort_labels: set[str] | None = field(default=None, init=False, repr=False, compare=False)
+    _added_cohort_labels: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._index_new_rows()
+
+    def _index_new_rows(self) -> None:
+        for position in range(self._indexed_rows, len(self.data)):
+            attribute_type = self.data[position].get("ATTRIBUTE_TYPE")
+            if attribute_type is not None:
+                self._positions_by_type.setdefault(attribute_type, []).append(position)
+        self._indexed_rows = len(self.data)
+
+    def _positions(self, attribute_type: str | None) -> list[int]:
+        if self._indexed_rows != len(self.data):
+            self._index_new_rows()
+        return self._positions_by_type.get(attribute_type, []) if attribute_type is not None else []
+
+    def get_row(self, attribute_type: str | None) -> dict[str, Any] | None:
+        """The first row with the given ATTRIBUTE_TYPE, or None if the person has no such row."""
+        positions = self._positions(attribute_type)
+        return self.data[positions[0]] if positions else None
+
+    def get_rows(self, *attribute_types: str) -> list[dict[str, Any]]:
+        """All rows with any of the given ATTRIBUTE_TYPEs, in the order they appear in `data`."""
+        positions = merge(*(self._positions(attribute_type) for attribute_type in set(attribute_types)))
+        return [self.data[position] for position in positions]
+
+    @property
+    def attribute_types(self) -> KeysView[str]:
+        """The ATTRIBUTE_TYPEs present in this person's data."""
+        if self._indexed_rows != len(self.data):
+            self._index_new_rows()
+        return self._positions_by_type.keys()
+
+    @property
+    def cohort_labels(self) -> AbstractSet[str]:
+        """The labels of the cohorts this person is a member of, read from the COHORTS row the first time they're
+        needed, along with any added with `add_cohort_membership`."""
+        if self._cohort_labels is None:
+            cohorts_row = self.get_row("COHORTS") or {}
+            self._cohort_labels = {
+                membership["COHORT_LABEL"]
+                for membership in cohorts_row.get("COHORT_MEMBERSHIPS", [])
+                if membership.get("COHORT_LABEL")
+            } | self._added_cohort_labels
+        return self._cohort_labels
+
+    @property
+    def has_cohorts(self) -> bool:
+        """Whether the person has a COHORTS row, or has been added to a cohort."""
+        return bool(self._added_cohort_labels) or self.get_row("COHORTS") is not None
+
+    def add_cohort_membership(self, cohort_label: str) -> None:
+        """Record membership of a cohort which isn't held in the person's data, such as a virtual cohort, for the rest
+        of this person's evaluation. Their data is left as it is."""
+        if not cohort_label:
+            return
+        self._added_cohort_labels.add(cohort_label)
+        if self._cohort_labels is not None:
+            self._cohort_labels.add(cohort_label)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Hashable, Iterable, Sequence
+from collections.abc import Set as AbstractSet
+from typing import Any, overload
+
+from eligibility_signposting_api.model.person import Person
+
+Mask = int
+"""A set of people in a population, as a bitset of their positions in it."""
+
+
+def _mask(positions: list[int]) -> Mask:
+    """The mask of the people at the positions, which are in order. It's built in one go, as setting each bit of an
+    int in turn copies the whole int each time."""
+    bits = bytearray((positions[-1] >> 3) + 1)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _value_key(value: Any) -> Hashable:  # noqa: ANN401
+    # Values are told apart by type as well as value, so that True, 1 and Decimal(1) aren't merged into one.
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), json.dumps(value, sort_keys=True, default=str)
+    return type(value), value
+
+
+class Population(Sequence[Person]):
+    """People held column-wise, for evaluating rules across all of them at once.
+
+    Each distinct value of an attribute is mapped to a mask of the people holding it, so an operator need only be
+    tested once per distinct value - there are far fewer dates of birth or postcodes than people - and the results
+    combine with bitwise operators. Columns are built the first time they are asked for."""
+
+    def __init__(self, people: Iterable[Person]) -> None:
+        self._people = list(people)
+        self.everyone: Mask = (1 << len(self._people)) - 1
+        self._columns: dict[tuple[str, str], list[tuple[Any, Mask]]] = {}
+        self._cohort_label_sets: dict[frozenset[str] | None, Mask] | None = None
+        self._cohort_members: dict[str, Mask] | None = None
+
+    @overload
+    def __getitem__(self, index: int) -> Person: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Person]: ...
+
+    def __getitem__(self, index: int | slice) -> Person | Sequence[Person]:
+        return self._people[index]
+
+    def __len__(self) -> int:
+        return len(self._people)
+
+    def attribute_values(self, attribute_type: str, attribute_name: str) -> list[tuple[Any, Mask]]:
+        """Each distinct value of the attribute in the rows of the given ATTRIBUTE_TYPE, with the people holding it.
+        People without such a row hold None."""
+        key = (attribute_type, attribute_name)
+        if (column := self._columns.get(key)) is None:
+            by_value: dict[Hashable, tuple[Any, list[int]]] = {}
+            for position, person in enumerate(self._people):
+                row = person.get_row(attribute_type)
+                value = row.get(attribute_name) if row else None
+                by_value.setdefault(_value_key(value), (value, []))[1].append(position)
+            column = [(value, _mask(value_positions)) for value, value_positions in by_value.values()]
+            self._columns[key] = column
+        return column
+
+    def cohort_label_sets(
+        self, added_labels: AbstractSet[str] = frozenset()
+    ) -> list[tuple[AbstractSet[str] | None, Mask]]:
+        """Each distinct set of cohort labels people have, with the people who have it, as `Person.cohort_labels`
+        would give after `add_cohort_membership` had been called for each of the added labels. People without a
+        COHORTS row have None, unless labels have been added."""
+        if self._cohort_label_sets is None:
+            label_sets: dict[frozenset[str] | None, list[int]] = {}
+            for position, person in enumerate(self._people):
+                labels = frozenset(person.cohort_labels) if person.has_cohorts else None
+                label_sets.setdefault(labels, []).append(position)
+            self._cohort_label_sets = {labels: _mask(label_positions) for labels, label_positions in label_sets.items()}
+
+        if not added_labels:
+            return list(self._cohort_label_sets.items())
+        with_added: dict[frozenset[str], Mask] = {}
+        for labels, mask in self._cohort_label_sets.items():
+            all_labels = (labels or frozenset()) | added_labels
+            with_added[all_labels] = with_added.get(all_labels, 0) | mask
+        return list(with_added.items())
+
+    def cohort_members(self, cohort_label: str) -> Mask:
+        """The people who are members of the cohort according to their data."""
+        if self._cohort_members is None:
+            members: dict[str, Mask] = {}
+            for labels, mask in self.cohort_label_sets():
+                for label in labels or ():
+                    members[label] = members.get(label, 0) | mask
+            self._cohort_members = members
+        return self._cohort_members.get(cohort_label, 0)
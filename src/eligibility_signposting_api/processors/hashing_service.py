@@ -1,5 +1,6 @@
 import hashlib
 import hmac
+from functools import lru_cache
 from typing import Annotated, NewType
 
 from wireup import Inject, service
@@ -9,17 +10,21 @@ from eligibility_signposting_api.repos.secret_repo import SecretRepo
 HashSecretName = NewType("HashSecretName", str)
 
 
+@lru_cache(maxsize=8)
+def _hmac_key(secret_value: str) -> hmac.HMAC:
+    """An HMAC already keyed with the secret, to be copied for each hash rather than keyed again every time."""
+    return hmac.new(secret_value.encode("utf-8"), digestmod=hashlib.sha512)
+
+
 def _hash(nhs_number: str, secret_value: str | None) -> str | None:
     if not secret_value:
         return None
 
     nhs_str = str(nhs_number)
 
-    return hmac.new(
-        secret_value.encode("utf-8"),
-        nhs_str.encode("utf-8"),
-        hashlib.sha512,
-    ).hexdigest()
+    keyed = _hmac_key(secret_value).copy()
+    keyed.update(nhs_str.encode("utf-8"))
+    return keyed.hexdigest()
 
 
 @service
@@ -40,3 +45,13 @@ class HashingService:
     def hash_with_previous_secret(self, nhs_number: str) -> str | None:
         secret_value = self.secret_repo.get_secret_previous(self.hash_secret_name).get("AWSPREVIOUS")
         return _hash(nhs_number, secret_value)
+
+    def refresh_secrets(self) -> bool:
+        """Reload the hashing secrets ahead of their TTL, returning whether either has been rotated since it was last
+        loaded."""
+        rotated = False
+        for stage in ("AWSCURRENT", "AWSPREVIOUS"):
+            before = self.secret_repo.get_secret(self.hash_secret_name, stage)
+            after = self.secret_repo.get_secret(self.hash_secret_name, stage, force_refresh=True)
+            rotated = rotated or (after.version_id, after.value) != (before.version_id, before.value)
+        return rotated
@@ -1,28 +1,65 @@
 import json
 import logging
+import threading
 from collections.abc import Generator
-from typing import Annotated, NewType
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Annotated, Any, NewType
 
 from aws_xray_sdk.core import xray_recorder
 from botocore.client import BaseClient
-from cachetools import TTLCache
 from wireup import Inject, service
 
-from eligibility_signposting_api.config.constants import CACHE_TTL_SECONDS
+from eligibility_signposting_api.common.cache_manager import CAMPAIGN_CONFIGS_CACHE_KEY, RefreshingCache
+from eligibility_signposting_api.config.constants import (
+    CACHE_SERVE_STALE,
+    CACHE_TTL_SECONDS,
+    CAMPAIGN_CONFIG_FETCH_WORKERS,
+)
+from eligibility_signposting_api.logging.tracing_helper import in_current_trace
 from eligibility_signposting_api.model.campaign_config import CampaignConfig, Rules
+from eligibility_signposting_api.model.campaign_index import CampaignIndex
 
 BucketName = NewType("BucketName", str)
 
 logger = logging.getLogger(__name__)
 
-campaign_config_cache: TTLCache[str, list[CampaignConfig]] = TTLCache(maxsize=1, ttl=CACHE_TTL_SECONDS)
+campaign_config_cache: RefreshingCache[CampaignIndex] = RefreshingCache(
+    CAMPAIGN_CONFIGS_CACHE_KEY, ttl=CACHE_TTL_SECONDS, serve_stale=CACHE_SERVE_STALE
+)
+
+
+@dataclass(frozen=True)
+class CampaignObject:
+    """A campaign config as loaded from an S3 object, along with the version of the object it was loaded from."""
+
+    etag: str | None
+    last_modified: datetime | None
+    campaign_config: CampaignConfig
+
+    def is_current(self, listed_object: dict[str, Any]) -> bool:
+        """Whether the object listed in S3 is the one this config was loaded from. Objects listed without an ETag are
+        never considered current."""
+        return (
+            self.etag is not None
+            and self.etag == listed_object.get("ETag")
+            and self.last_modified == listed_object.get("LastModified")
+        )
+
+
+campaign_object_cache: dict[str, CampaignObject] = {}
+# Configs may be loaded by several threads at once, such as those bypassing the cache for test consumers.
+campaign_object_cache_lock = threading.Lock()
 
 
 @service
 class CampaignRepo:
     """Repository class for Campaign Rules, which we can use to calculate a person's eligibility for vaccination.
 
-    These rules are stored as JSON files in AWS S3."""
+    These rules are stored as JSON files in AWS S3, and are indexed once loaded (see `CampaignIndex`). When refreshing,
+    only objects whose ETag or LastModified have changed since they were last loaded are downloaded and validated again,
+    and those are fetched concurrently."""
 
     def __init__(
         self,
@@ -34,42 +71,76 @@ class CampaignRepo:
         self.bucket_name = bucket_name
 
     def get_campaign_configs(self, consumer_id: str) -> Generator[CampaignConfig]:
+        yield from self.get_campaign_index(consumer_id)
+
+    def get_campaign_index(self, consumer_id: str) -> CampaignIndex:
         bypass = "test-" in consumer_id
-        cache_key = "all_campaigns"
-        cached = None if bypass else campaign_config_cache.get(cache_key)
 
         with xray_recorder.in_subsegment("CampaignRepo.get_campaign_configs"):
-            if cached is not None:
-                logger.info("Using cached campaign configs")
-                yield from cached
-                return
-
-            logger.info(
-                "Refreshing campaign configs from S3 (consumer_id=%s, ttl_seconds=%s)",
-                consumer_id,
-                CACHE_TTL_SECONDS,
-            )
-            configs = self._load_campaign_configs_from_s3()
+            if bypass:
+                logger.info("Loading campaign configs from S3 without cache (consumer_id=%s)", consumer_id)
+                return self._load_campaign_index_from_s3()
 
-            if not bypass:
-                campaign_config_cache[cache_key] = configs
+            return campaign_config_cache.get(self._load_campaign_index_from_s3)
 
-            yield from configs
+    def _load_campaign_index_from_s3(self) -> CampaignIndex:
+        return CampaignIndex(self._load_campaign_configs_from_s3())
 
     def _load_campaign_configs_from_s3(self) -> list[CampaignConfig]:
-        campaign_configs: list[CampaignConfig] = []
-
+        logger.info("Refreshing campaign configs from S3 (ttl_seconds=%s)", CACHE_TTL_SECONDS)
         with xray_recorder.in_subsegment("CampaignRepo.load_campaign_configs_from_s3"):
             with xray_recorder.in_subsegment("list_objects"):
-                campaign_objects = self.s3_client.list_objects(Bucket=self.bucket_name)
+                listed_objects = self._list_campaign_objects()
+
+            with campaign_object_cache_lock:
+                cached_objects = dict(campaign_object_cache)
+            unchanged = {
+                listed_object["Key"]: cached
+                for listed_object in listed_objects
+                if (cached := cached_objects.get(listed_object["Key"])) and cached.is_current(listed_object)
+            }
+            changed = [listed_object for listed_object in listed_objects if listed_object["Key"] not in unchanged]
 
             with xray_recorder.in_subsegment("get_objects"):
-                for campaign_object in campaign_objects.get("Contents"):
-                    response = self.s3_client.get_object(
-                        Bucket=self.bucket_name,
-                        Key=f"{campaign_object['Key']}",
-                    )
-                    body = response["Body"].read()
-                    campaign_configs.append(Rules.model_validate(json.loads(body)).campaign_config)
-
-        return campaign_configs
+                if changed:
+                    with ThreadPoolExecutor(max_workers=min(CAMPAIGN_CONFIG_FETCH_WORKERS, len(changed))) as executor:
+                        fetched = dict(
+                            zip(
+                                map(self._key, changed),
+                                executor.map(in_current_trace(self._fetch), changed),
+                                strict=True,
+                            )
+                        )
+                else:
+                    fetched = {}
+
+        logger.info("Loaded %d changed campaign configs, reused %d unchanged", len(fetched), len(unchanged))
+        campaign_objects = unchanged | fetched
+        with campaign_object_cache_lock:
+            campaign_object_cache.clear()
+            campaign_object_cache.update(campaign_objects)
+        return [campaign_objects[self._key(listed_object)].campaign_config for listed_object in listed_objects]
+
+    def _list_campaign_objects(self) -> list[dict[str, Any]]:
+        listed_objects: list[dict[str, Any]] = []
+        kwargs: dict[str, str] = {}
+        while True:
+            response = self.s3_client.list_objects(Bucket=self.bucket_name, **kwargs)
+            page = response.get("Contents", [])
+            listed_objects.extend(page)
+            if not response.get("IsTruncated") or not page:
+                return listed_objects
+            kwargs["Marker"] = response.get("NextMarker") or page[-1]["Key"]
+
+    def _fetch(self, listed_object: dict[str, Any]) -> CampaignObject:
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=self._key(listed_object))
+        body = response["Body"].read()
+        return CampaignObject(
+            etag=listed_object.get("ETag"),
+            last_modified=listed_object.get("LastModified"),
+            campaign_config=Rules.model_validate(json.loads(body)).campaign_config,
+        )
+
+    @staticmethod
+    def _key(listed_object: dict[str, Any]) -> str:
+        return f"{listed_object['Key']}"
@@ -1,5 +1,6 @@
 import json
 import logging
+from dataclasses import dataclass, field
 from typing import Annotated, NewType
 
 from aws_xray_sdk.core import xray_recorder
@@ -7,7 +8,12 @@ from botocore.client import BaseClient
 from botocore.exceptions import ClientError
 from wireup import Inject, service
 
-from eligibility_signposting_api.config.constants import CONSUMER_MAPPING_FILE_NAME
+from eligibility_signposting_api.common.cache_manager import CONSUMER_MAPPING_CACHE_KEY, RefreshingCache
+from eligibility_signposting_api.config.constants import (
+    CACHE_SERVE_STALE,
+    CACHE_TTL_SECONDS,
+    CONSUMER_MAPPING_FILE_NAME,
+)
 from eligibility_signposting_api.model.campaign_config import CampaignID
 from eligibility_signposting_api.model.consumer_mapping import ConsumerId, ConsumerMapping
 
@@ -15,10 +21,28 @@ logger = logging.getLogger(__name__)
 
 BucketName = NewType("BucketName", str)
 
+NOT_MODIFIED_ERROR_CODES = {"304", "NotModified"}
+
+
+@dataclass(frozen=True)
+class PermittedCampaigns:
+    """The campaigns each consumer may see, as read from the consumer mapping file with the given ETag."""
+
+    etag: str | None = None
+    by_consumer: dict[ConsumerId, frozenset[CampaignID]] = field(default_factory=dict)
+
+
+consumer_mapping_cache: RefreshingCache[PermittedCampaigns] = RefreshingCache(
+    CONSUMER_MAPPING_CACHE_KEY, ttl=CACHE_TTL_SECONDS, serve_stale=CACHE_SERVE_STALE
+)
+
 
 @service
 class ConsumerMappingRepo:
-    """Repository class for Consumer Mapping"""
+    """Repository class for Consumer Mapping
+
+    The mapping file is cached for CACHE_TTL_SECONDS. Once that expires it is only downloaded and validated again if
+    its ETag has changed."""
 
     def __init__(
         self,
@@ -30,20 +54,29 @@ class ConsumerMappingRepo:
         self.bucket_name = bucket_name
 
     @xray_recorder.capture("ConsumerMappingRepo.get_permitted_campaign_ids")  # pyright: ignore[reportCallIssue]
-    def get_permitted_campaign_ids(self, consumer_id: ConsumerId) -> list[CampaignID] | None:
-        try:
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=CONSUMER_MAPPING_FILE_NAME)
-            body = response["Body"].read()
-
-            mapping_result = ConsumerMapping.model_validate(json.loads(body)).get(consumer_id)
-
-            if mapping_result is None:
-                return None
-
-            return [item.campaign_config_id for item in mapping_result]
+    def get_permitted_campaign_ids(self, consumer_id: ConsumerId) -> frozenset[CampaignID] | None:
+        if "test-" in consumer_id:
+            permitted_campaigns = self._load_consumer_mapping(previous=None)
+        else:
+            permitted_campaigns = consumer_mapping_cache.get(
+                lambda: self._load_consumer_mapping(previous=consumer_mapping_cache.peek())
+            )
+        return permitted_campaigns.by_consumer.get(consumer_id)
 
+    def _load_consumer_mapping(self, previous: PermittedCampaigns | None) -> PermittedCampaigns:
+        conditions = {"IfNoneMatch": previous.etag} if previous is not None and previous.etag else {}
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=CONSUMER_MAPPING_FILE_NAME, **conditions)
         except ClientError as e:
-            if e.response["Error"]["Code"] == "NoSuchKey":
-                return None
+            error_code = e.response["Error"]["Code"]
+            if previous is not None and error_code in NOT_MODIFIED_ERROR_CODES:
+                logger.info("Consumer mapping config file unchanged : %s", CONSUMER_MAPPING_FILE_NAME)
+                return previous
+            if error_code == "NoSuchKey":
+                return PermittedCampaigns()
             logger.exception("Error while reading consumer mapping config file : %s", CONSUMER_MAPPING_FILE_NAME)
             raise
+
+        body = response["Body"].read()
+        consumer_mapping = ConsumerMapping.model_validate(json.loads(body))
+        return PermittedCampaigns(etag=response.get("ETag"), by_consumer=consumer_mapping.campaign_ids_by_consumer())
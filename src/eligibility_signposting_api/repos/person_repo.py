@@ -1,4 +1,8 @@
+import json
 import logging
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Annotated, Any, NewType
 
 from aws_xray_sdk.core import xray_recorder
@@ -6,6 +10,14 @@ from boto3.dynamodb.conditions import Key
 from boto3.resources.base import ServiceResource
 from wireup import Inject, service
 
+from eligibility_signposting_api.common.cache_manager import PERSON_RECORDS_CACHE_KEY, ExpiringLruCache
+from eligibility_signposting_api.config.constants import (
+    HASH_ROTATION_STATE,
+    PERSON_BATCH_FETCH_WORKERS,
+    PERSON_CACHE_MAX_BYTES,
+    PERSON_CACHE_TTL_SECONDS,
+)
+from eligibility_signposting_api.logging.tracing_helper import in_current_trace
 from eligibility_signposting_api.model.eligibility_status import NHSNumber
 from eligibility_signposting_api.model.person import Person
 from eligibility_signposting_api.processors.hashing_service import HashingService
@@ -15,6 +27,18 @@ logger = logging.getLogger(__name__)
 
 TableName = NewType("TableName", str)
 
+lookup_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="person-lookup")
+
+
+def approximate_size(items: list[dict[str, Any]]) -> int:
+    """Roughly how many bytes the items take up, going by the length of their JSON."""
+    return len(json.dumps(items, default=str))
+
+
+person_record_cache: ExpiringLruCache[str, list[dict[str, Any]]] = ExpiringLruCache(
+    PERSON_RECORDS_CACHE_KEY, ttl=PERSON_CACHE_TTL_SECONDS, max_bytes=PERSON_CACHE_MAX_BYTES, sizer=approximate_size
+)
+
 
 @service(qualifier="person_table")
 def person_table_factory(
@@ -31,7 +55,14 @@ class PersonRepo:
     """Repository class for the data held about a person which may be relevant to calculating their eligibility for
     vaccination.
 
-    This data is held in a handful of records in a single Dynamodb table.
+    This data is held in a handful of records in a single Dynamodb table, keyed by the NHS number hashed with the
+    AWSCURRENT or, during a secret rotation, the AWSPREVIOUS hashing secret. How both are tried depends on
+    HASH_ROTATION_STATE: "rotating" queries both hashes concurrently, "complete" only queries the AWSCURRENT hash, and
+    "unknown" tries the AWSPREVIOUS hash only if the AWSCURRENT one isn't found.
+
+    When PERSON_CACHE_TTL_SECONDS is set, the items found for a person are kept for that long, keyed by the NHS number
+    hashed with the AWSCURRENT secret, so that repeated requests for the same person within a short time don't query
+    the table again. People who aren't found are never kept, and nor is anyone looked up for a "test-" consumer.
     """
 
     def __init__(
@@ -56,10 +87,76 @@ class PersonRepo:
         return None
 
     @xray_recorder.capture("PersonRepo.get_eligibility_data")  # pyright: ignore[reportCallIssue]
-    def get_eligibility_data(self, nhs_number: NHSNumber) -> Person:
+    def get_eligibility_data(self, nhs_number: NHSNumber, consumer_id: str | None = None) -> Person:
+        return self._get_eligibility_data(nhs_number, use_cache=self._use_cache(consumer_id))
+
+    @xray_recorder.capture("PersonRepo.get_eligibility_data_batch")  # pyright: ignore[reportCallIssue]
+    def get_eligibility_data_batch(
+        self, nhs_numbers: Collection[NHSNumber], consumer_id: str | None = None
+    ) -> dict[NHSNumber, Person | None]:
+        """Fetch the data for many people at once, with None for anyone not found.
+
+        A person's records can't be fetched with BatchGetItem without knowing all of their sort keys, so each person is
+        queried for as usual, with the queries run concurrently."""
+        unique_nhs_numbers = list(dict.fromkeys(nhs_numbers))
+        if not unique_nhs_numbers:
+            return {}
+
+        use_cache = self._use_cache(consumer_id)
+        workers = min(PERSON_BATCH_FETCH_WORKERS, len(unique_nhs_numbers))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="person-batch") as executor:
+            get_person = in_current_trace(partial(self._get_eligibility_data_or_none, use_cache=use_cache))
+            people = executor.map(get_person, unique_nhs_numbers)
+            return dict(zip(unique_nhs_numbers, people, strict=True))
+
+    @staticmethod
+    def _use_cache(consumer_id: str | None) -> bool:
+        return person_record_cache.enabled and not (consumer_id and "test-" in consumer_id)
+
+    def _get_eligibility_data_or_none(self, nhs_number: NHSNumber, *, use_cache: bool) -> Person | None:
+        try:
+            return self._get_eligibility_data(nhs_number, use_cache=use_cache)
+        except NotFoundError:
+            return None
+
+    def _get_eligibility_data(self, nhs_number: NHSNumber, *, use_cache: bool = False) -> Person:
+        if use_cache and (cache_key := self._hashing_service.hash_with_current_secret(nhs_number)):
+            cached_items = person_record_cache.get(cache_key)
+            if cached_items is not None:
+                logger.info("Person record found in cache")
+                return Person(data=cached_items)
+
+        items = self._fetch_person_items(nhs_number)
+        logger.info("Person record found")
+
+        # Hashed again, as the secret may have just been rotated
+        if use_cache and (cache_key := self._hashing_service.hash_with_current_secret(nhs_number)):
+            person_record_cache.put(cache_key, items)
+        return Person(data=items)
+
+    def _fetch_person_items(self, nhs_number: NHSNumber) -> Any:
+        try:
+            items = self._find_person_items(nhs_number)
+        except NotFoundError:
+            # The cached hashing secrets may be out of date if the secret has just been rotated
+            if not self._hashing_service.refresh_secrets():
+                raise
+            logger.info("The hashing secret has been rotated, so looking for the person record again")
+            items = self._find_person_items(nhs_number)
+        return items
+
+    def _find_person_items(self, nhs_number: NHSNumber) -> Any:
+        nhs_hashed_with_current = self._hashing_service.hash_with_current_secret(nhs_number)
+        if nhs_hashed_with_current and HASH_ROTATION_STATE == "complete":
+            return self._find_person_items_with_current_hash_only(nhs_hashed_with_current)
+
+        if nhs_hashed_with_current and HASH_ROTATION_STATE == "rotating":
+            nhs_hashed_with_previous = self._hashing_service.hash_with_previous_secret(nhs_number)
+            if nhs_hashed_with_previous:
+                return self._find_person_items_concurrently(nhs_hashed_with_current, nhs_hashed_with_previous)
+
         # Hash using AWSCURRENT secret and fetch items
         items = None
-        nhs_hashed_with_current = self._hashing_service.hash_with_current_secret(nhs_number)
         if nhs_hashed_with_current:
             items = self.get_person_record(nhs_hashed_with_current)
             if not items:
@@ -82,5 +179,26 @@ class PersonRepo:
                     message = "Person not found after checking AWSCURRENT, AWSPREVIOUS, and not hashed NHS numbers."
                     raise NotFoundError(message)
 
-        logger.info("Person record found")
-        return Person(data=items)
+        return items
+
+    def _find_person_items_with_current_hash_only(self, nhs_hashed_with_current: str) -> Any:
+        items = self.get_person_record(nhs_hashed_with_current)
+        if not items:
+            logger.error("The AWSCURRENT secret was tried, but no person record was found")
+            message = "Person not found after checking AWSCURRENT."
+            raise NotFoundError(message)
+        return items
+
+    def _find_person_items_concurrently(self, nhs_hashed_with_current: str, nhs_hashed_with_previous: str) -> Any:
+        current, previous = lookup_executor.map(
+            in_current_trace(self.get_person_record), [nhs_hashed_with_current, nhs_hashed_with_previous]
+        )
+        if current:
+            return current
+        if previous:
+            logger.warning("The AWSCURRENT secret was tried, but no person record was found")
+            return previous
+
+        logger.error("The AWSCURRENT and AWSPREVIOUS secrets were both tried, but no person record was found")
+        message = "Person not found after checking AWSCURRENT and AWSPREVIOUS."
+        raise NotFoundError(message)
@@ -1,4 +1,6 @@
 import logging
+import time
+from dataclasses import dataclass
 from typing import Annotated, NewType
 
 from aws_xray_sdk.core import xray_recorder
@@ -6,33 +8,78 @@ from botocore.client import BaseClient
 from botocore.exceptions import ClientError
 from wireup import Inject, service
 
+from eligibility_signposting_api.config.constants import SECRET_CACHE_TTL_SECONDS, SECRET_MIN_REFRESH_SECONDS
+
 logger = logging.getLogger(__name__)
 
 SecretName = NewType("SecretName", str)
 
 
+@dataclass(frozen=True)
+class CachedSecret:
+    """A secret as read from Secrets Manager at one version stage. A value of None records that it couldn't be read."""
+
+    version_id: str | None
+    value: str | None
+    loaded_at: float
+
+    def age(self) -> float:
+        return time.monotonic() - self.loaded_at
+
+
+secret_cache: dict[tuple[str, str], CachedSecret] = {}
+
+
 @service
 class SecretRepo:
+    """Repository class for secrets held in AWS Secrets Manager.
+
+    Secrets are cached for SECRET_CACHE_TTL_SECONDS, so that Secrets Manager is not called on every request. A refresh
+    can be forced, for instance when a secret may have been rotated, but at most once every SECRET_MIN_REFRESH_SECONDS.
+    If a refresh fails, the value already held keeps being used. A failure to read a secret with no value held yet is
+    only cached for SECRET_MIN_REFRESH_SECONDS, so that it's tried again soon without calling Secrets Manager on every
+    request."""
+
     def __init__(self, secret_manager: Annotated[BaseClient, Inject(qualifier="secretsmanager")]) -> None:
         super().__init__()
         self.secret_manager = secret_manager
 
+    def get_secret(self, secret_name: str, stage: str, *, force_refresh: bool = False) -> CachedSecret:
+        cached = secret_cache.get((secret_name, stage))
+        if cached is not None:
+            max_age = SECRET_MIN_REFRESH_SECONDS if force_refresh or cached.value is None else SECRET_CACHE_TTL_SECONDS
+            if cached.age() < max_age:
+                return cached
+
+        loaded = self._get_secret_by_stage(secret_name, stage)
+        if loaded.value is None and cached is not None and cached.value is not None:
+            loaded = CachedSecret(cached.version_id, cached.value, loaded.loaded_at)
+        elif cached is not None and cached.value is not None and cached.version_id != loaded.version_id:
+            logger.info("Secret %s at stage %s has been rotated", secret_name, stage)
+
+        secret_cache[(secret_name, stage)] = loaded
+        return loaded
+
     @xray_recorder.capture("SecretRepo._get_secret_by_stage")  # pyright: ignore[reportCallIssue]
-    def _get_secret_by_stage(self, secret_name: str, stage: str) -> dict[str, str]:
+    def _get_secret_by_stage(self, secret_name: str, stage: str) -> CachedSecret:
         """Internal helper to fetch a secret by version stage."""
         try:
             response = self.secret_manager.get_secret_value(
                 SecretId=secret_name,
                 VersionStage=stage,
             )
-            return {stage: response["SecretString"]}
+            return CachedSecret(response.get("VersionId"), response["SecretString"], time.monotonic())
 
         except ClientError:
             logger.warning("Failed to get secret %s at stage %s", secret_name, stage)
-            return {}
+            return CachedSecret(None, None, time.monotonic())
 
     def get_secret_current(self, secret_name: str) -> dict[str, str]:
-        return self._get_secret_by_stage(secret_name, "AWSCURRENT")
+        return self._as_dict(self.get_secret(secret_name, "AWSCURRENT"), "AWSCURRENT")
 
     def get_secret_previous(self, secret_name: str) -> dict[str, str]:
-        return self._get_secret_by_stage(secret_name, "AWSPREVIOUS")
+        return self._as_dict(self.get_secret(secret_name, "AWSPREVIOUS"), "AWSPREVIOUS")
+
+    @staticmethod
+    def _as_dict(secret: CachedSecret, stage: str) -> dict[str, str]:
+        return {stage: secret.value} if secret.value is not None else {}
@@ -105,8 +105,8 @@ class EligibilityCalculator:
             if matched_action_detail.status_text_override:
                 iteration_result_summary.iteration_result.status_text = matched_action_detail.status_text_override
 
-            iteration_result_summary = TokenProcessor.find_and_replace_tokens(self.person, iteration_result_summary)
-            matched_action_detail = TokenProcessor.find_and_replace_tokens(self.person, matched_action_detail)
+            iteration_result_summary = TokenProcessor.replace_result_tokens(self.person, iteration_result_summary)
+            matched_action_detail = TokenProcessor.replace_action_tokens(self.person, matched_action_detail)
 
             condition_results[condition_name] = iteration_result_summary.iteration_result
             condition_results[condition_name].actions = matched_action_detail.actions
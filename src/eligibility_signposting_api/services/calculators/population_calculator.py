@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import groupby
+from operator import attrgetter
+from typing import TYPE_CHECKING, NamedTuple
+
+from eligibility_signposting_api.model.campaign_config import (
+    CampaignID,
+    CohortLabel,
+    IterationCohort,
+    IterationRule,
+    RuleAttributeLevel,
+    RuleName,
+    RulePriority,
+    RuleType,
+)
+from eligibility_signposting_api.model.eligibility_status import ConditionName, Status
+from eligibility_signposting_api.services.calculators.rule_calculator import RuleCalculator
+from eligibility_signposting_api.services.processors.campaign_evaluator import CampaignEvaluator
+from eligibility_signposting_api.services.processors.rule_processor import RuleProcessor
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from eligibility_signposting_api.model.campaign_config import CampaignConfig, Iteration
+    from eligibility_signposting_api.model.population import Mask, Population
+
+
+class RuleKey(NamedTuple):
+    type: RuleType
+    priority: RulePriority
+    name: RuleName
+
+    @classmethod
+    def of(cls, rule: IterationRule) -> RuleKey:
+        return cls(rule.type, rule.priority, rule.name)
+
+
+@dataclass
+class PopulationConditionResult:
+    """The status of everyone in a population for one condition, as masks of the people with each status."""
+
+    condition_name: ConditionName
+    campaign_id: CampaignID
+    statuses: dict[Status, Mask]
+    cohort_statuses: dict[CohortLabel, dict[Status, Mask]]
+    rule_reasons: dict[RuleKey, Mask]
+    """For each filter or suppression rule, the people it gave as a reason for their status."""
+
+    def status_of(self, position: int) -> Status:
+        bit = 1 << position
+        return next(status for status, mask in self.statuses.items() if mask & bit)
+
+    def reasons_for(self, position: int) -> list[RuleKey]:
+        bit = 1 << position
+        return [rule_key for rule_key, mask in self.rule_reasons.items() if mask & bit]
+
+    def status_counts(self) -> dict[Status, int]:
+        return {status: mask.bit_count() for status, mask in self.statuses.items()}
+
+    def cohort_counts(self) -> dict[CohortLabel, dict[Status, int]]:
+        return {
+            label: {status: mask.bit_count() for status, mask in statuses.items()}
+            for label, statuses in self.cohort_statuses.items()
+        }
+
+    def rule_counts(self) -> dict[RuleKey, int]:
+        return {rule_key: mask.bit_count() for rule_key, mask in self.rule_reasons.items()}
+
+
+@dataclass
+class PopulationCalculator:
+    """Evaluates the status of everyone in a population for each condition at once, giving the same statuses as an
+    `EligibilityCalculator` for each person.
+
+    Rules are evaluated once per distinct attribute value across the population rather than once per person, and the
+    filter and suppression priority groups are combined with bitwise operations on the masks they give, following
+    `RuleProcessor.is_eligible` and `RuleProcessor.is_actionable`."""
+
+    population: Population
+    campaign_configs: Collection[CampaignConfig]
+
+    campaign_evaluator: CampaignEvaluator = field(default_factory=CampaignEvaluator)
+
+    _rule_masks: dict[tuple[int, frozenset[str]], Mask] = field(default_factory=dict, init=False, repr=False)
+
+    def get_condition_results(self, conditions: list[str], requested_category: str) -> list[PopulationConditionResult]:
+        # Virtual cohorts are added to each person as they're evaluated, and stay added for later conditions.
+        virtual_labels: set[str] = set()
+        campaigns = self.campaign_evaluator.get_campaign_with_latest_active_iteration_per_target(
+            self.campaign_configs, conditions, requested_category
+        )
+        return [
+            self.evaluate_iteration(condition_name, campaign.id, campaign.current_iteration, virtual_labels)
+            for condition_name, campaign in campaigns
+        ]
+
+    def evaluate_iteration(
+        self,
+        condition_name: ConditionName,
+        campaign_id: CampaignID,
+        iteration: Iteration,
+        virtual_labels: set[str],
+    ) -> PopulationConditionResult:
+        everyone = self.population.everyone
+        filter_rules, suppression_rules = RuleProcessor.get_rules_by_type(iteration)
+        cohort_statuses: dict[CohortLabel, dict[Status, Mask]] = {}
+        filtered_by: dict[RuleKey, Mask] = defaultdict(int)
+        suppressed_by: dict[RuleKey, Mask] = defaultdict(int)
+
+        for cohort in sorted(iteration.iteration_cohorts, key=attrgetter("priority")):
+            if cohort.is_virtual_cohort:
+                virtual_labels.add(cohort.cohort_label)
+            eligible = (
+                everyone
+                if cohort.cohort_label in virtual_labels
+                else self.population.cohort_members(cohort.cohort_label)
+            )
+
+            for group in self._rule_groups(cohort, filter_rules):
+                excluded = eligible & self._group_mask(group, virtual_labels)
+                for rule in group:
+                    filtered_by[RuleKey.of(rule)] |= excluded
+                eligible &= ~excluded
+
+            not_actionable, still_evaluating = 0, eligible
+            for group in self._rule_groups(cohort, suppression_rules):
+                excluded = still_evaluating & self._group_mask(group, virtual_labels)
+                for rule in group:
+                    suppressed_by[RuleKey.of(rule)] |= excluded
+                not_actionable |= excluded
+                if any(rule.rule_stop for rule in group):
+                    still_evaluating &= ~excluded
+
+            cohort_statuses[cohort.cohort_label] = {
+                Status.actionable: eligible & ~not_actionable,
+                Status.not_actionable: not_actionable,
+                Status.not_eligible: everyone & ~eligible,
+            }
+
+        actionable = not_actionable = 0
+        for statuses in cohort_statuses.values():
+            actionable |= statuses[Status.actionable]
+            not_actionable |= statuses[Status.not_actionable]
+        not_actionable &= ~actionable
+        statuses = {
+            Status.actionable: actionable,
+            Status.not_actionable: not_actionable,
+            Status.not_eligible: everyone & ~(actionable | not_actionable),
+        }
+
+        # Only rules excluding people from the cohorts which gave them their status count, as in the audit record.
+        rule_reasons = {rule_key: mask & statuses[Status.not_eligible] for rule_key, mask in filtered_by.items()} | {
+            rule_key: mask & statuses[Status.not_actionable] for rule_key, mask in suppressed_by.items()
+        }
+        return PopulationConditionResult(condition_name, campaign_id, statuses, cohort_statuses, rule_reasons)
+
+    @staticmethod
+    def _rule_groups(cohort: IterationCohort, rules: Iterable[IterationRule]) -> list[list[IterationRule]]:
+        """The rules applying to the cohort, grouped by priority in priority order."""
+        priority_getter = attrgetter("priority")
+        groups = [list(group) for _, group in groupby(sorted(rules, key=priority_getter), key=priority_getter)]
+        return [group for group in groups if not RuleProcessor.should_skip_rule_group(cohort, group)]
+
+    def _group_mask(self, group: list[IterationRule], virtual_labels: set[str]) -> Mask:
+        """The people excluded by a priority group, who are those every rule in it matches."""
+        mask = self.population.everyone
+        for rule in group:
+            mask &= self._rule_mask(rule, virtual_labels)
+            if not mask:
+                break
+        return mask
+
+    def _rule_mask(self, rule: IterationRule, virtual_labels: set[str]) -> Mask:
+        """The people the rule matches."""
+        added_labels = frozenset(virtual_labels) if rule.attribute_level == RuleAttributeLevel.COHORT else frozenset()
+        key = (id(rule), added_labels)
+        if (mask := self._rule_masks.get(key)) is None:
+            match rule.attribute_level:
+                case RuleAttributeLevel.PERSON:
+                    values = self.population.attribute_values("PERSON", str(rule.attribute_name))
+                case RuleAttributeLevel.COHORT:
+                    values = self.population.cohort_label_sets(added_labels)
+                case RuleAttributeLevel.TARGET:
+                    values = self.population.attribute_values(str(rule.attribute_target), str(rule.attribute_name))
+                case _:  # pragma: no cover
+                    msg = f"{rule.attribute_level} not implemented"
+                    raise NotImplementedError(msg)
+            mask = 0
+            for value, people in values:
+                if RuleCalculator.rule_matches(rule, value):
+                    mask |= people
+            self._rule_masks[key] = mask
+        return mask
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
-
-from hamcrest.core.string_description import StringDescription
+from typing import TYPE_CHECKING, cast
 
 from eligibility_signposting_api.model import eligibility_status
 from eligibility_signposting_api.model.campaign_config import IterationRule, RuleAttributeLevel, RuleType
-from eligibility_signposting_api.services.operators.operators import OperatorRegistry
+from eligibility_signposting_api.services.operators.operators import MembershipOperator, Operator, OperatorRegistry
 from eligibility_signposting_api.services.processors.person_data_reader import PersonDataReader
 
 if TYPE_CHECKING:
@@ -15,6 +14,14 @@ if TYPE_CHECKING:
 
     from eligibility_signposting_api.model.person import Person
 
+MATCHED_RULE_STATUSES = {
+    RuleType.filter: eligibility_status.Status.not_eligible,
+    RuleType.suppression: eligibility_status.Status.not_actionable,
+    RuleType.redirect: eligibility_status.Status.actionable,
+    RuleType.not_eligible_actions: eligibility_status.Status.not_eligible,
+    RuleType.not_actionable_actions: eligibility_status.Status.not_actionable,
+}
+
 
 @dataclass
 class RuleCalculator:
@@ -25,63 +32,72 @@ class RuleCalculator:
 
     def evaluate_exclusion(self) -> tuple[eligibility_status.Status, eligibility_status.Reason]:
         """Evaluate if a particular rule excludes this person. Return the result, and the reason for the result."""
-        attribute_value = self.get_attribute_value()
-        status, reason, matcher_matched = self.evaluate_rule(attribute_value)
-        rule_code = eligibility_status.RuleCode(self.rule.rule_code)
-        reason = eligibility_status.Reason(
+        status, matcher_matched = self.evaluate_status()
+        return status, self.build_reason(matcher_matched=matcher_matched)
+
+    def matches(self) -> bool:
+        """Whether the rule matches this person, without describing the match or building a `Reason`."""
+        return self.rule_matches(self.rule, self.get_attribute_value())
+
+    def evaluate_status(self) -> tuple[eligibility_status.Status, bool]:
+        """The status this rule gives the person, and whether it matched them. Use `build_reason` for the reason,
+        only where it's needed."""
+        matcher_matched = self.matches()
+        status = MATCHED_RULE_STATUSES[self.rule.type] if matcher_matched else eligibility_status.Status.actionable
+        return status, matcher_matched
+
+    def build_reason(self, *, matcher_matched: bool) -> eligibility_status.Reason:
+        return eligibility_status.Reason(
             rule_name=eligibility_status.RuleName(self.rule.name),
-            rule_code=rule_code,
+            rule_code=eligibility_status.RuleCode(self.rule.rule_code),
             rule_type=eligibility_status.RuleType(self.rule.type),
             rule_priority=eligibility_status.RulePriority(str(self.rule.priority)),
             rule_text=eligibility_status.RuleText(self.rule.rule_text),
             matcher_matched=matcher_matched,
         )
-        return status, reason
 
-    def get_attribute_value(self) -> str | None:
+    def get_attribute_value(self) -> str | AbstractSet[str] | None:
         """Pull out the correct attribute for a rule from the person's data."""
         match self.rule.attribute_level:
             case RuleAttributeLevel.PERSON:
-                person: Mapping[str, str | None] | None = next(
-                    (r for r in self.person.data if r.get("ATTRIBUTE_TYPE", "") == "PERSON"), None
-                )
+                person: Mapping[str, str | None] | None = self.person.get_row("PERSON")
                 attribute_value = person.get(str(self.rule.attribute_name)) if person else None
             case RuleAttributeLevel.COHORT:
-                cohorts: Mapping[str, str | None] | None = next(
-                    (r for r in self.person.data if r.get("ATTRIBUTE_TYPE", "") == "COHORTS"), None
+                attribute_value = (
+                    self.person_data_reader.get_person_cohorts(self.person) if self.person.has_cohorts else None
                 )
-                if cohorts:
-                    person_cohorts = self.person_data_reader.get_person_cohorts(self.person)
-                    attribute_value = ",".join(person_cohorts)
-                else:
-                    attribute_value = None
 
             case RuleAttributeLevel.TARGET:
-                target: Mapping[str, str | None] | None = next(
-                    (r for r in self.person.data if r.get("ATTRIBUTE_TYPE", "") == self.rule.attribute_target), None
-                )
+                target: Mapping[str, str | None] | None = self.person.get_row(self.rule.attribute_target)
                 attribute_value = target.get(str(self.rule.attribute_name)) if target else None
             case _:  # pragma: no cover
                 msg = f"{self.rule.attribute_level} not implemented"
                 raise NotImplementedError(msg)
         return attribute_value
 
-    def evaluate_rule(self, attribute_value: str | None) -> tuple[eligibility_status.Status, str, bool]:
-        """Evaluate a rule against a person data attribute. Return the result, and the reason for the result."""
-        matcher_class = OperatorRegistry.get(self.rule.operator)
-        matcher = matcher_class(rule_value=self.rule.comparator)
-
-        matcher_matched = matcher.matches(attribute_value)
-        reason = StringDescription()
-        if matcher_matched:
-            matcher.describe_match(attribute_value, reason)
-            status = {
-                RuleType.filter: eligibility_status.Status.not_eligible,
-                RuleType.suppression: eligibility_status.Status.not_actionable,
-                RuleType.redirect: eligibility_status.Status.actionable,
-                RuleType.not_eligible_actions: eligibility_status.Status.not_eligible,
-                RuleType.not_actionable_actions: eligibility_status.Status.not_actionable,
-            }[self.rule.type]
-            return status, str(reason), matcher_matched
-        matcher.describe_mismatch(attribute_value, reason)
-        return eligibility_status.Status.actionable, str(reason), matcher_matched
+    @staticmethod
+    def get_matcher(rule: IterationRule) -> Operator:
+        """Get the operator for a rule, building it the first time the rule is evaluated.
+
+        The operator is kept on the rule, which lives as long as the cached campaign config, so parsing the rule's
+        comparator (NVL defaults, offsets, numeric and range values) happens once per config load rather than once
+        per request."""
+        if (matcher := rule.matcher) is None:
+            matcher_class = OperatorRegistry.get(rule.operator)
+            matcher = matcher_class(rule_value=rule.comparator)
+            rule.set_matcher(matcher)
+        return matcher
+
+    @staticmethod
+    def as_item(matcher: Operator, attribute_value: str | AbstractSet[str] | None) -> str | None:
+        """The attribute value in the form the operator compares."""
+        if isinstance(attribute_value, AbstractSet) and not isinstance(matcher, MembershipOperator):
+            attribute_value = ",".join(attribute_value)
+        # Membership operators take a set of values (a person's cohort labels) as is.
+        return cast("str | None", attribute_value)
+
+    @classmethod
+    def rule_matches(cls, rule: IterationRule, attribute_value: str | AbstractSet[str] | None) -> bool:
+        """Whether the rule's operator matches the attribute value, without describing why."""
+        matcher = cls.get_matcher(rule)
+        return matcher.matches(cls.as_item(matcher, attribute_value))
@@ -1,9 +1,10 @@
 import logging
+from collections.abc import Iterator, Sequence
 
 from wireup import service
 
 from eligibility_signposting_api.model import eligibility_status
-from eligibility_signposting_api.model.campaign_config import CampaignConfig
+from eligibility_signposting_api.model.campaign_index import CampaignIndex
 from eligibility_signposting_api.model.consumer_mapping import ConsumerId
 from eligibility_signposting_api.repos import CampaignRepo, NotFoundError, PersonRepo
 from eligibility_signposting_api.repos.consumer_mapping_repo import ConsumerMappingRepo
@@ -46,13 +47,13 @@ class EligibilityService:
         """Calculate a person's eligibility for vaccination given an NHS number."""
         if nhs_number:
             try:
-                person_data = self.person_repo.get_eligibility_data(nhs_number)
+                person_data = self.person_repo.get_eligibility_data(nhs_number, consumer_id)
             except NotFoundError as e:
                 raise UnknownPersonError from e
             else:
-                campaign_configs: list[CampaignConfig] = list(self.campaign_repo.get_campaign_configs(consumer_id))
+                campaign_index = self.campaign_repo.get_campaign_index(consumer_id)
                 permitted_campaign_configs = self.__collect_permitted_campaign_configs(
-                    campaign_configs, ConsumerId(consumer_id)
+                    campaign_index, ConsumerId(consumer_id)
                 )
                 calc: calculator.EligibilityCalculator = self.calculator_factory.get(
                     person_data, permitted_campaign_configs
@@ -61,13 +62,33 @@ class EligibilityService:
 
         raise UnknownPersonError  # pragma: no cover
 
+    def get_eligibility_statuses(
+        self,
+        nhs_numbers: Sequence[eligibility_status.NHSNumber],
+        include_actions: str,
+        conditions: list[str],
+        category: str,
+        consumer_id: str,
+    ) -> Iterator[tuple[eligibility_status.NHSNumber, eligibility_status.EligibilityStatus | None]]:
+        """Calculate the eligibility of many people, in the order given, with None for anyone not found.
+
+        Everyone's data is fetched up front, and they are all evaluated against the same campaign configs. Each
+        person is only evaluated as their result is taken, so anything recorded while evaluating them (such as the
+        audit conditions) can be dealt with before the next person."""
+        people = self.person_repo.get_eligibility_data_batch(nhs_numbers, consumer_id)
+        campaign_index = self.campaign_repo.get_campaign_index(consumer_id)
+        permitted_campaign_configs = self.__collect_permitted_campaign_configs(campaign_index, ConsumerId(consumer_id))
+
+        for nhs_number in nhs_numbers:
+            person_data = people.get(nhs_number)
+            if person_data is None:
+                yield nhs_number, None
+            else:
+                calc = self.calculator_factory.get(person_data, permitted_campaign_configs)
+                yield nhs_number, calc.get_eligibility_status(include_actions, conditions, category)
+
     def __collect_permitted_campaign_configs(
-        self, campaign_configs: list[CampaignConfig], consumer_id: ConsumerId
-    ) -> list[CampaignConfig]:
+        self, campaign_index: CampaignIndex, consumer_id: ConsumerId
+    ) -> CampaignIndex:
         permitted_campaign_ids = self.consumer_mapping.get_permitted_campaign_ids(ConsumerId(consumer_id))
-        if permitted_campaign_ids:
-            permitted_campaign_configs: list[CampaignConfig] = [
-                campaign for campaign in campaign_configs if campaign.id in permitted_campaign_ids
-            ]
-            return permitted_campaign_configs
-        return []
+        return campaign_index.restricted_to(permitted_campaign_ids or frozenset())
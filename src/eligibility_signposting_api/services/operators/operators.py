@@ -3,8 +3,10 @@ import operator
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
+from functools import cached_property
 from typing import ClassVar, cast
 
 from dateutil.relativedelta import relativedelta
@@ -61,6 +63,11 @@ class OperatorRegistry:
 
 class ScalarOperator(Operator, ABC):
     comparator: ClassVar[Callable[[str | None, str | None], bool]]
+    numeric_rule_value: int | None = None
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.numeric_rule_value = int(self.rule_value) if self.int_like(self.rule_value) else None
 
     def _matches(self, item: str | None) -> bool:
         item = item if item is not None else self.item_default
@@ -73,6 +80,10 @@ class ScalarOperator(Operator, ABC):
             # If item is an empty string, only EQ and NE can match
             return self.comparator in (operator.eq, operator.ne) and data_comparator(item, self.rule_value)
 
+        if self.numeric_rule_value is not None and self.int_like(item):
+            # The rule value was parsed when this operator was built, so only the person's data needs converting.
+            return data_comparator(int(item), self.numeric_rule_value)
+
         person_data, rule_value = self.coerce_types(item, self.rule_value)
         return data_comparator(person_data, rule_value)
 
@@ -160,24 +171,37 @@ class EndsWith(Operator):
         return str(item).endswith(self.rule_value)
 
 
+class MembershipOperator(Operator, ABC):
+    """Compares a comma separated list of values from a person's data against the rule's comma separated values.
+
+    The person's values may also be given as a set, such as their cohort labels, which saves joining them only to
+    split them again."""
+
+    comparators: frozenset[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.comparators = frozenset(str(self.rule_value).split(","))
+
+    def item_values(self, item: str | AbstractSet[str] | None) -> AbstractSet[str]:
+        item = item if item is not None else self.item_default
+        if isinstance(item, AbstractSet):
+            return item
+        return set(str(item).split(","))
+
+
 @OperatorRegistry.register(RuleOperator.is_in)
 @OperatorRegistry.register(RuleOperator.member_of)
-class IsIn(Operator):
-    def _matches(self, item: str | None) -> bool:
-        item = item if item is not None else self.item_default
-        comparators = set(str(self.rule_value).split(","))
-        items = set(str(item).split(","))
-        return bool(items & comparators)
+class IsIn(MembershipOperator):
+    def _matches(self, item: str | AbstractSet[str] | None) -> bool:
+        return not self.comparators.isdisjoint(self.item_values(item))
 
 
 @OperatorRegistry.register(RuleOperator.not_in)
 @OperatorRegistry.register(RuleOperator.not_member_of)
-class NotIn(Operator):
-    def _matches(self, item: str | None) -> bool:
-        item = item if item is not None else self.item_default
-        comparators = set(str(self.rule_value).split(","))
-        items = set(str(item).split(","))
-        return not bool(items & comparators)
+class NotIn(MembershipOperator):
+    def _matches(self, item: str | AbstractSet[str] | None) -> bool:
+        return self.comparators.isdisjoint(self.item_values(item))
 
 
 @OperatorRegistry.register(RuleOperator.is_null)
@@ -267,11 +291,15 @@ class DateOperator(Operator, ABC):
     def get_attribute_date(item: str | None) -> date | None:
         return datetime.strptime(str(item), "%Y%m%d").replace(tzinfo=UTC).date() if item else None
 
-    @property
-    def cutoff(self) -> date:
+    @cached_property
+    def delta(self) -> relativedelta:
         delta = relativedelta()
         setattr(delta, self.delta_type, int(self.rule_value))
-        return (self.offset if self.offset else self.today) + delta
+        return delta
+
+    @property
+    def cutoff(self) -> date:
+        return (self.offset if self.offset else self.today) + self.delta
 
     def _matches(self, item: str | None) -> bool:
         item = item if item is not None else self.item_default
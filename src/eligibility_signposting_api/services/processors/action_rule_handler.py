@@ -53,10 +53,7 @@ class ActionRuleHandler:
         for _, rule_group in groupby(sorted_rules_by_priority, key=priority_getter):
             rule_group_list = list(rule_group)
 
-            all_rules_matched = all(
-                RuleCalculator(person=person, rule=rule).evaluate_exclusion()[1].matcher_matched
-                for rule in rule_group_list
-            )
+            all_rules_matched = all(RuleCalculator(person=person, rule=rule).matches() for rule in rule_group_list)
 
             comms_routing = rule_group_list[0].comms_routing
             if comms_routing and all_rules_matched:
@@ -1,31 +1,35 @@
 import logging
 from collections.abc import Collection, Iterator
-from itertools import groupby
-from operator import attrgetter
+from operator import itemgetter
 
 from wireup import service
 
 from eligibility_signposting_api.model import eligibility_status
 from eligibility_signposting_api.model.campaign_config import CampaignConfig
+from eligibility_signposting_api.model.campaign_index import CampaignIndex
 
 logger = logging.getLogger(__name__)
 
 
 @service
 class CampaignEvaluator:
-    """Filters and groups campaign configurations."""
+    """Filters and groups campaign configurations, using a `CampaignIndex` built when they were loaded if given one."""
 
     def get_active_campaigns(self, campaign_configs: Collection[CampaignConfig]) -> list[CampaignConfig]:
         return [cc for cc in campaign_configs if cc.campaign_live]
 
-    def get_campaign_with_latest_iteration(self, active_campaigns: list[CampaignConfig]) -> CampaignConfig | None:
+    def get_campaign_with_latest_iteration(
+        self, active_campaigns: list[CampaignConfig], campaign_index: CampaignIndex | None = None
+    ) -> CampaignConfig | None:
         """
         Returns the campaign with the latest active iteration date.
 
         1. Collect all campaigns with an active iteration.
-        2. Sort by iteration date (descending).
-        3. Extract the lead campaign, throwing an error if a tie for the latest date exists.
+        2. Find the latest iteration date.
+        3. Extract the lead campaign, throwing an error if another campaign found by the index to share that iteration
+           date also has it as its active iteration.
         """
+        campaign_index = campaign_index if campaign_index is not None else CampaignIndex(active_campaigns)
 
         valid_items = []
 
@@ -39,49 +43,35 @@ class CampaignEvaluator:
                 )
 
         if not valid_items:
-            latest_campaign = None
-        else:
-            max_date_time = max(item[0] for item in valid_items)
-            cc_with_max_iteration_date_time: list[CampaignConfig] = [
-                item[1] for item in valid_items if item[0] == max_date_time
-            ]
-            if len(cc_with_max_iteration_date_time) > 1:
-                err_msg = (
-                    f"Ambiguous result: '{len(cc_with_max_iteration_date_time)}' active iterations "
-                    f"for target {cc_with_max_iteration_date_time[0].target} "
-                    f"found for datetime '{max_date_time}' "
-                    f"across campaign(s) {[cc.id for cc in cc_with_max_iteration_date_time]}"
-                )
-                raise ValueError(err_msg)
-
-            latest_campaign = cc_with_max_iteration_date_time[0]
+            return None
+
+        max_date_time, latest_campaign = max(valid_items, key=itemgetter(0))
+        valid_campaign_ids = {cc.id for _, cc in valid_items}
+        cc_with_max_iteration_date_time: list[CampaignConfig] = [
+            cc
+            for cc in campaign_index.campaigns_sharing_iteration_datetime(latest_campaign.target, max_date_time)
+            if cc.id in valid_campaign_ids and cc.current_iteration.iteration_datetime == max_date_time
+        ]
+        if len(cc_with_max_iteration_date_time) > 1:
+            err_msg = (
+                f"Ambiguous result: '{len(cc_with_max_iteration_date_time)}' active iterations "
+                f"for target {cc_with_max_iteration_date_time[0].target} "
+                f"found for datetime '{max_date_time}' "
+                f"across campaign(s) {[cc.id for cc in cc_with_max_iteration_date_time]}"
+            )
+            raise ValueError(err_msg)
 
         return latest_campaign
 
     def get_campaign_with_latest_active_iteration_per_target(
         self, campaign_configs: Collection[CampaignConfig], conditions: list[str], requested_category: str
     ) -> Iterator[tuple[eligibility_status.ConditionName, CampaignConfig]]:
-        mapping = {
-            "ALL": {"V", "S"},
-            "VACCINATIONS": {"V"},
-            "SCREENING": {"S"},
-        }
-
-        allowed_types = mapping.get(requested_category, set())
-
-        filter_all_conditions = "ALL" in conditions
-
-        allowed_campaigns = [c for c in campaign_configs if c.type in allowed_types]
-        active_campaigns = self.get_active_campaigns(allowed_campaigns)
-
-        for condition_name, campaign_group in groupby(
-            sorted(active_campaigns, key=attrgetter("target")),
-            key=attrgetter("target"),
-        ):
-            filtered_campaigns = [
-                c for c in campaign_group if filter_all_conditions or str(condition_name) in conditions
-            ]
+        campaign_index = (
+            campaign_configs if isinstance(campaign_configs, CampaignIndex) else CampaignIndex(campaign_configs)
+        )
 
-            campaign = self.get_campaign_with_latest_iteration(filtered_campaigns)
+        for condition_name, campaign_group in campaign_index.campaigns_by_target(requested_category, conditions):
+            active_campaigns = self.get_active_campaigns(campaign_group)
+            campaign = self.get_campaign_with_latest_iteration(active_campaigns, campaign_index)
             if campaign is not None:
-                yield (condition_name, campaign)
+                yield (eligibility_status.ConditionName(condition_name), campaign)
@@ -114,11 +114,8 @@ class AddDaysHandler(DerivedValueHandler):
         else:
             attribute_type_to_match = context.attribute_name
 
-        for attribute in context.person_data:
-            if attribute.get("ATTRIBUTE_TYPE") == attribute_type_to_match:
-                return attribute.get(source_attr)
-
-        return None
+        attribute = context.get_row(attribute_type_to_match)
+        return attribute.get(source_attr) if attribute else None
 
     def _get_days_to_add(self, context: DerivedValueContext) -> int:
         """Determine the number of days to add.
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
+from eligibility_signposting_api.model.person import Person
+
 
 @dataclass
 class DerivedValueContext:
@@ -15,6 +17,7 @@ class DerivedValueContext:
         function_args: Arguments passed to the function (e.g., number of days)
         date_format: Optional date format string for output formatting
         attribute_level: The level of the attribute ('TARGET', 'PERSON' or 'COHORT')
+        person: Optional indexed view of person_data, used to find rows without scanning person_data
     """
 
     person_data: list[dict[str, Any]]
@@ -23,6 +26,13 @@ class DerivedValueContext:
     function_args: str | None
     date_format: str | None
     attribute_level: str = "TARGET"
+    person: Person | None = None
+
+    def get_row(self, attribute_type: str) -> dict[str, Any] | None:
+        """Find the first row of person data with the given ATTRIBUTE_TYPE."""
+        if self.person is not None:
+            return self.person.get_row(attribute_type)
+        return next((row for row in self.person_data if row.get("ATTRIBUTE_TYPE") == attribute_type), None)
 
 
 class DerivedValueHandler(ABC):
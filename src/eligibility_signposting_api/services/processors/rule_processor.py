@@ -39,13 +39,7 @@ class RuleProcessor:
 
     def is_base_eligible(self, person: Person, cohort: IterationCohort) -> bool:
         if cohort.is_virtual_cohort:
-            cohorts_data = next((row for row in person.data if row.get("ATTRIBUTE_TYPE") == "COHORTS"), None)
-
-            if cohorts_data is None:
-                cohorts_data = {"ATTRIBUTE_TYPE": "COHORTS", "COHORT_MEMBERSHIPS": []}
-                person.data.append(cohorts_data)
-
-            cohorts_data.setdefault("COHORT_MEMBERSHIPS", []).append({"COHORT_LABEL": cohort.cohort_label})
+            person.add_cohort_membership(cohort.cohort_label)
 
         person_cohorts = self.person_data_reader.get_person_cohorts(person)
 
@@ -64,7 +58,7 @@ class RuleProcessor:
 
         for _, rule_group in groupby(sorted_rules_by_priority, key=priority_getter):
             group_rules = list(rule_group)
-            if self._should_skip_rule_group(cohort, group_rules):
+            if self.should_skip_rule_group(cohort, group_rules):
                 continue
             status, group_exclusion_reasons, _ = self.evaluate_rules_priority_group(person, iter(group_rules))
             if status.is_exclusion:
@@ -96,7 +90,7 @@ class RuleProcessor:
 
         for _, rule_group in groupby(sorted_rules_by_priority, key=priority_getter):
             group_rules = list(rule_group)
-            if self._should_skip_rule_group(cohort, group_rules):
+            if self.should_skip_rule_group(cohort, group_rules):
                 continue
 
             status, group_exclusion_reasons, rule_stop = self.evaluate_rules_priority_group(person, iter(group_rules))
@@ -122,7 +116,7 @@ class RuleProcessor:
                 )
 
     @staticmethod
-    def _should_skip_rule_group(cohort: IterationCohort, group_rules: list[IterationRule]) -> bool:
+    def should_skip_rule_group(cohort: IterationCohort, group_rules: list[IterationRule]) -> bool:
         cohort_specific_rules = [rule for rule in group_rules if rule.parsed_cohort_labels]
         matching_specific_rules = [
             rule for rule in cohort_specific_rules if cohort.cohort_label in rule.parsed_cohort_labels
@@ -132,20 +126,25 @@ class RuleProcessor:
     def evaluate_rules_priority_group(
         self, person: Person, rules_group: Iterator[IterationRule]
     ) -> tuple[eligibility_status.Status, list[eligibility_status.Reason], bool]:
-        is_rule_stop = False
-        exclusion_reasons = []
+        """The person is excluded by a priority group only if every rule in it excludes them, so evaluation stops at
+        the first rule which doesn't, and reasons are only built for the rules of a group which excludes them."""
+        group_rules = list(rules_group)
+        is_rule_stop = any(rule.rule_stop for rule in group_rules)
         best_status = eligibility_status.Status.not_eligible
+        excluding_rules: list[tuple[RuleCalculator, bool]] = []
 
-        for rule in rules_group:
-            is_rule_stop = rule.rule_stop or is_rule_stop
+        for rule in group_rules:
             rule_calculator = RuleCalculator(person=person, rule=rule)
-            status, reason = rule_calculator.evaluate_exclusion()
-            if status.is_exclusion:
-                best_status = eligibility_status.Status.best(status, best_status)
-                exclusion_reasons.append(reason)
-            else:
-                best_status = eligibility_status.Status.actionable
-
+            status, matcher_matched = rule_calculator.evaluate_status()
+            if not status.is_exclusion:
+                return eligibility_status.Status.actionable, [], is_rule_stop
+            best_status = eligibility_status.Status.best(status, best_status)
+            excluding_rules.append((rule_calculator, matcher_matched))
+
+        exclusion_reasons = [
+            rule_calculator.build_reason(matcher_matched=matcher_matched)
+            for rule_calculator, matcher_matched in excluding_rules
+        ]
         return best_status, exclusion_reasons, is_rule_stop
 
     def get_cohort_group_results(
@@ -1,5 +1,6 @@
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass
@@ -31,8 +32,28 @@ class ParsedToken:
     function_args: str | None = None
 
 
+@dataclass(frozen=True)
+class TokenTemplate:
+    """A string split into the literal text around its tokens and the tokens themselves, each parsed once.
+
+    `literals` holds one more entry than `tokens`: the text before the first token, between each pair of tokens, and
+    after the last one."""
+
+    literals: tuple[str, ...]
+    tokens: tuple[tuple[str, ParsedToken], ...]
+
+    def render(self, replacements: list[str]) -> str:
+        """The string with each token replaced by the value given for it, in order."""
+        parts = [self.literals[0]]
+        for replacement, literal in zip(replacements, self.literals[1:], strict=True):
+            parts.append(replacement)
+            parts.append(literal)
+        return "".join(parts)
+
+
 class TokenParser:
     MIN_TOKEN_PARTS = 2
+    TOKEN_PATTERN = re.compile(r"(\[\[.*?\]\])")
     # Pattern for function calls like ADD_DAYS(91) - captures function name and args
     FUNCTION_PATTERN = re.compile(r":([A-Z_]+)\(([^()]*)\)", re.IGNORECASE)
     # Pattern for DATE format - special case as it's already supported
@@ -101,6 +122,17 @@ class TokenParser:
             function_args=function_args,
         )
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def compile(text: str) -> TokenTemplate:
+        """Splits a string into a template of its literal text and parsed tokens.
+
+        Campaign config strings are few and used on every request, so templates are cached by their text and each
+        string is only parsed the first time it is seen. Errors are raised as from `parse`, and aren't cached."""
+        parts = TokenParser.TOKEN_PATTERN.split(text)
+        tokens = tuple((token, TokenParser.parse(token)) for token in parts[1::2])
+        return TokenTemplate(literals=tuple(parts[0::2]), tokens=tokens)
+
     @staticmethod
     def _extract_function(token_name: str) -> tuple[str | None, str | None]:
         """Extract function name and arguments from token name.
@@ -1,11 +1,29 @@
-import re
-from dataclasses import Field, fields, is_dataclass
+from collections.abc import Collection
+from dataclasses import replace
 from datetime import UTC, datetime
-from typing import Any, Never
+from typing import Never
 
 from wireup import service
 
 from eligibility_signposting_api.config.constants import ALLOWED_CONDITIONS
+from eligibility_signposting_api.model import campaign_config
+from eligibility_signposting_api.model.eligibility_status import (
+    ActionCode,
+    ActionDescription,
+    ActionType,
+    CohortGroupResult,
+    InternalActionCode,
+    IterationResultSummary,
+    MatchedActionDetail,
+    Reason,
+    RuleCode,
+    RuleName,
+    RulePriority,
+    RuleText,
+    StatusText,
+    SuggestedAction,
+    UrlLabel,
+)
 from eligibility_signposting_api.model.person import Person
 from eligibility_signposting_api.services.processors.derived_values import (
     DerivedValueContext,
@@ -37,66 +55,103 @@ class TokenError(Exception):
 @service
 class TokenProcessor:
     @staticmethod
-    def find_and_replace_tokens[T](person: Person, data_class: T) -> T:
-        if not is_dataclass(data_class):
-            return data_class
-        for class_field in fields(data_class):
-            value = getattr(data_class, class_field.name)
-            if isinstance(value, str):
-                setattr(data_class, class_field.name, TokenProcessor.replace_token(value, person))
-            elif isinstance(value, list):
-                TokenProcessor.process_list(class_field, data_class, person, value)
-            elif isinstance(value, dict):
-                TokenProcessor.process_dict(class_field, data_class, person, value)
-            elif is_dataclass(value):
-                setattr(data_class, class_field.name, TokenProcessor.find_and_replace_tokens(person, value))
-        return data_class
+    def replace_result_tokens(person: Person, summary: IterationResultSummary) -> IterationResultSummary:
+        """A copy of the summary with the tokens replaced in every text of its results: the status text, the cohort
+        results' codes, descriptions and rules, and any actions. The campaign and active iteration they were calculated
+        for are left as they are, being config rather than results, as is the summary itself."""
+        result = summary.iteration_result
+        iteration_result = replace(
+            result,
+            status_text=StatusText(TokenProcessor.replace_token(result.status_text, person)),
+            cohort_results=[
+                TokenProcessor.replace_cohort_result_tokens(person, cohort_result)
+                for cohort_result in result.cohort_results
+            ],
+            actions=result.actions
+            and [TokenProcessor.replace_suggested_action_tokens(person, action) for action in result.actions],
+        )
+        cohort_results = summary.cohort_results and {
+            label: TokenProcessor.replace_cohort_result_tokens(person, cohort_result)
+            for label, cohort_result in summary.cohort_results.items()
+        }
+        return replace(summary, iteration_result=iteration_result, cohort_results=cohort_results)
 
     @staticmethod
-    def process_dict(class_field: Field, data_class: object, person: Person, value: dict[Any, Any]) -> None:
-        for key, dict_value in value.items():
-            if isinstance(dict_value, str):
-                value[key] = TokenProcessor.replace_token(dict_value, person)
-            elif is_dataclass(dict_value):
-                value[key] = TokenProcessor.find_and_replace_tokens(person, dict_value)
-        setattr(data_class, class_field.name, value)
+    def replace_action_tokens(person: Person, action_detail: MatchedActionDetail) -> MatchedActionDetail:
+        """A copy of the action detail with the tokens replaced in every text of it: the rule name, the status text
+        override, and its actions. The action detail itself is left as it is."""
+        return replace(
+            action_detail,
+            rule_name=action_detail.rule_name
+            and campaign_config.RuleName(TokenProcessor.replace_token(action_detail.rule_name, person)),
+            actions=action_detail.actions
+            and [TokenProcessor.replace_suggested_action_tokens(person, action) for action in action_detail.actions],
+            status_text_override=action_detail.status_text_override
+            and StatusText(TokenProcessor.replace_token(action_detail.status_text_override, person)),
+        )
 
     @staticmethod
-    def process_list(class_field: Field, data_class: object, person: Person, value: list[Any]) -> None:
-        for i, item in enumerate(value):
-            if is_dataclass(item):
-                value[i] = TokenProcessor.find_and_replace_tokens(person, item)
-            elif isinstance(item, str):
-                value[i] = TokenProcessor.replace_token(item, person)
-            setattr(data_class, class_field.name, value)
+    def replace_cohort_result_tokens(person: Person, cohort_result: CohortGroupResult) -> CohortGroupResult:
+        return replace(
+            cohort_result,
+            cohort_code=TokenProcessor.replace_token(cohort_result.cohort_code, person),
+            description=cohort_result.description and TokenProcessor.replace_token(cohort_result.description, person),
+            reasons=[TokenProcessor.replace_reason_tokens(person, reason) for reason in cohort_result.reasons],
+            audit_rules=[TokenProcessor.replace_reason_tokens(person, reason) for reason in cohort_result.audit_rules],
+        )
+
+    @staticmethod
+    def replace_reason_tokens(person: Person, reason: Reason) -> Reason:
+        return replace(
+            reason,
+            rule_name=RuleName(TokenProcessor.replace_token(reason.rule_name, person)),
+            rule_code=reason.rule_code and RuleCode(TokenProcessor.replace_token(reason.rule_code, person)),
+            rule_priority=RulePriority(TokenProcessor.replace_token(reason.rule_priority, person)),
+            rule_text=reason.rule_text and RuleText(TokenProcessor.replace_token(reason.rule_text, person)),
+        )
+
+    @staticmethod
+    def replace_suggested_action_tokens(person: Person, action: SuggestedAction) -> SuggestedAction:
+        return replace(
+            action,
+            action_type=ActionType(TokenProcessor.replace_token(action.action_type, person)),
+            action_code=ActionCode(TokenProcessor.replace_token(action.action_code, person)),
+            action_description=action.action_description
+            and ActionDescription(TokenProcessor.replace_token(action.action_description, person)),
+            url_label=action.url_label and UrlLabel(TokenProcessor.replace_token(action.url_label, person)),
+            internal_action_code=action.internal_action_code
+            and InternalActionCode(TokenProcessor.replace_token(action.internal_action_code, person)),
+        )
 
     @staticmethod
     def replace_token(text: str, person: Person) -> str:
-        if not isinstance(text, str):
+        if not isinstance(text, str) or "[[" not in text:
             return text
 
-        pattern = r"\[\[.*?\]\]"
-        all_tokens = re.findall(pattern, text, re.IGNORECASE)
-        present_attributes = {attribute.get("ATTRIBUTE_TYPE") for attribute in person.data}
+        template = TokenParser.compile(text)
+        if not template.tokens:
+            return text
 
-        for token in all_tokens:
-            replacement = TokenProcessor.get_token_replacement(token, person.data, present_attributes)
-            text = text.replace(token, str(replacement))
-        return text
+        present_attributes = person.attribute_types
+        replacements = [
+            str(TokenProcessor.get_token_replacement(token, parsed_token, person, present_attributes))
+            for token, parsed_token in template.tokens
+        ]
+        return template.render(replacements)
 
     @staticmethod
-    def get_token_replacement(token: str, person_data: list[dict], present_attributes: set) -> str:
-        parsed_token = TokenParser.parse(token)
-
+    def get_token_replacement(
+        token: str, parsed_token: ParsedToken, person: Person, present_attributes: Collection[str]
+    ) -> str:
         if TokenProcessor.should_replace_with_empty(parsed_token, present_attributes):
             return ""
 
         if parsed_token.function_name:
-            return TokenProcessor.get_derived_value(parsed_token, person_data, present_attributes, token)
+            return TokenProcessor.get_derived_value(parsed_token, person, present_attributes, token)
 
         TokenProcessor.validate_target_attribute(parsed_token, token)
 
-        found_attribute, key_to_replace = TokenProcessor.find_matching_attribute(parsed_token, person_data)
+        found_attribute, key_to_replace = TokenProcessor.find_matching_attribute(parsed_token, person)
 
         if not found_attribute or not key_to_replace:
             TokenProcessor.handle_token_not_found(parsed_token, token)
@@ -108,8 +163,8 @@ class TokenProcessor:
     @staticmethod
     def get_derived_value(
         parsed_token: ParsedToken,
-        person_data: list[dict],
-        present_attributes: set,
+        person: Person,
+        present_attributes: Collection[str],
         token: str,
     ) -> str:
         """Calculate a derived value using the registered handler.
@@ -121,7 +176,7 @@ class TokenProcessor:
 
         Args:
             parsed_token: The parsed token containing function information
-            person_data: List of person attribute dictionaries
+            person: The person whose data the value is derived from
             present_attributes: Set of attribute types present in person data
             token: The original token string for error messages
 
@@ -160,7 +215,8 @@ class TokenProcessor:
             )
 
             context = DerivedValueContext(
-                person_data=person_data,
+                person_data=person.data,
+                person=person,
                 attribute_name=parsed_token.attribute_name,
                 source_attribute=source_attribute,
                 function_args=parsed_token.function_args,
@@ -177,7 +233,7 @@ class TokenProcessor:
             raise ValueError(message) from e
 
     @staticmethod
-    def should_replace_with_empty(parsed_token: ParsedToken, present_attributes: set) -> bool:
+    def should_replace_with_empty(parsed_token: ParsedToken, present_attributes: Collection[str]) -> bool:
         is_target_level = parsed_token.attribute_level == TARGET_ATTRIBUTE_LEVEL
         is_allowed_condition = parsed_token.attribute_name in ALLOWED_CONDITIONS.__args__
         is_allowed_target_attr = parsed_token.attribute_value in ALLOWED_TARGET_ATTRIBUTES
@@ -206,14 +262,15 @@ class TokenProcessor:
             TokenProcessor.handle_token_not_found(parsed_token, token)
 
     @staticmethod
-    def find_matching_attribute(parsed_token: ParsedToken, person_data: list[dict]) -> tuple[dict | None, str | None]:
+    def find_matching_attribute(parsed_token: ParsedToken, person: Person) -> tuple[dict | None, str | None]:
         attribute_level_map = {
             TARGET_ATTRIBUTE_LEVEL: parsed_token.attribute_value,
             PERSON_ATTRIBUTE_LEVEL: parsed_token.attribute_name,
         }
         key_to_find = attribute_level_map.get(parsed_token.attribute_level)
 
-        for attribute in person_data:
+        # Only the PERSON row and the row for the named target can ever match, so just look at those.
+        for attribute in person.get_rows(PERSON_ATTRIBUTE_LEVEL, parsed_token.attribute_name.upper()):
             if TokenProcessor.attribute_match(attribute, parsed_token, key_to_find):
                 return attribute, key_to_find
 
@@ -5,22 +5,25 @@ from datetime import UTC, datetime
 from http import HTTPStatus
 from typing import Any
 
-from flask import Blueprint, make_response, request
+from flask import Blueprint, Response, current_app, g, make_response, request
 from flask.typing import ResponseReturnValue
 from wireup import Injected
+from wireup.integration.flask import get_app_container
 
 from eligibility_signposting_api.audit.audit_context import AuditContext
 from eligibility_signposting_api.audit.audit_service import AuditService
 from eligibility_signposting_api.common.api_error_response import (
     NHS_NUMBER_NOT_FOUND_ERROR,
 )
-from eligibility_signposting_api.common.request_validator import validate_request_params
+from eligibility_signposting_api.common.request_validator import (
+    validate_batch_request_params,
+    validate_request_params,
+)
 from eligibility_signposting_api.config.constants import CONSUMER_ID, URL_PREFIX
 from eligibility_signposting_api.model.consumer_mapping import ConsumerId
 from eligibility_signposting_api.model.eligibility_status import Condition, EligibilityStatus, NHSNumber, Status
 from eligibility_signposting_api.services import EligibilityService, UnknownPersonError
 from eligibility_signposting_api.views.response_model import eligibility_response
-from eligibility_signposting_api.views.response_model.eligibility_response import ProcessedSuggestion
 
 STATUS_MAPPING = {
     Status.actionable: eligibility_response.Status.actionable,
@@ -37,6 +40,16 @@ def before_request() -> None:
     AuditContext.add_request_details(request)
 
 
+@eligibility_blueprint.after_request
+def after_request(response: Response) -> Response:
+    # In a Lambda, the request's audit records must be sent before the response is, failing the request if they can't
+    # be. If they can't, this is called again for the error response, which needn't wait to try them again.
+    if not g.get("audit_records_sent"):
+        g.audit_records_sent = True
+        get_app_container(current_app).get(AuditService).request_finished()
+    return response
+
+
 @eligibility_blueprint.get("/_status")
 def api_status() -> ResponseReturnValue:
     return make_response(build_status_payload(), HTTPStatus.OK, {"Content-Type": "application/json"})
@@ -64,9 +77,41 @@ def check_eligibility(
     except UnknownPersonError:
         return handle_unknown_person_error(nhs_number)
     else:
-        response: eligibility_response.EligibilityResponse = build_eligibility_response(eligibility_status)
+        response = build_eligibility_payload(eligibility_status)
         AuditContext.write_audit_record(audit_service)
-        return make_response(response.model_dump(by_alias=True, mode="json", exclude_none=True), HTTPStatus.OK)
+        return make_response(response, HTTPStatus.OK)
+
+
+@eligibility_blueprint.post("/_batch")
+@validate_batch_request_params()
+def check_eligibility_batch(
+    eligibility_service: Injected[EligibilityService], audit_service: Injected[AuditService]
+) -> ResponseReturnValue:
+    nhs_numbers = [NHSNumber(nhs_number) for nhs_number in dict.fromkeys(request.get_json()["nhsNumbers"])]
+    logger.info("checking %d nhs_numbers in %r", len(nhs_numbers), eligibility_service)
+
+    query_params = _get_or_default_query_params()
+    consumer_id = _get_consumer_id_from_headers()
+
+    results: list[dict[str, Any]] = []
+    for nhs_number, eligibility_status in eligibility_service.get_eligibility_statuses(
+        nhs_numbers,
+        query_params["includeActions"],
+        query_params["conditions"],
+        query_params["category"],
+        consumer_id,
+    ):
+        if eligibility_status is None:
+            diagnostics = f"NHS Number '{nhs_number}' was not recognised by the Eligibility Signposting API"
+            logger.error(diagnostics)
+            results.append({"nhsNumber": nhs_number, "diagnostics": diagnostics})
+        else:
+            response = build_eligibility_payload(eligibility_status)
+            AuditContext.write_batch_audit_record(audit_service, nhs_number)
+            results.append({"nhsNumber": nhs_number, "eligibility": response})
+        AuditContext.start_next_batch_audit_record()
+
+    return make_response({"results": results}, HTTPStatus.OK)
 
 
 def _get_consumer_id_from_headers() -> ConsumerId:
@@ -115,82 +160,60 @@ def handle_unknown_person_error(nhs_number: NHSNumber) -> ResponseReturnValue:
     )
 
 
-def build_eligibility_response(eligibility_status: EligibilityStatus) -> eligibility_response.EligibilityResponse:
-    """Return an object representing the API response we are going to send, given an evaluation of the person's
-    eligibility."""
-
-    processed_suggestions = []
-
-    for condition in eligibility_status.conditions:
-        suggestions = ProcessedSuggestion(  # pyright: ignore[reportCallIssue]
-            condition=eligibility_response.ConditionName(condition.condition_name),  # pyright: ignore[reportCallIssue]
-            status=STATUS_MAPPING[condition.status],
-            statusText=eligibility_response.StatusText(condition.status_text),  # pyright: ignore[reportCallIssue]
-            eligibilityCohorts=build_eligibility_cohorts(condition),  # pyright: ignore[reportCallIssue]
-            suitabilityRules=build_suitability_results(condition),  # pyright: ignore[reportCallIssue]
-            actions=build_actions(condition),
-        )
-
-        processed_suggestions.append(suggestions)
+def build_eligibility_payload(eligibility_status: EligibilityStatus) -> dict[str, Any]:
+    """Return the API response we are going to send as JSON-ready data, given an evaluation of the person's
+    eligibility. It follows `eligibility_response.EligibilityResponse` as dumped by alias in JSON mode without nulls,
+    but is built straight from the evaluation, without constructing and validating the models and then dumping them
+    again, as this is done for every person asked about."""
 
     response_id = uuid.uuid4()
     updated = eligibility_response.LastUpdated(datetime.now(tz=UTC))
 
     AuditContext.add_response_details(response_id, updated)
 
-    return eligibility_response.EligibilityResponse(  # pyright: ignore[reportCallIssue]
-        responseId=response_id,  # pyright: ignore[reportCallIssue]
-        meta=eligibility_response.Meta(lastUpdated=updated),
-        # pyright: ignore[reportCallIssue]
-        processedSuggestions=processed_suggestions,
-    )
+    return {
+        "responseId": str(response_id),
+        "meta": {"lastUpdated": updated.isoformat()},
+        "processedSuggestions": [build_suggestion_payload(condition) for condition in eligibility_status.conditions],
+    }
 
 
-def build_actions(condition: Condition) -> list[eligibility_response.Action] | None:
+def build_suggestion_payload(condition: Condition) -> dict[str, Any]:
+    """The processed suggestion for a condition, following `eligibility_response.ProcessedSuggestion`. Only cohorts
+    with the condition's status and a description are shown, and suitability rules only when not actionable."""
+    suggestion: dict[str, Any] = {
+        "condition": condition.condition_name,
+        "status": STATUS_MAPPING[condition.status].value,
+        "statusText": condition.status_text,
+        "eligibilityCohorts": [
+            {
+                "cohortCode": cohort_result.cohort_code,
+                "cohortText": cohort_result.description,
+                "cohortStatus": STATUS_MAPPING[cohort_result.status].value,
+            }
+            for cohort_result in condition.cohort_results
+            if cohort_result and condition.status == cohort_result.status and cohort_result.description
+        ],
+        "suitabilityRules": [
+            {"ruleType": reason.rule_type.value, "ruleCode": reason.rule_code, "ruleText": reason.rule_text}
+            for reason in condition.suitability_rules
+            if reason.rule_text
+        ]
+        if condition.status == Status.not_actionable
+        else [],
+    }
     if condition.actions is not None:
-        return [
-            eligibility_response.Action(
-                actionType=eligibility_response.ActionType(action.action_type),
-                actionCode=eligibility_response.ActionCode(action.action_code),
-                description=eligibility_response.Description(action.action_description or ""),
-                urlLabel=eligibility_response.UrlLabel(action.url_label or ""),
-                urlLink=eligibility_response.UrlLink(str(action.url_link))
-                if action.url_link
-                else eligibility_response.UrlLink(""),
-            )
+        suggestion["actions"] = [
+            {
+                "actionType": action.action_type,
+                "actionCode": action.action_code,
+                "description": action.action_description or "",
+                "urlLink": str(action.url_link) if action.url_link else "",
+                "urlLabel": action.url_label or "",
+            }
             for action in condition.actions
         ]
-
-    return None
-
-
-def build_eligibility_cohorts(condition: Condition) -> list[eligibility_response.EligibilityCohort]:
-    """Group Iteration cohorts and make only one entry per cohort group"""
-
-    return [
-        eligibility_response.EligibilityCohort(
-            cohortCode=eligibility_response.CohortCode(cohort_result.cohort_code),
-            cohortText=eligibility_response.CohortText(cohort_result.description),
-            cohortStatus=STATUS_MAPPING[cohort_result.status],
-        )
-        for cohort_result in condition.cohort_results
-        if cohort_result and condition.status == cohort_result.status and cohort_result.description
-    ]
-
-
-def build_suitability_results(condition: Condition) -> list[eligibility_response.SuitabilityRule]:
-    if condition.status != Status.not_actionable:
-        return []
-
-    return [
-        eligibility_response.SuitabilityRule(
-            ruleType=eligibility_response.RuleType(reason.rule_type.value),
-            ruleCode=eligibility_response.RuleCode(reason.rule_code),
-            ruleText=eligibility_response.RuleText(reason.rule_text),
-        )
-        for reason in condition.suitability_rules
-        if reason.rule_text
-    ]
+    return suggestion
 
 
 def build_status_payload() -> dict:
@@ -63,7 +63,7 @@ class ProcessedSuggestion(BaseModel):
     status_text: StatusText = Field(..., alias="statusText")
     eligibility_cohorts: list[EligibilityCohort] = Field(..., alias="eligibilityCohorts")
     suitability_rules: list[SuitabilityRule] = Field(..., alias="suitabilityRules")
-    actions: list[Action] | None
+    actions: list[Action] | None = None
 
     model_config = {"populate_by_name": True}
 
@@ -33,8 +33,10 @@ from eligibility_signposting_api.model.campaign_config import (
 from eligibility_signposting_api.model.consumer_mapping import ConsumerCampaign, ConsumerId, ConsumerMapping
 from eligibility_signposting_api.processors.hashing_service import HashingService, HashSecretName
 from eligibility_signposting_api.repos import SecretRepo
-from eligibility_signposting_api.repos.campaign_repo import BucketName, campaign_config_cache
+from eligibility_signposting_api.repos.campaign_repo import BucketName, campaign_config_cache, campaign_object_cache
+from eligibility_signposting_api.repos.consumer_mapping_repo import consumer_mapping_cache
 from eligibility_signposting_api.repos.person_repo import TableName
+from eligibility_signposting_api.repos.secret_repo import secret_cache
 from tests.fixtures.builders.model import rule
 from tests.fixtures.builders.model.rule import RulesMapperFactory
 from tests.fixtures.builders.repos.person import person_rows_builder
@@ -106,6 +108,9 @@ def moto_server(request: pytest.FixtureRequest) -> URL:
 @pytest.fixture(autouse=True)
 def clear_cache():
     campaign_config_cache.clear()
+    campaign_object_cache.clear()
+    consumer_mapping_cache.clear()
+    secret_cache.clear()
 
 
 def is_responsive(url: URL) -> bool:
@@ -0,0 +1,33 @@
+import gzip
+import json
+
+import pytest
+
+from eligibility_signposting_api.audit.aggregation import aggregate_records, deaggregate_records
+
+RECORDS = [{"response": {"responseId": f"response-{n}"}, "text": "line\nbreak, café"} for n in range(3)]
+
+
+def json_line(record: dict) -> bytes:
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_aggregates_unpack_to_the_records_packed(compress: bool):  # noqa: FBT001
+    data = aggregate_records((json_line(record) for record in RECORDS), compress=compress)
+
+    assert deaggregate_records(data) == RECORDS
+
+
+def test_uncompressed_aggregate_is_the_json_lines_one_after_another():
+    assert aggregate_records([json_line(record) for record in RECORDS]) == b"".join(map(json_line, RECORDS))
+
+
+def test_compressed_aggregate_is_gzip():
+    data = aggregate_records([json_line(record) for record in RECORDS], compress=True)
+
+    assert gzip.decompress(data) == b"".join(map(json_line, RECORDS))
+
+
+def test_single_records_are_unpacked_too():
+    assert deaggregate_records(json_line(RECORDS[0])) == [RECORDS[0]]
@@ -523,7 +523,7 @@ def test_write_audit_record_calls_audit_service_with_correct_data_from_g(app):
         assert g.audit_log.response.response_id == response_id
         assert g.audit_log.response.last_updated == last_updated
 
-        mock_audit_service.audit.assert_called_once_with(g.audit_log.model_dump(by_alias=True))
+        mock_audit_service.audit_event.assert_called_once_with(g.audit_log)
 
 
 def test_no_duplicates_returns_same_list():
@@ -0,0 +1,98 @@
+import json
+from datetime import UTC, datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+
+from eligibility_signposting_api.audit.audit_models import (
+    AuditAction,
+    AuditCondition,
+    AuditEligibilityCohorts,
+    AuditEvent,
+    AuditFilterRule,
+    AuditRedirectRule,
+    RequestAuditData,
+    RequestAuditHeader,
+    ResponseAuditData,
+)
+
+RESPONSE_ID = UUID("5b1b0a43-6c0e-4a5c-9f0a-0d6ce7a1a2b3")
+
+
+def audit_event(text: str = "You should have the RSV vaccine", timestamp: datetime | None = None) -> AuditEvent:
+    timestamp = timestamp or datetime(2025, 6, 1, 12, 30, 15, 123456, tzinfo=UTC)
+    return AuditEvent(
+        request=RequestAuditData(
+            request_timestamp=timestamp,
+            headers=RequestAuditHeader(x_request_id="request-1"),
+            nhs_number="9990001112",
+        ),
+        response=ResponseAuditData(
+            response_id=RESPONSE_ID,
+            last_updated=timestamp,
+            condition=[
+                AuditCondition(
+                    campaign_id="RSV_campaign",
+                    campaign_version=3,
+                    condition_name="RSV",
+                    status="actionable",
+                    status_text=text,
+                    eligibility_cohorts=[AuditEligibilityCohorts(cohort_code="rsv_75_rolling", cohort_status=text)],
+                    eligibility_cohort_groups=[],
+                    filter_rules=[AuditFilterRule(rule_priority="10", rule_name=text)],
+                    action_rule=AuditRedirectRule(rule_priority="20", rule_name="book"),
+                    actions=[AuditAction(action_code="BookNBS", action_description=text)],
+                )
+            ],
+        ),
+    )
+
+
+def test_json_line_is_the_audit_pipeline_format():
+    event = AuditEvent(
+        request=RequestAuditData(request_timestamp=datetime(2025, 6, 1, 12, 30, tzinfo=UTC), nhs_number="9990001112"),
+        response=ResponseAuditData(response_id=RESPONSE_ID, condition=[AuditCondition(condition_name="RSV")]),
+    )
+
+    assert event.to_json_line() == (
+        b'{"request": {"requestTimestamp": "2025-06-01 12:30:00+00:00", "headers": {"xRequestId": null, '
+        b'"xCorrelationId": null, "nhsdEndUserOrganisationOds": null, "nhsdApplicationId": null, '
+        b'"nhseProductId": null}, "queryParams": {"category": null, "conditions": null, "includeActions": null}, '
+        b'"nhsNumber": "9990001112"}, "response": {"responseId": "5b1b0a43-6c0e-4a5c-9f0a-0d6ce7a1a2b3", '
+        b'"lastUpdated": null, "condition": [{"campaignId": null, "campaignVersion": null, "iterationId": null, '
+        b'"iterationVersion": null, "conditionName": "RSV", "status": null, "statusText": null, '
+        b'"eligibilityCohorts": null, "eligibilityCohortGroups": null, "filterRules": null, '
+        b'"suitabilityRules": null, "actionRule": null, "actions": [], "statusTextOverride": null}]}}\n'
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "You should have the RSV vaccine",
+        "",
+        'Quotes " and \\ backslashes, commas: colons, and [[TOKENS]]',
+        'Separators inside strings ",\n" and "]\n}"',
+        "Control characters \n \r \t \b \f \x00 \x1f and DEL \x7f",
+        "Non-ASCII caf\u00e9, \u2013 dashes, \u2028 and \U0001f600",
+    ],
+)
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        datetime(2025, 6, 1, 12, 30, 15, 123456, tzinfo=UTC),
+        datetime(2025, 6, 1, 12, 30, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+        datetime(2025, 6, 1),  # noqa: DTZ001
+    ],
+)
+def test_json_line_matches_json_dumps_of_model_dump(text: str, timestamp: datetime):
+    event = audit_event(text, timestamp)
+
+    expected = (json.dumps(event.model_dump(by_alias=True), default=str) + "\n").encode("utf-8")
+    assert event.to_json_line() == expected
+
+
+def test_model_dump_keeps_datetimes():
+    event = audit_event()
+
+    assert isinstance(event.model_dump(by_alias=True)["request"]["requestTimestamp"], datetime)
@@ -0,0 +1,287 @@
+import base64
+import json
+import logging
+import threading
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from eligibility_signposting_api.audit import audit_service
+from eligibility_signposting_api.audit.aggregation import deaggregate_records
+from eligibility_signposting_api.audit.audit_models import AuditEvent, RequestAuditData, ResponseAuditData
+from eligibility_signposting_api.audit.audit_service import AuditDeliveryError, AuditService
+
+STREAM_NAME = "test-kinesis-audit-stream"
+
+
+@pytest.fixture
+def kinesis_client():
+    with mock_aws():
+        client = boto3.client("kinesis", region_name="eu-west-1")
+        client.create_stream(StreamName=STREAM_NAME, ShardCount=1)
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    monkeypatch.setattr(audit_service, "RETRY_BACKOFF_SECONDS", 0)
+
+
+def read_stream(kinesis_client) -> list[bytes]:
+    shard_id = kinesis_client.describe_stream(StreamName=STREAM_NAME)["StreamDescription"]["Shards"][0]["ShardId"]
+    iterator = kinesis_client.get_shard_iterator(
+        StreamName=STREAM_NAME, ShardId=shard_id, ShardIteratorType="TRIM_HORIZON"
+    )["ShardIterator"]
+    return [record["Data"] for record in kinesis_client.get_records(ShardIterator=iterator)["Records"]]
+
+
+def response_id(number: int) -> str:
+    return str(UUID(int=number))
+
+
+def audit_event(number: int) -> AuditEvent:
+    return AuditEvent(
+        request=RequestAuditData(nhs_number="1234567890"), response=ResponseAuditData(response_id=UUID(int=number))
+    )
+
+
+def response_ids(records: list[bytes]) -> list[str]:
+    return [json.loads(data)["response"]["responseId"] for data in records]
+
+
+def put_records_response(*error_codes: str | None) -> dict:
+    return {
+        "FailedRecordCount": sum(error_code is not None for error_code in error_codes),
+        "Records": [{"ErrorCode": error_code} if error_code else {"SequenceNumber": "1"} for error_code in error_codes],
+    }
+
+
+def test_records_are_queued_until_flushed(kinesis_client):
+    service = AuditService(kinesis_client, STREAM_NAME)
+
+    service.audit_event(audit_event(1))
+    service.audit_event(audit_event(2))
+
+    assert read_stream(kinesis_client) == []
+    assert service.pending == 2  # noqa: PLR2004
+
+    service.request_finished()
+
+    assert response_ids(read_stream(kinesis_client)) == [response_id(1), response_id(2)]
+    assert service.pending == 0
+
+
+def test_records_are_sent_as_newline_delimited_json(kinesis_client):
+    event = audit_event(1)
+    service = AuditService(kinesis_client, STREAM_NAME)
+
+    service.audit_event(event)
+    service.flush()
+
+    assert read_stream(kinesis_client) == [(json.dumps(event.model_dump(by_alias=True), default=str) + "\n").encode()]
+
+
+def test_full_batch_is_sent_without_waiting_for_the_request_to_finish(kinesis_client, monkeypatch):
+    monkeypatch.setattr(audit_service, "AUDIT_BATCH_MAX_RECORDS", 2)
+    service = AuditService(kinesis_client, STREAM_NAME)
+
+    service.audit_event(audit_event(1))
+    service.audit_event(audit_event(2))
+
+    assert len(read_stream(kinesis_client)) == 2  # noqa: PLR2004
+
+
+def test_records_kinesis_fails_to_accept_are_sent_again():
+    kinesis = MagicMock()
+    kinesis.put_records.side_effect = [
+        put_records_response(None, "ProvisionedThroughputExceededException", None),
+        put_records_response(None),
+    ]
+    service = AuditService(kinesis, STREAM_NAME)
+    for number in [1, 2, 3]:
+        service.audit_event(audit_event(number))
+
+    service.flush()
+
+    retried = kinesis.put_records.call_args_list[1].kwargs["Records"]
+    assert response_ids([record["Data"] for record in retried]) == [response_id(2)]
+    assert service.pending == 0
+
+
+def test_records_still_failing_are_kept_for_the_next_flush():
+    kinesis = MagicMock()
+    kinesis.put_records.side_effect = ClientError({"Error": {"Code": "InternalFailure"}}, "PutRecords")
+    service = AuditService(kinesis, STREAM_NAME)
+    service.audit_event(audit_event(1))
+
+    with pytest.raises(AuditDeliveryError, match="1 audit records could not be sent"):
+        service.flush()
+
+    assert kinesis.put_records.call_count == audit_service.AUDIT_PUT_ATTEMPTS
+    assert service.pending == 1
+
+    kinesis.put_records.side_effect = [put_records_response(None)]
+    service.flush()
+
+    assert service.pending == 0
+
+
+def test_records_beyond_the_buffer_limit_are_logged_rather_than_lost(monkeypatch, caplog):
+    monkeypatch.setattr(audit_service, "AUDIT_MAX_BUFFERED_RECORDS", 1)
+    kinesis = MagicMock()
+    kinesis.put_records.side_effect = ClientError({"Error": {"Code": "InternalFailure"}}, "PutRecords")
+    service = AuditService(kinesis, STREAM_NAME)
+    service.audit_event(audit_event(1))
+    service.audit_event(audit_event(2))
+
+    with caplog.at_level(logging.ERROR), pytest.raises(AuditDeliveryError):
+        service.flush()
+
+    assert service.pending == 1
+    [dropped] = [record for record in caplog.records if record.getMessage().startswith("Audit record dropped")]
+    assert response_ids([base64.b64decode(dropped.data_base64)]) == [response_id(1)]
+
+
+def test_batches_are_split_to_kinesis_limits(monkeypatch):
+    monkeypatch.setattr(audit_service, "KINESIS_PUT_RECORDS_MAX_RECORDS", 2)
+    kinesis = MagicMock()
+    kinesis.put_records.side_effect = lambda **kwargs: put_records_response(*[None] * len(kwargs["Records"]))
+    service = AuditService(kinesis, STREAM_NAME)
+    for number in [1, 2, 3]:
+        service.audit_event(audit_event(number))
+
+    service.flush()
+
+    assert [len(call.kwargs["Records"]) for call in kinesis.put_records.call_args_list] == [2, 1]
+
+
+def test_request_finished_leaves_records_to_the_background_flush():
+    kinesis = MagicMock()
+    service = AuditService(kinesis, STREAM_NAME)
+    service.start_background_flush(interval=3600)
+    service.audit_event(audit_event(1))
+
+    service.request_finished()
+
+    kinesis.put_records.assert_not_called()
+    assert service.pending == 1
+
+
+def test_background_flush_sends_a_full_batch_without_the_request_waiting(monkeypatch):
+    monkeypatch.setattr(audit_service, "AUDIT_BATCH_MAX_RECORDS", 1)
+    sent = threading.Event()
+    kinesis = MagicMock()
+    kinesis.put_records.side_effect = lambda **_: sent.set() or put_records_response(None)
+    service = AuditService(kinesis, STREAM_NAME)
+    service.start_background_flush(interval=3600)
+
+    service.audit_event(audit_event(1))
+
+    assert sent.wait(timeout=5)
+
+
+def test_request_finished_raises_when_records_cannot_be_sent():
+    kinesis = MagicMock()
+    kinesis.put_records.side_effect = [put_records_response("InternalFailure")] * audit_service.AUDIT_PUT_ATTEMPTS
+    service = AuditService(kinesis, STREAM_NAME)
+    service.audit_event(audit_event(1))
+
+    with pytest.raises(AuditDeliveryError):
+        service.request_finished()
+
+    assert service.pending == 1
+
+
+@pytest.mark.parametrize("aggregation", ["none", "lines"])
+def test_request_finished_does_not_raise_for_records_of_earlier_requests(monkeypatch, aggregation):
+    monkeypatch.setattr(audit_service, "AUDIT_AGGREGATION", aggregation)
+    kinesis = MagicMock()
+    kinesis.put_records.side_effect = ClientError({"Error": {"Code": "InternalFailure"}}, "PutRecords")
+    service = AuditService(kinesis, STREAM_NAME)
+    service.audit_event(audit_event(1))
+    with pytest.raises(AuditDeliveryError):
+        service.request_finished()
+
+    kinesis.put_records.side_effect = lambda **kwargs: put_records_response(
+        *[
+            "InternalFailure" if response_ids([record["Data"]]) == [response_id(1)] else None
+            for record in kwargs["Records"]
+        ]
+    )
+    service.audit_event(audit_event(2))
+    service.request_finished()
+
+    assert service.pending == 1
+
+
+def test_request_finished_raises_for_its_own_records_in_a_failed_aggregate(monkeypatch):
+    monkeypatch.setattr(audit_service, "AUDIT_AGGREGATION", "lines")
+    kinesis = MagicMock()
+    kinesis.put_records.side_effect = ClientError({"Error": {"Code": "InternalFailure"}}, "PutRecords")
+    service = AuditService(kinesis, STREAM_NAME)
+    service.audit_event(audit_event(1))
+    with pytest.raises(AuditDeliveryError):
+        service.request_finished()
+
+    service.audit_event(audit_event(1))
+    with pytest.raises(AuditDeliveryError, match="1 audit records"):
+        service.request_finished()
+
+    assert service.pending == 2  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("aggregation", ["lines", "gzip"])
+def test_records_with_the_same_partition_key_are_aggregated(kinesis_client, monkeypatch, aggregation):
+    monkeypatch.setattr(audit_service, "AUDIT_AGGREGATION", aggregation)
+    service = AuditService(kinesis_client, STREAM_NAME)
+    numbers = range(20)
+    for number in numbers:
+        service.audit_event(audit_event(number))
+
+    service.flush()
+
+    sent = read_stream(kinesis_client)
+    partition_keys = {AuditService.get_partition_key(response_id(number)) for number in numbers}
+    assert len(sent) == len(partition_keys)
+    records = [record for data in sent for record in deaggregate_records(data)]
+    assert sorted(record["response"]["responseId"] for record in records) == sorted(map(response_id, numbers))
+    for data in sent:
+        keys = [
+            AuditService.get_partition_key(record["response"]["responseId"]) for record in deaggregate_records(data)
+        ]
+        assert len(set(keys)) == 1
+
+
+def test_aggregates_are_limited_in_size(kinesis_client, monkeypatch):
+    monkeypatch.setattr(audit_service, "AUDIT_AGGREGATION", "lines")
+    monkeypatch.setattr(audit_service, "AUDIT_AGGREGATE_MAX_BYTES", len(audit_event(1).to_json_line()) * 2)
+    service = AuditService(kinesis_client, STREAM_NAME)
+    for _ in range(3):
+        service.audit_event(audit_event(1))
+
+    service.flush()
+
+    assert [len(deaggregate_records(data)) for data in read_stream(kinesis_client)] == [2, 1]
+
+
+def test_aggregates_kinesis_fails_to_accept_are_kept_whole(monkeypatch):
+    monkeypatch.setattr(audit_service, "AUDIT_AGGREGATION", "gzip")
+    kinesis = MagicMock()
+    kinesis.put_records.side_effect = ClientError({"Error": {"Code": "InternalFailure"}}, "PutRecords")
+    service = AuditService(kinesis, STREAM_NAME)
+    service.audit_event(audit_event(1))
+    service.audit_event(audit_event(1))
+    with pytest.raises(AuditDeliveryError):
+        service.flush()
+    assert service.pending == 1
+
+    kinesis.put_records.side_effect = [put_records_response(None, None)]
+    service.audit_event(audit_event(1))
+    service.flush()
+
+    sent = kinesis.put_records.call_args.kwargs["Records"]
+    assert [len(deaggregate_records(record["Data"])) for record in sent] == [2, 1]
@@ -0,0 +1,92 @@
+import json
+from pathlib import Path
+
+import pytest
+from faker import Faker
+from hamcrest import assert_that, contains_exactly, has_entries, has_key, is_not
+
+from eligibility_signposting_api.bulk.evaluate import main, read_people
+from eligibility_signposting_api.model.campaign_config import CampaignConfig
+from tests.fixtures.builders.model import rule as rule_builder
+from tests.fixtures.builders.repos.person import person_rows_builder
+
+
+def write_config(config_dir: Path, campaign_config: CampaignConfig) -> None:
+    path = config_dir / f"{campaign_config.id}.json"
+    path.write_text(json.dumps({"CampaignConfig": campaign_config.model_dump(by_alias=True, mode="json")}))
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path) -> Path:
+    config_dir = tmp_path / "configs"
+    config_dir.mkdir()
+    write_config(
+        config_dir,
+        rule_builder.CampaignConfigFactory.build(
+            id="rsv",
+            target="RSV",
+            iterations=[
+                rule_builder.IterationFactory.build(
+                    iteration_cohorts=[rule_builder.IterationCohortFactory.build(cohort_label="cohort1")],
+                    iteration_rules=[],
+                )
+            ],
+        ),
+    )
+    return config_dir
+
+
+@pytest.fixture
+def people_file(tmp_path: Path, faker: Faker) -> tuple[Path, list[str]]:
+    nhs_numbers = [faker.nhs_number() for _ in range(5)]
+    path = tmp_path / "people.jsonl"
+    with path.open("w") as people:
+        for index, nhs_number in enumerate(nhs_numbers):
+            cohorts = ["cohort1"] if index % 2 == 0 else ["cohort2"]
+            for row in person_rows_builder(nhs_number, cohorts=cohorts).data:
+                people.write(json.dumps(row) + "\n")
+    return path, nhs_numbers
+
+
+def test_read_people_groups_adjacent_rows():
+    lines = [
+        '{"NHS_NUMBER": "1", "ATTRIBUTE_TYPE": "PERSON"}',
+        '{"NHS_NUMBER": "1", "ATTRIBUTE_TYPE": "COHORTS"}',
+        "",
+        '{"NHS_NUMBER": "2", "ATTRIBUTE_TYPE": "PERSON"}',
+    ]
+
+    people = list(read_people(lines))
+
+    assert [(nhs_number, len(rows)) for nhs_number, rows in people] == [("1", 2), ("2", 1)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_results_are_written_in_input_order(
+    workers: int, config_dir: Path, people_file: tuple[Path, list[str]], tmp_path: Path
+):
+    people_path, nhs_numbers = people_file
+    output = tmp_path / "results.jsonl"
+
+    main(
+        [
+            "--people",
+            str(people_path),
+            "--config-dir",
+            str(config_dir),
+            "--output",
+            str(output),
+            "--workers",
+            str(workers),
+            "--chunk-size",
+            "2",
+        ]
+    )
+
+    results = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [result["nhsNumber"] for result in results] == nhs_numbers
+    assert_that(results[0], is_not(has_key("error")))
+    assert_that(results[0]["processedSuggestions"], contains_exactly(has_entries(condition="RSV", status="Actionable")))
+    assert_that(
+        results[1]["processedSuggestions"], contains_exactly(has_entries(condition="RSV", status="NotEligible"))
+    )
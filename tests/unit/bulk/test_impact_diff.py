@@ -0,0 +1,69 @@
+import json
+from pathlib import Path
+
+import pytest
+from faker import Faker
+
+from eligibility_signposting_api.bulk.impact_diff import main
+from eligibility_signposting_api.model.campaign_config import CampaignConfig
+from tests.fixtures.builders.model import rule as rule_builder
+from tests.fixtures.builders.repos.person import person_rows_builder
+
+
+def write_config(path: Path, campaign_config: CampaignConfig) -> Path:
+    path.write_text(json.dumps({"CampaignConfig": campaign_config.model_dump(by_alias=True, mode="json")}))
+    return path
+
+
+def build_config(**iteration_kwargs) -> CampaignConfig:
+    return rule_builder.CampaignConfigFactory.build(
+        id="rsv",
+        target="RSV",
+        iterations=[
+            rule_builder.IterationFactory.build(
+                iteration_cohorts=[rule_builder.IterationCohortFactory.build(cohort_label="cohort1")],
+                **iteration_kwargs,
+            )
+        ],
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_report_counts_status_changes_and_the_rules_behind_them(workers: int, tmp_path: Path, faker: Faker):
+    before = write_config(tmp_path / "before.json", build_config(iteration_rules=[]))
+    after = write_config(
+        tmp_path / "after.json", build_config(iteration_rules=[rule_builder.ICBFilterRuleFactory.build()])
+    )
+    people = tmp_path / "people.jsonl"
+    with people.open("w") as people_file:
+        for icb, cohorts in [("QE1", ["cohort1"]), ("QE2", ["cohort1"]), ("QE2", ["cohort1"]), ("QE2", ["cohort2"])]:
+            for row in person_rows_builder(faker.nhs_number(), cohorts=cohorts, icb=icb).data:
+                people_file.write(json.dumps(row) + "\n")
+    output = tmp_path / "report.json"
+
+    main(
+        [
+            "--people",
+            str(people),
+            "--before",
+            str(before),
+            "--after",
+            str(after),
+            "--output",
+            str(output),
+            "--workers",
+            str(workers),
+            "--chunk-size",
+            "3",
+        ]
+    )
+
+    report = json.loads(output.read_text())
+    assert report["people"] == 4  # noqa: PLR2004
+    assert report["conditions"]["RSV"]["transitions"] == {
+        "Actionable": {"Actionable": 1, "NotEligible": 2},
+        "NotEligible": {"NotEligible": 1},
+    }
+    assert report["conditions"]["RSV"]["changes"] == {
+        "Actionable -> NotEligible": {"people": 2, "before": {}, "after": {"F:10:Not in QE1": 2}}
+    }
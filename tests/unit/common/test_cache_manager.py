@@ -1,7 +1,15 @@
 """Unit tests for cache_manager module."""
 
+import threading
+import time
+from collections.abc import Callable
+
+import pytest
+
 from eligibility_signposting_api.common.cache_manager import (
     FLASK_APP_CACHE_KEY,
+    ExpiringLruCache,
+    RefreshingCache,
     cache_manager,
 )
 
@@ -148,3 +156,200 @@ class TestCacheManager:
 
         cache_manager.clear_all()
         assert cache_manager.size() == empty_cache_size
+
+
+class FakeTimer:
+    """A clock which only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def wait_until(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestRefreshingCache:
+    """Test the refreshing cache used for config loaded from S3."""
+
+    def test_value_is_loaded_once_within_ttl(self):
+        """Test that the loader is only called again once the value has expired."""
+        timer = FakeTimer()
+        cache: RefreshingCache[str] = RefreshingCache("test", ttl=10, timer=timer)
+        loaded = iter(["first", "second"])
+
+        assert cache.get(lambda: next(loaded)) == "first"
+        timer.now = 9
+        assert cache.get(lambda: next(loaded)) == "first"
+        timer.now = 10
+        assert cache.get(lambda: next(loaded)) == "second"
+        assert cache.metrics.refreshes == 2  # noqa: PLR2004
+
+    def test_clear_forces_a_reload(self):
+        """Test that clearing the cache means the next get loads the value again."""
+        cache: RefreshingCache[str] = RefreshingCache("test", ttl=10, timer=FakeTimer())
+        loaded = iter(["first", "second"])
+        cache.get(lambda: next(loaded))
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get(lambda: next(loaded)) == "second"
+
+    def test_peek_returns_expired_value_without_loading(self):
+        """Test that peek returns whatever value is held, even once expired, and never calls a loader."""
+        timer = FakeTimer()
+        cache: RefreshingCache[str] = RefreshingCache("test", ttl=10, timer=timer)
+        assert cache.peek() is None
+
+        cache.get(lambda: "first")
+        timer.now = 20
+
+        assert cache.peek() == "first"
+        assert cache.metrics.refreshes == 1
+
+    def test_expired_value_is_served_while_refreshing_in_background(self):
+        """Test that with serve_stale, an expired value is returned without waiting for the refresh."""
+        timer = FakeTimer()
+        cache: RefreshingCache[str] = RefreshingCache("test", ttl=10, serve_stale=True, timer=timer)
+        cache.get(lambda: "first")
+        refresh_started, release_refresh = threading.Event(), threading.Event()
+
+        def slow_loader() -> str:
+            refresh_started.set()
+            release_refresh.wait(timeout=5)
+            return "second"
+
+        timer.now = 10
+        assert cache.get(slow_loader) == "first"
+        assert refresh_started.wait(timeout=5)
+        assert cache.get(slow_loader) == "first"
+
+        release_refresh.set()
+        wait_until(lambda: cache.metrics.refreshes == 2)  # noqa: PLR2004
+        timer.now = 11
+        assert cache.get(slow_loader) == "second"
+        assert cache.metrics.stale_hits == 2  # noqa: PLR2004
+        assert cache.metrics.refreshes == 2  # noqa: PLR2004
+
+    def test_failed_background_refresh_keeps_the_stale_value(self):
+        """Test that a failing refresh doesn't lose the value already loaded."""
+        timer = FakeTimer()
+        cache: RefreshingCache[str] = RefreshingCache("test", ttl=10, serve_stale=True, timer=timer)
+        cache.get(lambda: "first")
+
+        def failing_loader() -> str:
+            message = "S3 unavailable"
+            raise RuntimeError(message)
+
+        timer.now = 10
+        assert cache.get(failing_loader) == "first"
+        wait_until(lambda: cache.metrics.failures == 1)
+
+        assert cache.get(lambda: "second") == "first"
+        assert cache.metrics.failures == 1
+
+    def test_failed_initial_load_is_raised(self):
+        """Test that if there is nothing to serve, a load failure is raised to the caller."""
+        cache: RefreshingCache[str] = RefreshingCache("test", ttl=10, serve_stale=True, timer=FakeTimer())
+
+        def failing_loader() -> str:
+            message = "S3 unavailable"
+            raise RuntimeError(message)
+
+        with pytest.raises(RuntimeError, match="S3 unavailable"):
+            cache.get(failing_loader)
+
+    def test_concurrent_callers_share_a_single_load(self):
+        """Test that callers arriving while the value is being loaded wait for that load rather than loading again."""
+        cache: RefreshingCache[int] = RefreshingCache("test", ttl=10, timer=FakeTimer())
+        load_started, release_load = threading.Event(), threading.Event()
+        calls: list[int] = []
+
+        def slow_loader() -> int:
+            calls.append(1)
+            load_started.set()
+            release_load.wait(timeout=5)
+            return len(calls)
+
+        results: list[int] = []
+        first = threading.Thread(target=lambda: results.append(cache.get(slow_loader)))
+        first.start()
+        load_started.wait(timeout=5)
+        others = [threading.Thread(target=lambda: results.append(cache.get(slow_loader))) for _ in range(3)]
+        for thread in others:
+            thread.start()
+        release_load.set()
+        for thread in [first, *others]:
+            thread.join(timeout=5)
+
+        assert results == [1, 1, 1, 1]
+        assert len(calls) == 1
+
+
+class TestExpiringLruCache:
+    """Test the bounded, expiring cache used for person records."""
+
+    def test_values_expire_after_ttl(self):
+        """Test that a value is returned until its ttl has passed."""
+        timer = FakeTimer()
+        cache: ExpiringLruCache[str, str] = ExpiringLruCache("test", ttl=10, max_bytes=100, sizer=len, timer=timer)
+        cache.put("a", "first")
+
+        timer.now = 9
+        assert cache.get("a") == "first"
+        timer.now = 10
+        assert cache.get("a") is None
+        assert (cache.metrics.hits, cache.metrics.misses, cache.metrics.expirations) == (1, 1, 1)
+        assert cache.size_bytes == 0
+
+    def test_least_recently_used_values_are_evicted_to_stay_within_max_bytes(self):
+        """Test that the values used longest ago make way for new ones once the size limit is reached."""
+        cache: ExpiringLruCache[str, str] = ExpiringLruCache("test", ttl=10, max_bytes=10, sizer=len, timer=FakeTimer())
+        cache.put("a", "aaaa")
+        cache.put("b", "bbbb")
+        cache.get("a")
+
+        cache.put("c", "cccc")
+
+        assert cache.get("a") == "aaaa"
+        assert cache.get("b") is None
+        assert cache.get("c") == "cccc"
+        assert cache.size_bytes == 8  # noqa: PLR2004
+        assert cache.metrics.evictions == 1
+
+    def test_value_larger_than_max_bytes_is_not_kept(self):
+        """Test that a value too large for the cache replaces nothing and isn't kept."""
+        cache: ExpiringLruCache[str, str] = ExpiringLruCache("test", ttl=10, max_bytes=4, sizer=len, timer=FakeTimer())
+        cache.put("a", "aaaa")
+
+        cache.put("b", "bbbbb")
+
+        assert cache.get("a") == "aaaa"
+        assert cache.get("b") is None
+
+    def test_replacing_a_value_updates_its_size(self):
+        """Test that putting a value for a key already held replaces the old value and its size."""
+        cache: ExpiringLruCache[str, str] = ExpiringLruCache("test", ttl=10, max_bytes=10, sizer=len, timer=FakeTimer())
+        cache.put("a", "aaaa")
+
+        cache.put("a", "aa")
+
+        assert cache.get("a") == "aa"
+        assert cache.size_bytes == 2  # noqa: PLR2004
+        assert len(cache) == 1
+
+    def test_zero_ttl_disables_the_cache(self):
+        """Test that nothing is kept or counted when the ttl is zero."""
+        cache: ExpiringLruCache[str, str] = ExpiringLruCache("test", ttl=0, max_bytes=10, sizer=len)
+        cache.put("a", "aaaa")
+
+        assert not cache.enabled
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        assert cache.metrics.misses == 0
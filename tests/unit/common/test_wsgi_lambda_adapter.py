@@ -0,0 +1,139 @@
+import base64
+import inspect
+import json
+from typing import Any
+
+import pytest
+from asgiref.wsgi import WsgiToAsgi
+from flask import Flask, Response, request
+from mangum import Mangum, adapter
+
+from eligibility_signposting_api.common.wsgi_lambda_adapter import WsgiLambdaAdapter
+
+
+@pytest.fixture(scope="module")
+def wsgi_app() -> Flask:
+    app = Flask(__name__)
+
+    @app.get("/patient-check/<nhs_number>")
+    def check(nhs_number: str):
+        return {
+            "nhsNumber": nhs_number,
+            "args": request.args.to_dict(flat=False),
+            "header": request.headers.get("nhs-login-nhs-number"),
+            "remoteAddr": request.remote_addr,
+        }
+
+    @app.post("/patient-check/_batch")
+    def batch():
+        return request.get_json(), 201, {"X-Custom": "yes"}
+
+    @app.get("/fhir")
+    def fhir():
+        return Response(json.dumps({"resourceType": "OperationOutcome"}), 404, mimetype="application/fhir+json")
+
+    @app.get("/binary")
+    def binary():
+        return Response(b"\x00\x01\xff", mimetype="application/octet-stream")
+
+    return app
+
+
+def content_length(body: str | None, *, is_base64: bool = False) -> dict[str, str]:
+    if body is None:
+        return {}
+    return {"Content-Length": str(len(base64.b64decode(body) if is_base64 else body.encode()))}
+
+
+def rest_api_event(method: str, path: str, body: str | None = None, **extra: Any) -> dict[str, Any]:
+    headers = {"Content-Type": "application/json", "nhs-login-nhs-number": "9990001112"}
+    return {
+        "resource": "/{proxy+}",
+        "path": path,
+        "httpMethod": method,
+        "headers": headers | content_length(body, is_base64=extra.get("isBase64Encoded", False)),
+        "multiValueHeaders": {},
+        "queryStringParameters": None,
+        "multiValueQueryStringParameters": None,
+        "requestContext": {"identity": {"sourceIp": "192.0.0.1"}},
+        "body": body,
+        "isBase64Encoded": False,
+        **extra,
+    }
+
+
+def http_api_event(method: str, path: str, body: str | None = None, query_string: str = "") -> dict[str, Any]:
+    return {
+        "version": "2.0",
+        "routeKey": "$default",
+        "rawPath": path,
+        "rawQueryString": query_string,
+        "headers": {"content-type": "application/json", "nhs-login-nhs-number": "9990001112"}
+        | {key.lower(): value for key, value in content_length(body).items()},
+        "requestContext": {"http": {"method": method, "path": path, "protocol": "HTTP/1.1", "sourceIp": "127.0.0.1"}},
+        "body": body,
+        "isBase64Encoded": False,
+    }
+
+
+EVENTS = {
+    "rest get": rest_api_event(
+        "GET",
+        "/patient-check/9990001112",
+        multiValueQueryStringParameters={"conditions": ["RSV", "COVID"], "category": ["VACCINATIONS"]},
+    ),
+    "rest post": rest_api_event("POST", "/patient-check/_batch", body=json.dumps({"nhsNumbers": ["1", "2"]})),
+    "rest base64 post": rest_api_event(
+        "POST",
+        "/patient-check/_batch",
+        body=base64.b64encode(b'{"nhsNumbers": ["3"]}').decode(),
+        isBase64Encoded=True,
+    ),
+    "rest fhir error": rest_api_event("GET", "/fhir"),
+    "rest binary": rest_api_event("GET", "/binary"),
+    "rest not found": rest_api_event("GET", "/nowhere"),
+    "http get": http_api_event("GET", "/patient-check/9990001112", query_string="conditions=RSV&category=ALL"),
+    "http post": http_api_event("POST", "/patient-check/_batch", body=json.dumps({"nhsNumbers": ["1"]})),
+    "http fhir error": http_api_event("GET", "/fhir"),
+}
+
+
+@pytest.mark.parametrize("event", EVENTS.values(), ids=EVENTS.keys())
+def test_responses_are_those_mangum_gives_through_asgi(wsgi_app: Flask, event: dict[str, Any]):
+    mangum = Mangum(WsgiToAsgi(wsgi_app), lifespan="off")
+    mangum.config["text_mime_types"].append("application/fhir+json")
+
+    expected = mangum(event, {})
+    actual = WsgiLambdaAdapter(wsgi_app, text_mime_types=["application/fhir+json"])(event, {})
+
+    assert actual == expected
+
+
+def test_body_is_read_without_content_length(wsgi_app: Flask):
+    adapter = WsgiLambdaAdapter(wsgi_app)
+
+    event = rest_api_event("POST", "/patient-check/_batch", body='{"nhsNumbers": ["1"]}')
+    del event["headers"]["Content-Length"]
+
+    response = adapter(event, {})
+
+    assert json.loads(response["body"]) == {"nhsNumbers": ["1"]}
+
+
+def test_unrecognised_events_are_rejected(wsgi_app: Flask):
+    with pytest.raises(RuntimeError, match="Unable to infer a handler"):
+        WsgiLambdaAdapter(wsgi_app)({"unexpected": "event"}, {})
+
+
+def test_mangum_internals_the_adapter_relies_on_are_still_there():
+    # WsgiLambdaAdapter uses mangum's private handler list and default text types, which is why mangum is pinned to
+    # an exact version. If this fails after upgrading it, the adapter needs updating to match.
+    assert adapter.DEFAULT_TEXT_MIME_TYPES
+    assert all(isinstance(mime_type, str) for mime_type in adapter.DEFAULT_TEXT_MIME_TYPES)
+    assert {handler.__name__ for handler in adapter.HANDLERS} >= {"ALB", "HTTPGateway", "APIGateway", "LambdaAtEdge"}
+    for handler in adapter.HANDLERS:
+        assert list(inspect.signature(handler.infer).parameters) == ["event", "context", "config"]
+        assert list(inspect.signature(handler).parameters) == ["event", "context", "config"]
+        assert list(inspect.signature(handler.__call__).parameters) == ["self", "response"]
+        assert isinstance(handler.scope, property)
+        assert isinstance(handler.body, property)
@@ -4,7 +4,7 @@ import pytest
 from yarl import URL
 
 from eligibility_signposting_api.config.config import LOG_LEVEL, AwsAccessKey, AwsRegion, AwsSecretAccessKey, config
-from eligibility_signposting_api.config.constants import STATUS_TEXT_OVERRIDE_ACTION_TYPE
+from eligibility_signposting_api.config.constants import STATUS_TEXT_OVERRIDE_ACTION_TYPE, HashRotationState, env_choice
 from eligibility_signposting_api.repos.campaign_repo import BucketName
 from eligibility_signposting_api.repos.person_repo import TableName
 
@@ -53,3 +53,20 @@ def test_config_without_env_variable():
 
 def test_status_text_override_action_type_constant_value():
     assert STATUS_TEXT_OVERRIDE_ACTION_TYPE == "norender_StatusTextOverride"
+
+
+def test_env_choice_is_the_environment_variable_or_default(monkeypatch):
+    monkeypatch.delenv("HASH_ROTATION_STATE", raising=False)
+    assert env_choice("HASH_ROTATION_STATE", HashRotationState, "unknown") == "unknown"
+
+    monkeypatch.setenv("HASH_ROTATION_STATE", "rotating")
+    assert env_choice("HASH_ROTATION_STATE", HashRotationState, "unknown") == "rotating"
+
+
+def test_env_choice_rejects_values_not_among_the_choices(monkeypatch):
+    monkeypatch.setenv("HASH_ROTATION_STATE", "rotatng")
+
+    with pytest.raises(
+        ValueError, match="HASH_ROTATION_STATE must be one of unknown, rotating, complete, not 'rotatng'"
+    ):
+        env_choice("HASH_ROTATION_STATE", HashRotationState, "unknown")
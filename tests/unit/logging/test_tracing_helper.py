@@ -0,0 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from aws_xray_sdk.core import xray_recorder
+
+from eligibility_signposting_api.logging.tracing_helper import in_current_trace
+
+
+@pytest.fixture
+def segment():
+    segment = xray_recorder.begin_segment("test", sampling=False)
+    yield segment
+    xray_recorder.clear_trace_entities()
+
+
+def test_function_runs_in_the_callers_trace_entity(segment):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(in_current_trace(xray_recorder.get_trace_entity)).result() is segment
+        assert executor.submit(xray_recorder.get_trace_entity).result() is None
+
+
+def test_function_runs_as_it_is_without_a_trace_entity(monkeypatch):
+    monkeypatch.setattr(xray_recorder, "get_trace_entity", lambda: None)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(in_current_trace(lambda x: x + 1), 1).result() == 2  # noqa: PLR2004
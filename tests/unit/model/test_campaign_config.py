@@ -1,12 +1,21 @@
 import json
+from datetime import date
 
 import pytest
 from dateutil.relativedelta import relativedelta
 from faker import Faker
+from freezegun import freeze_time
 from hamcrest import assert_that
 
-from eligibility_signposting_api.model.campaign_config import IterationRule
-from tests.fixtures.builders.model.rule import IterationFactory, RawCampaignConfigFactory
+from eligibility_signposting_api.model.campaign_config import (
+    IterationRule,
+    RuleCode,
+    RuleEntry,
+    RuleName,
+    RulesMapper,
+    RuleText,
+)
+from tests.fixtures.builders.model.rule import IterationFactory, IterationRuleFactory, RawCampaignConfigFactory
 from tests.fixtures.matchers.rules import is_iteration_rule
 
 
@@ -98,3 +107,58 @@ def test_campaign_should_accept_list_of_strings_for_different_role_emails(field_
         match=rf"1 validation error for CampaignConfig\n{field_name}\n\s+Input should be a valid list.*",
     ):
         RawCampaignConfigFactory.build(**kwargs)
+
+
+def test_campaign_live_is_not_frozen_at_first_access():
+    # Given
+    campaign = RawCampaignConfigFactory.build(
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 1, 31),
+        iterations=[IterationFactory.build(iteration_date=date(2025, 1, 1))],
+    )
+
+    # When, Then
+    with freeze_time("2025-01-31 23:59:59+00:00"):
+        assert campaign.campaign_live
+    with freeze_time("2025-02-01 00:00:00+00:00"):
+        assert not campaign.campaign_live
+
+
+def test_current_iteration_moves_on_at_the_next_iteration_datetime():
+    # Given
+    campaign = RawCampaignConfigFactory.build(
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 12, 31),
+        iterations=[
+            IterationFactory.build(id="second", iteration_date=date(2025, 2, 1)),
+            IterationFactory.build(id="first", iteration_date=date(2025, 1, 1)),
+        ],
+    )
+
+    # When, Then
+    with freeze_time("2024-12-31 23:59:59+00:00"), pytest.raises(StopIteration):
+        _ = campaign.current_iteration
+    with freeze_time("2025-01-31 23:59:59+00:00"):
+        assert campaign.current_iteration.id == "first"
+    with freeze_time("2025-02-01 00:00:00+00:00"):
+        assert campaign.current_iteration.id == "second"
+    with freeze_time("2025-01-15 12:00:00+00:00"):
+        assert campaign.current_iteration.id == "first"
+
+
+def test_rule_code_and_text_come_from_the_last_rules_mapper_entry_naming_the_rule():
+    rule = IterationRuleFactory.build(name="RULE", code=None, description="rule description")
+    IterationFactory.build(
+        iteration_rules=[rule],
+        rules_mapper=RulesMapper(
+            root={
+                "FIRST": RuleEntry(RuleNames=[RuleName("RULE")], RuleCode=RuleCode("FIRST"), RuleText=None),
+                "SECOND": RuleEntry(
+                    RuleNames=[RuleName("OTHER"), RuleName("RULE")], RuleCode=None, RuleText=RuleText("second")
+                ),
+            }
+        ),
+    )
+
+    assert rule.rule_code == "RULE"
+    assert rule.rule_text == "second"
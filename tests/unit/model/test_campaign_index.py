@@ -0,0 +1,70 @@
+import datetime as dt
+
+from hamcrest import assert_that, contains_exactly, empty, is_
+
+from eligibility_signposting_api.model.campaign_config import CampaignID
+from eligibility_signposting_api.model.campaign_index import CampaignIndex
+from tests.fixtures.builders.model import rule
+
+YESTERDAY = dt.datetime.now(tz=dt.UTC).date() - dt.timedelta(days=1)
+
+
+def test_campaigns_by_target_filters_by_category_and_conditions():
+    # Given
+    rsv_v = rule.CampaignConfigFactory.build(id="RSV_V", target="RSV", type="V")
+    rsv_s = rule.CampaignConfigFactory.build(id="RSV_S", target="RSV", type="S")
+    flu_v = rule.CampaignConfigFactory.build(id="FLU_V", target="FLU", type="V")
+    index = CampaignIndex([rsv_v, rsv_s, flu_v])
+
+    # When
+    vaccinations = dict(index.campaigns_by_target("VACCINATIONS", ["ALL"]))
+    all_rsv = dict(index.campaigns_by_target("ALL", ["RSV"]))
+
+    # Then
+    assert_that(list(vaccinations), contains_exactly("FLU", "RSV"))
+    assert_that(vaccinations["RSV"], contains_exactly(rsv_v))
+    assert_that(list(all_rsv), contains_exactly("RSV"))
+    assert_that(all_rsv["RSV"], contains_exactly(rsv_s, rsv_v))
+
+
+def test_campaigns_by_target_with_unknown_category():
+    index = CampaignIndex([rule.CampaignConfigFactory.build(target="RSV", type="V")])
+
+    assert_that(list(index.campaigns_by_target("UNKNOWN", ["ALL"])), is_(empty()))
+
+
+def test_restricted_to_is_reused_for_the_same_campaign_ids():
+    # Given
+    camp_a = rule.CampaignConfigFactory.build(id="CAMP_A")
+    camp_b = rule.CampaignConfigFactory.build(id="CAMP_B")
+    index = CampaignIndex([camp_a, camp_b])
+
+    # When
+    first = index.restricted_to([CampaignID("CAMP_B")])
+    second = index.restricted_to(frozenset({CampaignID("CAMP_B")}))
+
+    # Then
+    assert_that(list(first), contains_exactly(camp_b))
+    assert second is first
+
+
+def test_campaigns_sharing_iteration_datetime_are_found_when_loaded():
+    # Given
+    campaigns = [
+        rule.CampaignConfigFactory.build(
+            id=campaign_id,
+            target="RSV",
+            start_date=YESTERDAY,
+            iterations=[rule.IterationFactory.build(iteration_date=YESTERDAY)],
+        )
+        for campaign_id in ("RSV_1", "RSV_2")
+    ]
+    other = rule.CampaignConfigFactory.build(id="FLU_1", target="FLU", start_date=YESTERDAY)
+
+    # When
+    index = CampaignIndex([*campaigns, other])
+
+    # Then
+    iteration_datetime = campaigns[0].iterations[0].iteration_datetime
+    assert_that(index.campaigns_sharing_iteration_datetime("RSV", iteration_datetime), contains_exactly(*campaigns))
+    assert_that(index.campaigns_sharing_iteration_datetime("FLU", iteration_datetime), is_(empty()))
@@ -0,0 +1,109 @@
+from hamcrest import assert_that, contains_exactly, contains_inanyorder, equal_to, is_, none
+
+from eligibility_signposting_api.model.person import Person
+
+
+def test_get_row_returns_first_row_of_attribute_type():
+    # Given
+    person = Person(
+        [
+            {"ATTRIBUTE_TYPE": "COVID", "LAST_SUCCESSFUL_DATE": "20250101"},
+            {"ATTRIBUTE_TYPE": "PERSON", "POSTCODE": "SW19"},
+            {"ATTRIBUTE_TYPE": "COVID", "LAST_SUCCESSFUL_DATE": "20240101"},
+        ]
+    )
+
+    # When, Then
+    assert_that(person.get_row("PERSON"), equal_to({"ATTRIBUTE_TYPE": "PERSON", "POSTCODE": "SW19"}))
+    assert_that(person.get_row("COVID"), equal_to({"ATTRIBUTE_TYPE": "COVID", "LAST_SUCCESSFUL_DATE": "20250101"}))
+    assert_that(person.get_row("RSV"), is_(none()))
+    assert_that(person.get_row(None), is_(none()))
+
+
+def test_get_rows_keeps_data_order_across_attribute_types():
+    # Given
+    person = Person(
+        [
+            {"ATTRIBUTE_TYPE": "COVID", "ORDER": 1},
+            {"ATTRIBUTE_TYPE": "FLU", "ORDER": 2},
+            {"ATTRIBUTE_TYPE": "PERSON", "ORDER": 3},
+            {"ATTRIBUTE_TYPE": "COVID", "ORDER": 4},
+        ]
+    )
+
+    # When
+    actual = person.get_rows("PERSON", "COVID")
+
+    # Then
+    assert_that([row["ORDER"] for row in actual], contains_exactly(1, 3, 4))
+
+
+def test_rows_appended_after_construction_are_indexed():
+    # Given
+    person = Person([{"ATTRIBUTE_TYPE": "PERSON"}])
+
+    # When
+    person.data.append({"ATTRIBUTE_TYPE": "COHORTS", "COHORT_MEMBERSHIPS": []})
+
+    # Then
+    assert_that(person.get_row("COHORTS"), equal_to({"ATTRIBUTE_TYPE": "COHORTS", "COHORT_MEMBERSHIPS": []}))
+    assert_that(person.attribute_types, contains_inanyorder("PERSON", "COHORTS"))
+
+
+def test_index_does_not_affect_equality():
+    # Given
+    indexed = Person([{"ATTRIBUTE_TYPE": "PERSON"}])
+    indexed.get_row("PERSON")
+
+    # When, Then
+    assert_that(indexed, equal_to(Person([{"ATTRIBUTE_TYPE": "PERSON"}])))
+
+
+def test_cohort_labels_are_read_from_cohorts_row():
+    # Given
+    person = Person(
+        [
+            {"ATTRIBUTE_TYPE": "PERSON"},
+            {
+                "ATTRIBUTE_TYPE": "COHORTS",
+                "COHORT_MEMBERSHIPS": [
+                    {"COHORT_LABEL": "cohort_a"},
+                    {"COHORT_LABEL": ""},
+                    {"COHORT_LABEL": "cohort_b"},
+                ],
+            },
+        ]
+    )
+
+    # When, Then
+    assert_that(person.cohort_labels, equal_to({"cohort_a", "cohort_b"}))
+
+
+def test_add_cohort_membership_updates_cached_cohort_labels_without_changing_data():
+    # Given
+    data = [{"ATTRIBUTE_TYPE": "PERSON"}]
+    person = Person(data)
+    assert_that(person.cohort_labels, equal_to(set()))
+    assert_that(person.has_cohorts, is_(False))
+
+    # When
+    person.add_cohort_membership("virtual_cohort")
+
+    # Then
+    assert_that(person.cohort_labels, equal_to({"virtual_cohort"}))
+    assert_that(person.has_cohorts, is_(True))
+    assert_that(person.get_row("COHORTS"), is_(none()))
+    assert_that(data, equal_to([{"ATTRIBUTE_TYPE": "PERSON"}]))
+
+
+def test_added_cohort_memberships_are_not_shared_by_people_with_the_same_data():
+    # Given
+    data = [{"ATTRIBUTE_TYPE": "COHORTS", "COHORT_MEMBERSHIPS": [{"COHORT_LABEL": "cohort_a"}]}]
+    person = Person(data)
+
+    # When
+    person.add_cohort_membership("virtual_cohort")
+
+    # Then
+    assert_that(person.cohort_labels, equal_to({"cohort_a", "virtual_cohort"}))
+    assert_that(Person(data).cohort_labels, equal_to({"cohort_a"}))
@@ -1,10 +1,17 @@
 import io
 import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
 import pytest
 
-from eligibility_signposting_api.repos.campaign_repo import BucketName, CampaignRepo, campaign_config_cache
+from eligibility_signposting_api.repos.campaign_repo import (
+    BucketName,
+    CampaignRepo,
+    campaign_config_cache,
+    campaign_object_cache,
+)
 from tests.fixtures.builders.model.rule import CampaignConfigFactory
 
 
@@ -16,6 +23,7 @@ class TestCampaignRepo:
     @pytest.fixture(autouse=True)
     def clear_cache(self):
         campaign_config_cache.clear()
+        campaign_object_cache.clear()
 
     @pytest.fixture
     def mock_s3_client(self):
@@ -92,3 +100,91 @@ class TestCampaignRepo:
         assert third[0].version == second_config.version
         assert mock_s3_client.list_objects.call_count == expected_call_count
         assert mock_s3_client.get_object.call_count == expected_call_count
+
+    def test_get_campaign_configs_follows_truncated_listings(self, repo, mock_s3_client):
+        first_config = CampaignConfigFactory.build()
+        second_config = CampaignConfigFactory.build()
+        bodies = {
+            "first.json": {"campaign_config": first_config.model_dump(mode="json")},
+            "second.json": {"campaign_config": second_config.model_dump(mode="json")},
+        }
+
+        mock_s3_client.list_objects.side_effect = [
+            {"Contents": [{"Key": "first.json"}], "IsTruncated": True},
+            {"Contents": [{"Key": "second.json"}], "IsTruncated": False},
+        ]
+        mock_s3_client.get_object.side_effect = lambda Bucket, Key: make_s3_body(bodies[Key])  # noqa: ARG005, N803
+
+        result = list(repo.get_campaign_configs("consumer_id"))
+
+        assert [config.id for config in result] == [first_config.id, second_config.id]
+        assert mock_s3_client.list_objects.call_args_list[1].kwargs == {"Bucket": "test-bucket", "Marker": "first.json"}
+
+    def test_get_campaign_configs_only_fetches_changed_objects_on_refresh(self, repo, mock_s3_client):
+        unchanged_config = CampaignConfigFactory.build(version=1)
+        changed_config = CampaignConfigFactory.build(version=1)
+        updated_config = changed_config.model_copy(update={"version": 2})
+        last_modified = datetime(2025, 1, 1, tzinfo=UTC)
+        bodies = {
+            "unchanged.json": [unchanged_config],
+            "changed.json": [changed_config, updated_config],
+        }
+
+        mock_s3_client.list_objects.side_effect = [
+            {
+                "Contents": [
+                    {"Key": "unchanged.json", "ETag": '"a"', "LastModified": last_modified},
+                    {"Key": "changed.json", "ETag": '"b"', "LastModified": last_modified},
+                ]
+            },
+            {
+                "Contents": [
+                    {"Key": "unchanged.json", "ETag": '"a"', "LastModified": last_modified},
+                    {"Key": "changed.json", "ETag": '"c"', "LastModified": last_modified},
+                ]
+            },
+        ]
+        mock_s3_client.get_object.side_effect = lambda Bucket, Key: make_s3_body(  # noqa: ARG005, N803
+            {"campaign_config": bodies[Key].pop(0).model_dump(mode="json")}
+        )
+
+        first = list(repo.get_campaign_configs("consumer_id"))
+        campaign_config_cache.clear()
+        second = list(repo.get_campaign_configs("consumer_id"))
+
+        expected_call_count = 3
+
+        assert [config.version for config in first] == [1, 1]
+        assert [config.version for config in second] == [1, 2]
+        assert second[0] is first[0]
+        assert mock_s3_client.get_object.call_args_list[-1].kwargs == {"Bucket": "test-bucket", "Key": "changed.json"}
+        assert mock_s3_client.get_object.call_count == expected_call_count
+
+    def test_get_campaign_configs_drops_deleted_objects(self, repo, mock_s3_client, rules_payload):
+        mock_s3_client.list_objects.side_effect = [
+            {"Contents": [{"Key": "rsv.json", "ETag": '"a"'}]},
+            {},
+        ]
+        mock_s3_client.get_object.return_value = make_s3_body(rules_payload)
+
+        first = list(repo.get_campaign_configs("consumer_id"))
+        campaign_config_cache.clear()
+        second = list(repo.get_campaign_configs("consumer_id"))
+
+        assert len(first) == 1
+        assert second == []
+        assert campaign_object_cache == {}
+
+    def test_concurrent_loads_for_test_consumers_leave_the_object_cache_whole(self, repo, mock_s3_client):
+        keys = [f"campaign-{n}.json" for n in range(20)]
+        configs = {key: CampaignConfigFactory.build() for key in keys}
+        mock_s3_client.list_objects.return_value = {"Contents": [{"Key": key, "ETag": f'"{key}"'} for key in keys]}
+        mock_s3_client.get_object.side_effect = lambda **kwargs: make_s3_body(
+            {"campaign_config": configs[kwargs["Key"]].model_dump(mode="json")}
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: list(repo.get_campaign_configs("test-consumer")), range(16)))
+
+        assert all([config.id for config in result] == [configs[key].id for key in keys] for result in results)
+        assert sorted(campaign_object_cache) == sorted(keys)
@@ -5,10 +5,23 @@ import pytest
 from botocore.exceptions import ClientError
 
 from eligibility_signposting_api.model.consumer_mapping import ConsumerId
-from eligibility_signposting_api.repos.consumer_mapping_repo import BucketName, ConsumerMappingRepo
+from eligibility_signposting_api.repos.consumer_mapping_repo import (
+    BucketName,
+    ConsumerMappingRepo,
+    consumer_mapping_cache,
+)
+
+
+def make_s3_body(mapping_data: dict, etag: str = '"etag-1"') -> dict:
+    body_json = json.dumps(mapping_data).encode("utf-8")
+    return {"Body": MagicMock(read=lambda: body_json), "ETag": etag}
 
 
 class TestConsumerMappingRepo:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        consumer_mapping_cache.clear()
+
     @pytest.fixture
     def mock_s3_client(self):
         return MagicMock()
@@ -22,7 +35,7 @@ class TestConsumerMappingRepo:
         consumer_id = "user-123"
 
         # The expected output is just the IDs
-        expected_campaign_ids = ["flu-2024", "covid-2024"]
+        expected_campaign_ids = frozenset({"flu-2024", "covid-2024"})
 
         # The mocked S3 data must match the new schema (objects with description)
         mapping_data = {
@@ -79,3 +92,66 @@ class TestConsumerMappingRepo:
             repo.get_permitted_campaign_ids(ConsumerId("any-user"))
 
         assert exc_info.value.response["Error"]["Code"] == "AccessDenied"
+
+    def test_get_permitted_campaign_ids_uses_cache_within_ttl(self, repo, mock_s3_client):
+        # Given
+        mock_s3_client.get_object.return_value = make_s3_body({"user-123": [{"CampaignConfigID": "flu-2024"}]})
+
+        # When
+        first = repo.get_permitted_campaign_ids(ConsumerId("user-123"))
+        second = repo.get_permitted_campaign_ids(ConsumerId("user-456"))
+
+        # Then
+        assert first == frozenset({"flu-2024"})
+        assert second is None
+        mock_s3_client.get_object.assert_called_once()
+
+    def test_get_permitted_campaign_ids_keeps_mapping_when_etag_is_unchanged(self, repo, mock_s3_client, monkeypatch):
+        # Given
+        monkeypatch.setattr(consumer_mapping_cache, "ttl", 0)
+        mock_s3_client.get_object.side_effect = [
+            make_s3_body({"user-123": [{"CampaignConfigID": "flu-2024"}]}),
+            ClientError({"Error": {"Code": "304", "Message": "Not Modified"}}, "GetObject"),
+        ]
+
+        # When
+        first = repo.get_permitted_campaign_ids(ConsumerId("user-123"))
+        second = repo.get_permitted_campaign_ids(ConsumerId("user-123"))
+
+        # Then
+        assert first == second == frozenset({"flu-2024"})
+        mock_s3_client.get_object.assert_called_with(
+            Bucket="test-bucket", Key="consumer_mapping_config.json", IfNoneMatch='"etag-1"'
+        )
+
+    def test_get_permitted_campaign_ids_reloads_when_etag_has_changed(self, repo, mock_s3_client, monkeypatch):
+        # Given
+        monkeypatch.setattr(consumer_mapping_cache, "ttl", 0)
+        mock_s3_client.get_object.side_effect = [
+            make_s3_body({"user-123": [{"CampaignConfigID": "flu-2024"}]}),
+            make_s3_body({"user-123": [{"CampaignConfigID": "covid-2024"}]}, etag='"etag-2"'),
+        ]
+
+        # When
+        first = repo.get_permitted_campaign_ids(ConsumerId("user-123"))
+        second = repo.get_permitted_campaign_ids(ConsumerId("user-123"))
+
+        # Then
+        assert first == frozenset({"flu-2024"})
+        assert second == frozenset({"covid-2024"})
+
+    def test_get_permitted_campaign_ids_bypasses_cache_for_test_consumers(self, repo, mock_s3_client):
+        # Given
+        mock_s3_client.get_object.side_effect = [
+            make_s3_body({"test-user": [{"CampaignConfigID": "flu-2024"}]}),
+            make_s3_body({"test-user": [{"CampaignConfigID": "covid-2024"}]}),
+        ]
+
+        # When
+        first = repo.get_permitted_campaign_ids(ConsumerId("test-user"))
+        second = repo.get_permitted_campaign_ids(ConsumerId("test-user"))
+
+        # Then
+        assert first == frozenset({"flu-2024"})
+        assert second == frozenset({"covid-2024"})
+        assert consumer_mapping_cache.peek() is None
@@ -4,8 +4,9 @@ import boto3
 import pytest
 from moto import mock_aws
 
+from eligibility_signposting_api.common.cache_manager import ExpiringLruCache
 from eligibility_signposting_api.model.person import Person
-from eligibility_signposting_api.repos import NotFoundError, PersonRepo
+from eligibility_signposting_api.repos import NotFoundError, PersonRepo, person_repo
 
 
 @pytest.fixture
@@ -32,10 +33,19 @@ def hashing_service():
     # Simulate deterministic hashes:
     svc.hash_with_current_secret.return_value = "hashed-current"
     svc.hash_with_previous_secret.return_value = "hashed-prev"
+    svc.refresh_secrets.return_value = False
 
     return svc
 
 
+@pytest.fixture
+def person_cache(monkeypatch):
+    """Enable a fresh person record cache for the test."""
+    cache = ExpiringLruCache("test_person_records", ttl=60, max_bytes=10_000, sizer=person_repo.approximate_size)
+    monkeypatch.setattr(person_repo, "person_record_cache", cache)
+    return cache
+
+
 @pytest.fixture
 def repo(dynamodb_setup, hashing_service):
     """PersonRepo instance with moto DynamoDB and mocked hashing."""
@@ -114,3 +124,137 @@ def test_get_eligibility_data_not_found_error(repo, dynamodb_setup, caplog):
     log_text = caplog.text
     assert "AWSCURRENT" in log_text
     assert "AWSPREVIOUS" in log_text
+
+
+def test_get_eligibility_data_tries_again_after_secret_rotation(repo, dynamodb_setup, hashing_service):
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-rotated", "ATTRIBUTE_TYPE": "PERSON"})
+
+    def rotate():
+        hashing_service.hash_with_current_secret.return_value = "hashed-rotated"
+        return True
+
+    hashing_service.refresh_secrets.side_effect = rotate
+
+    result = repo.get_eligibility_data("1234567890")
+
+    assert isinstance(result, Person)
+    hashing_service.refresh_secrets.assert_called_once()
+
+
+def test_get_eligibility_data_does_not_retry_when_secret_has_not_rotated(repo, hashing_service):
+    with pytest.raises(NotFoundError):
+        repo.get_eligibility_data("1234567890")
+
+    hashing_service.hash_with_current_secret.assert_called_once()
+    hashing_service.refresh_secrets.assert_called_once()
+
+
+def test_get_eligibility_data_queries_both_hashes_while_rotating(repo, dynamodb_setup, monkeypatch):
+    monkeypatch.setattr(person_repo, "HASH_ROTATION_STATE", "rotating")
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-prev", "ATTRIBUTE_TYPE": "PERSON"})
+
+    result = repo.get_eligibility_data("1234567890")
+
+    assert result.data[0]["NHS_NUMBER"] == "hashed-prev"
+
+
+def test_get_eligibility_data_prefers_current_hash_while_rotating(repo, dynamodb_setup, monkeypatch):
+    monkeypatch.setattr(person_repo, "HASH_ROTATION_STATE", "rotating")
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-current", "ATTRIBUTE_TYPE": "PERSON"})
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-prev", "ATTRIBUTE_TYPE": "PERSON"})
+
+    result = repo.get_eligibility_data("1234567890")
+
+    assert result.data[0]["NHS_NUMBER"] == "hashed-current"
+
+
+def test_get_eligibility_data_not_found_while_rotating(repo, monkeypatch):
+    monkeypatch.setattr(person_repo, "HASH_ROTATION_STATE", "rotating")
+
+    with pytest.raises(NotFoundError, match="AWSCURRENT and AWSPREVIOUS"):
+        repo.get_eligibility_data("1234567890")
+
+
+def test_get_eligibility_data_skips_previous_hash_once_rotation_is_complete(
+    repo, dynamodb_setup, hashing_service, monkeypatch
+):
+    monkeypatch.setattr(person_repo, "HASH_ROTATION_STATE", "complete")
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-prev", "ATTRIBUTE_TYPE": "PERSON"})
+
+    with pytest.raises(NotFoundError, match=r"checking AWSCURRENT\.$"):
+        repo.get_eligibility_data("1234567890")
+
+    hashing_service.hash_with_previous_secret.assert_not_called()
+
+
+def test_get_eligibility_data_batch_returns_none_for_people_not_found(dynamodb_setup):
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-1111111111", "ATTRIBUTE_TYPE": "PERSON"})
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-3333333333", "ATTRIBUTE_TYPE": "PERSON"})
+
+    hashing_service = MagicMock()
+    hashing_service.hash_with_current_secret.side_effect = lambda nhs_number: f"hashed-{nhs_number}"
+    hashing_service.hash_with_previous_secret.return_value = "hashed-prev"
+    hashing_service.refresh_secrets.return_value = False
+    repo = PersonRepo(table=dynamodb_setup, hashing_service=hashing_service)
+
+    result = repo.get_eligibility_data_batch(["1111111111", "2222222222", "3333333333", "1111111111"])
+
+    assert list(result) == ["1111111111", "2222222222", "3333333333"]
+    assert isinstance(result["1111111111"], Person)
+    assert result["2222222222"] is None
+    assert isinstance(result["3333333333"], Person)
+
+
+def test_get_eligibility_data_is_not_cached_by_default(repo, dynamodb_setup):
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-current", "ATTRIBUTE_TYPE": "PERSON", "AGE": 1})
+    repo.get_eligibility_data("1234567890", "consumer")
+
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-current", "ATTRIBUTE_TYPE": "PERSON", "AGE": 2})
+    result = repo.get_eligibility_data("1234567890", "consumer")
+
+    assert result.data[0]["AGE"] == 2  # noqa: PLR2004
+
+
+def test_get_eligibility_data_uses_cached_items_keyed_by_current_hash(repo, dynamodb_setup, person_cache):
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-current", "ATTRIBUTE_TYPE": "PERSON", "AGE": 1})
+    repo.get_eligibility_data("1234567890", "consumer")
+
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-current", "ATTRIBUTE_TYPE": "PERSON", "AGE": 2})
+    result = repo.get_eligibility_data("1234567890", "consumer")
+
+    assert result.data[0]["AGE"] == 1
+    assert person_cache.get("hashed-current") == result.data
+    assert (person_cache.metrics.hits, person_cache.metrics.misses) == (2, 1)
+
+
+def test_get_eligibility_data_bypasses_cache_for_test_consumers(repo, dynamodb_setup, person_cache):
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-current", "ATTRIBUTE_TYPE": "PERSON", "AGE": 1})
+    repo.get_eligibility_data("1234567890", "consumer")
+
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-current", "ATTRIBUTE_TYPE": "PERSON", "AGE": 2})
+    result = repo.get_eligibility_data("1234567890", "test-consumer")
+
+    assert result.data[0]["AGE"] == 2  # noqa: PLR2004
+    assert person_cache.get("hashed-current")[0]["AGE"] == 1
+
+
+def test_get_eligibility_data_does_not_cache_people_not_found(repo, person_cache):
+    with pytest.raises(NotFoundError):
+        repo.get_eligibility_data("1234567890", "consumer")
+
+    assert len(person_cache) == 0
+
+
+def test_get_eligibility_data_batch_uses_cache(dynamodb_setup, person_cache):
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-1111111111", "ATTRIBUTE_TYPE": "PERSON", "AGE": 1})
+    hashing_service = MagicMock()
+    hashing_service.hash_with_current_secret.side_effect = lambda nhs_number: f"hashed-{nhs_number}"
+    hashing_service.hash_with_previous_secret.return_value = None
+    repo = PersonRepo(table=dynamodb_setup, hashing_service=hashing_service)
+    repo.get_eligibility_data("1111111111", "consumer")
+    dynamodb_setup.put_item(Item={"NHS_NUMBER": "hashed-1111111111", "ATTRIBUTE_TYPE": "PERSON", "AGE": 2})
+
+    result = repo.get_eligibility_data_batch(["1111111111"], "consumer")
+
+    assert result["1111111111"].data[0]["AGE"] == 1
+    assert person_cache.metrics.hits == 1
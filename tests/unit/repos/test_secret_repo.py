@@ -1,8 +1,17 @@
+from unittest.mock import MagicMock
+
 import boto3
 import pytest
+from botocore.exceptions import ClientError
 from moto import mock_aws
 
-from eligibility_signposting_api.repos.secret_repo import SecretRepo
+from eligibility_signposting_api.repos import secret_repo
+from eligibility_signposting_api.repos.secret_repo import SecretRepo, secret_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    secret_cache.clear()
 
 
 @pytest.fixture
@@ -44,3 +53,73 @@ def test_get_secret_previous(repo):
 def test_get_secret_missing(repo):
     result = repo.get_secret_current("does-not-exist")
     assert result == {}
+
+
+def test_get_secret_is_cached_within_ttl(repo, aws_setup):
+    first = repo.get_secret_current("my-secret")
+    aws_setup.put_secret_value(SecretId="my-secret", SecretString="rotated-value")
+
+    second = repo.get_secret_current("my-secret")
+
+    assert first == second == {"AWSCURRENT": "current-value"}
+
+
+def test_get_secret_is_reloaded_after_ttl(repo, aws_setup, monkeypatch):
+    monkeypatch.setattr(secret_repo, "SECRET_CACHE_TTL_SECONDS", 0)
+    first = repo.get_secret("my-secret", "AWSCURRENT")
+    aws_setup.put_secret_value(SecretId="my-secret", SecretString="rotated-value")
+
+    second = repo.get_secret("my-secret", "AWSCURRENT")
+
+    assert second.value == "rotated-value"
+    assert second.version_id != first.version_id
+
+
+def test_forced_refresh_is_rate_limited(repo, aws_setup, monkeypatch):
+    repo.get_secret("my-secret", "AWSCURRENT")
+    aws_setup.put_secret_value(SecretId="my-secret", SecretString="rotated-value")
+
+    assert repo.get_secret("my-secret", "AWSCURRENT", force_refresh=True).value == "current-value"
+
+    monkeypatch.setattr(secret_repo, "SECRET_MIN_REFRESH_SECONDS", 0)
+    assert repo.get_secret("my-secret", "AWSCURRENT", force_refresh=True).value == "rotated-value"
+
+
+def test_missing_secret_is_cached(monkeypatch):
+    monkeypatch.setattr(secret_repo, "SECRET_MIN_REFRESH_SECONDS", 60)
+    secret_manager = MagicMock()
+    secret_manager.get_secret_value.side_effect = ClientError(
+        {"Error": {"Code": "ResourceNotFoundException", "Message": "Not found"}}, "GetSecretValue"
+    )
+    repo = SecretRepo(secret_manager=secret_manager)
+
+    assert repo.get_secret_previous("my-secret") == {}
+    assert repo.get_secret_previous("my-secret") == {}
+    secret_manager.get_secret_value.assert_called_once()
+
+
+def test_missing_secret_is_read_again_sooner_than_the_ttl(monkeypatch):
+    monkeypatch.setattr(secret_repo, "SECRET_CACHE_TTL_SECONDS", 300)
+    monkeypatch.setattr(secret_repo, "SECRET_MIN_REFRESH_SECONDS", 0)
+    secret_manager = MagicMock()
+    secret_manager.get_secret_value.side_effect = [
+        ClientError({"Error": {"Code": "ThrottlingException", "Message": "Slow down"}}, "GetSecretValue"),
+        {"SecretString": "current-value", "VersionId": "v1"},
+    ]
+    repo = SecretRepo(secret_manager=secret_manager)
+
+    assert repo.get_secret_current("my-secret") == {}
+    assert repo.get_secret_current("my-secret") == {"AWSCURRENT": "current-value"}
+
+
+def test_failed_refresh_keeps_cached_value(monkeypatch):
+    monkeypatch.setattr(secret_repo, "SECRET_CACHE_TTL_SECONDS", 0)
+    secret_manager = MagicMock()
+    secret_manager.get_secret_value.side_effect = [
+        {"SecretString": "current-value", "VersionId": "v1"},
+        ClientError({"Error": {"Code": "ThrottlingException", "Message": "Slow down"}}, "GetSecretValue"),
+    ]
+    repo = SecretRepo(secret_manager=secret_manager)
+
+    assert repo.get_secret_current("my-secret") == {"AWSCURRENT": "current-value"}
+    assert repo.get_secret_current("my-secret") == {"AWSCURRENT": "current-value"}
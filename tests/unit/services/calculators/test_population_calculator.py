@@ -0,0 +1,171 @@
+import json
+from datetime import date
+from pathlib import Path
+from random import choice
+
+import pytest
+from faker import Faker
+from freezegun import freeze_time
+from hamcrest import assert_that, has_entries, is_
+
+from eligibility_signposting_api.model.campaign_config import CampaignConfig, Rules, RuleType
+from eligibility_signposting_api.model.eligibility_status import Status
+from eligibility_signposting_api.model.person import Person
+from eligibility_signposting_api.model.population import Population
+from eligibility_signposting_api.services.calculators.eligibility_calculator import EligibilityCalculator
+from eligibility_signposting_api.services.calculators.population_calculator import PopulationCalculator, RuleKey
+from tests.fixtures.builders.model import rule as rule_builder
+from tests.fixtures.builders.repos.person import person_rows_builder
+
+TEST_CONFIG_DIR = Path(__file__).parents[3] / "test_data" / "test_config"
+
+
+def build_people(faker: Faker, count: int = 60) -> list[Person]:
+    cohort_choices = [[], ["rsv_75_rolling"], ["rsv_75to79_2024"], ["rsv_75_rolling", "rsv_75to79_2024"], ["cohort1"]]
+    people = []
+    for _ in range(count):
+        dob = choice([date(1900, 1, 1), faker.date_of_birth(minimum_age=60, maximum_age=90)])
+        vaccines = choice([None, {"RSV": {"LAST_SUCCESSFUL_DATE": faker.past_date().strftime("%Y%m%d")}}])
+        people.append(
+            person_rows_builder(
+                faker.nhs_number(),
+                cohorts=choice(cohort_choices),
+                date_of_birth=dob,
+                postcode=choice(["SW19 1AA", "LS1 2AB"]),
+                icb=choice(["QE1", "QE2", None]),
+                vaccines=vaccines,
+            )
+        )
+    return people
+
+
+def assert_matches_row_wise_engine(people: list[Person], campaign_configs: list[CampaignConfig]):
+    population = Population(Person(person.data) for person in people)
+    results = PopulationCalculator(population, campaign_configs).get_condition_results(["ALL"], "ALL")
+
+    for position, person in enumerate(people):
+        row_wise = EligibilityCalculator(Person(person.data), campaign_configs).get_eligibility_status(
+            "N", ["ALL"], "ALL"
+        )
+        assert [condition.condition_name for condition in row_wise.conditions] == [
+            result.condition_name for result in results
+        ]
+        for condition, result in zip(row_wise.conditions, results, strict=True):
+            assert result.status_of(position) == condition.status, person.data
+            if condition.status == Status.not_actionable:
+                assert {str(rule_key.priority) for rule_key in result.reasons_for(position)} == {
+                    reason.rule_priority for reason in condition.suitability_rules
+                }, person.data
+
+
+@pytest.mark.parametrize(
+    ("config_file", "today"),
+    [
+        ("test_config_v1.0.0.json", "2025-06-01"),
+        ("test_config_v1.1.0.json", "2025-06-01"),
+        ("test_config_v1.2.0.json", "2025-06-01"),
+        ("test_config_v1.3.0.json", "2027-01-03 12:00"),
+        ("test_config_v1.4.0.json", "2027-01-03 12:00"),
+    ],
+)
+def test_statuses_match_row_wise_engine_for_test_configs(config_file: str, today: str, faker: Faker):
+    campaign_config = Rules.model_validate(json.loads((TEST_CONFIG_DIR / config_file).read_text())).campaign_config
+    people = build_people(faker)
+
+    with freeze_time(today):
+        assert_matches_row_wise_engine(people, [campaign_config])
+
+
+def test_statuses_match_row_wise_engine_across_conditions(faker: Faker):
+    campaign_configs = [
+        rule_builder.CampaignConfigFactory.build(
+            id="rsv",
+            target="RSV",
+            iterations=[
+                rule_builder.IterationFactory.build(
+                    iteration_cohorts=[
+                        rule_builder.Rsv75RollingCohortFactory.build(),
+                        rule_builder.Rsv75to79CohortFactory.build(),
+                        rule_builder.VirtualCohortFactory.build(priority=5),
+                    ],
+                    iteration_rules=[
+                        rule_builder.ICBFilterRuleFactory.build(),
+                        rule_builder.PersonAgeSuppressionRuleFactory.build(rule_stop=True, priority=5),
+                        rule_builder.PostcodeSuppressionRuleFactory.build(),
+                        rule_builder.DetainedEstateSuppressionRuleFactory.build(cohort_label="rsv_75_rolling"),
+                    ],
+                )
+            ],
+        ),
+        rule_builder.CampaignConfigFactory.build(
+            id="covid",
+            target="COVID",
+            iterations=[
+                rule_builder.IterationFactory.build(
+                    iteration_cohorts=[rule_builder.IterationCohortFactory.build(cohort_label="cohort1")],
+                    iteration_rules=[
+                        rule_builder.IterationRuleFactory.build(
+                            type=RuleType.suppression,
+                            attribute_level="COHORT",
+                            attribute_name="COHORT_LABEL",
+                            operator="MemberOf",
+                            comparator="virtual cohort label",
+                        ),
+                        rule_builder.IterationRuleFactory.build(
+                            type=RuleType.filter,
+                            attribute_level="TARGET",
+                            attribute_target="RSV",
+                            attribute_name="LAST_SUCCESSFUL_DATE",
+                            operator="D>",
+                            comparator="-30",
+                        ),
+                    ],
+                )
+            ],
+        ),
+    ]
+
+    assert_matches_row_wise_engine(build_people(faker), campaign_configs)
+
+
+def test_counts_per_cohort_and_rule(faker: Faker):
+    rule = rule_builder.ICBFilterRuleFactory.build()
+    campaign_config = rule_builder.CampaignConfigFactory.build(
+        target="RSV",
+        iterations=[
+            rule_builder.IterationFactory.build(
+                iteration_cohorts=[rule_builder.IterationCohortFactory.build(cohort_label="cohort1")],
+                iteration_rules=[rule],
+            )
+        ],
+    )
+    population = Population(
+        [
+            person_rows_builder(faker.nhs_number(), cohorts=["cohort1"], icb="QE1"),
+            person_rows_builder(faker.nhs_number(), cohorts=["cohort1"], icb="QE2"),
+            person_rows_builder(faker.nhs_number(), cohorts=["cohort2"], icb="QE1"),
+        ]
+    )
+
+    [result] = PopulationCalculator(population, [campaign_config]).get_condition_results(["ALL"], "ALL")
+
+    assert_that(result.status_counts(), has_entries({Status.actionable: 1, Status.not_eligible: 2}))
+    assert_that(result.cohort_counts()["cohort1"], has_entries({Status.actionable: 1, Status.not_eligible: 2}))
+    assert_that(result.rule_counts(), is_({RuleKey.of(rule): 1}))
+    assert result.statuses[Status.not_eligible] == 0b110  # noqa: PLR2004
+
+
+def test_population_masks_hold_the_people_with_each_value(faker: Faker):
+    people = build_people(faker, count=100)
+    population = Population(people)
+
+    for value, mask in population.attribute_values("PERSON", "POSTCODE"):
+        holders = {position for position, person in enumerate(people) if person.get_row("PERSON")["POSTCODE"] == value}
+        assert mask == sum(1 << position for position in holders), value
+    for labels, mask in population.cohort_label_sets():
+        holders = {
+            position
+            for position, person in enumerate(people)
+            if (frozenset(person.cohort_labels) if person.has_cohorts else None) == labels
+        }
+        assert mask == sum(1 << position for position in holders), labels
@@ -1,7 +1,7 @@
 from unittest.mock import patch
 
 import pytest
-from hamcrest import assert_that, equal_to, is_
+from hamcrest import assert_that, equal_to, is_, same_instance
 
 from eligibility_signposting_api.model import eligibility_status
 from eligibility_signposting_api.model.campaign_config import (
@@ -10,12 +10,15 @@ from eligibility_signposting_api.model.campaign_config import (
     RuleCode,
     RuleEntry,
     RuleName,
+    RuleOperator,
     RulesMapper,
     RuleText,
+    RuleType,
 )
 from eligibility_signposting_api.model.eligibility_status import Status
 from eligibility_signposting_api.model.person import Person
 from eligibility_signposting_api.services.calculators.rule_calculator import RuleCalculator
+from eligibility_signposting_api.services.operators.operators import OperatorRegistry
 from tests.fixtures.builders.model import rule as rule_builder
 
 
@@ -46,11 +49,11 @@ from tests.fixtures.builders.model import rule as rule_builder
             rule_builder.IterationRuleFactory.build(
                 attribute_level=RuleAttributeLevel.COHORT, attribute_name="COHORT_LABEL"
             ),
-            "",
+            set(),
         ),
     ],
 )
-def test_get_attribute_value_for_all_attribute_levels(person_data: Person, rule: IterationRule, expected: str):
+def test_get_attribute_value_for_all_attribute_levels(person_data: Person, rule: IterationRule, expected: str | set):
     # Given
     calc = RuleCalculator(person=person_data, rule=rule)
     # When
@@ -86,9 +89,9 @@ def test_get_attribute_value_for_all_attribute_levels(person_data: Person, rule:
     ],
 )
 @patch.object(RuleCalculator, "get_attribute_value")
-@patch.object(RuleCalculator, "evaluate_rule")
+@patch.object(RuleCalculator, "evaluate_status")
 def test_rule_code_resolution_in_evaluate_exclusion_function_for_rule_code_and_rule_text_input(  # noqa : PLR0913
-    mock_evaluate_rule,
+    mock_evaluate_status,
     mock_get_attribute_value,
     mapper_rule_entry_name,
     rule_code,
@@ -122,7 +125,7 @@ def test_rule_code_resolution_in_evaluate_exclusion_function_for_rule_code_and_r
 
     calc = RuleCalculator(person=person_data, rule=rule)
     mock_get_attribute_value.return_value = "SW19"
-    mock_evaluate_rule.return_value = (eligibility_status.Status.not_eligible, "reason", False)
+    mock_evaluate_status.return_value = (eligibility_status.Status.not_eligible, False)
 
     # When
     status, reason = calc.evaluate_exclusion()
@@ -156,9 +159,9 @@ def test_rule_code_resolution_in_evaluate_exclusion_function_for_rule_code_and_r
     ],
 )
 @patch.object(RuleCalculator, "get_attribute_value")
-@patch.object(RuleCalculator, "evaluate_rule")
+@patch.object(RuleCalculator, "evaluate_status")
 def test_rule_code_and_rule_text_resolution_in_evaluate_exclusion_function_for_rule_mappers_having_none_or_empty(
-    mock_evaluate_rule, mock_get_attribute_value, rule_mapper, comment
+    mock_evaluate_status, mock_get_attribute_value, rule_mapper, comment
 ):
     # Given
     person_data = Person([{"ATTRIBUTE_TYPE": "PERSON", "POSTCODE": "SW19"}])
@@ -174,7 +177,7 @@ def test_rule_code_and_rule_text_resolution_in_evaluate_exclusion_function_for_r
 
     calc = RuleCalculator(person=person_data, rule=rule)
     mock_get_attribute_value.return_value = "SW19"
-    mock_evaluate_rule.return_value = (eligibility_status.Status.not_eligible, "reason", False)
+    mock_evaluate_status.return_value = (eligibility_status.Status.not_eligible, False)
 
     # When
     status, reason = calc.evaluate_exclusion()
@@ -183,3 +186,28 @@ def test_rule_code_and_rule_text_resolution_in_evaluate_exclusion_function_for_r
     assert_that(status, is_(Status.not_eligible))
     assert_that(reason.rule_code, equal_to("postcode is M4"), comment)
     assert_that(reason.rule_text, equal_to("post code rule description"), comment)
+
+
+def test_matcher_is_built_once_and_reused_across_evaluations():
+    # Given
+    rule = rule_builder.IterationRuleFactory.build(
+        type=RuleType.filter,
+        attribute_level=RuleAttributeLevel.PERSON,
+        attribute_name="POSTCODE",
+        operator=RuleOperator.equals,
+        comparator="SW19[[NVL:SW19]]",
+    )
+
+    # When
+    with patch.object(OperatorRegistry, "get", wraps=OperatorRegistry.get) as mock_get:
+        first = RuleCalculator(person=Person([{"ATTRIBUTE_TYPE": "PERSON", "POSTCODE": "SW19"}]), rule=rule)
+        second = RuleCalculator(person=Person([{"ATTRIBUTE_TYPE": "PERSON"}]), rule=rule)
+        first_status, _ = first.evaluate_exclusion()
+        second_status, _ = second.evaluate_exclusion()
+
+    # Then
+    assert_that(mock_get.call_count, equal_to(1))
+    assert_that(RuleCalculator.get_matcher(rule), same_instance(rule.matcher))
+    assert_that(rule.matcher.item_default, equal_to("SW19"))
+    assert_that(first_status, is_(Status.not_eligible))
+    assert_that(second_status, is_(Status.not_eligible))
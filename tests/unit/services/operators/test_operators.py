@@ -597,3 +597,26 @@ def test_operator(
         equal_to(expected),
         f"{person_data!r} {rule_operator.name} {rule_value!r}{' - ' if test_comment else ''}{test_comment}",
     )
+
+
+@pytest.mark.parametrize(
+    ("person_data", "rule_operator", "rule_value", "expected"),
+    [
+        ({"cohort_a", "cohort_b"}, RuleOperator.is_in, "cohort_b,cohort_c", True),
+        ({"cohort_a"}, RuleOperator.is_in, "cohort_b,cohort_c", False),
+        (set(), RuleOperator.member_of, "cohort_b", False),
+        ({"cohort_a", "cohort_b"}, RuleOperator.not_in, "cohort_b,cohort_c", False),
+        ({"cohort_a"}, RuleOperator.not_member_of, "cohort_b,cohort_c", True),
+    ],
+)
+def test_membership_operators_accept_a_set_of_values(
+    person_data: set[str], rule_operator: RuleOperator, rule_value: str, *, expected: bool
+):
+    # Given
+    operator: Operator = OperatorRegistry.get(rule_operator)(rule_value=rule_value)
+
+    # When
+    actual = bool(operator.matches(person_data))  # pyright: ignore[reportArgumentType]
+
+    # Then
+    assert_that(actual, equal_to(expected), f"{person_data!r} {rule_operator.name} {rule_value!r}")
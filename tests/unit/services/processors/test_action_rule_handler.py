@@ -236,7 +236,7 @@ def test_handle_actions_matching_redirect_rule_overrides_default(
     ]
 
     mock_rule_instance = Mock()
-    mock_rule_instance.evaluate_exclusion.return_value = (Status.actionable, Mock(matcher_matched=True))
+    mock_rule_instance.matches.return_value = True
     mock_rule_calculator_class.return_value = mock_rule_instance
 
     matched_action_detail = handler._handle(MOCK_PERSON, active_iteration, RuleType.redirect)
@@ -302,7 +302,7 @@ def test_handle_actions_matching_not_eligible_rule_overrides_default(
     ]
 
     mock_rule_instance = Mock()
-    mock_rule_instance.evaluate_exclusion.return_value = (Status.actionable, Mock(matcher_matched=True))
+    mock_rule_instance.matches.return_value = True
     mock_rule_calculator_class.return_value = mock_rule_instance
 
     matched_action_detail = handler._handle(MOCK_PERSON, active_iteration, RuleType.not_eligible_actions)
@@ -368,7 +368,7 @@ def test_handle_actions_matching_not_actionable_rule_overrides_default(
     ]
 
     mock_rule_instance = Mock()
-    mock_rule_instance.evaluate_exclusion.return_value = (Status.actionable, Mock(matcher_matched=True))
+    mock_rule_instance.matches.return_value = True
     mock_rule_calculator_class.return_value = mock_rule_instance
 
     matched_action_detail = handler._handle(MOCK_PERSON, active_iteration, RuleType.not_actionable_actions)
@@ -435,10 +435,7 @@ def test_handle_non_matching_rule_returns_default(
         ],
     ]
 
-    mock_rule_calculator_class.return_value.evaluate_exclusion.return_value = (
-        Status.actionable,
-        Mock(matcher_matched=False),
-    )
+    mock_rule_calculator_class.return_value.matches.return_value = False
 
     matched_action_detail = handler._handle(MOCK_PERSON, active_iteration, rule_type)
 
@@ -514,8 +511,8 @@ def test_handle_multiple_rules_same_priority_all_match(
     ]
 
     mock_rule_calculator_class.side_effect = [
-        Mock(evaluate_exclusion=Mock(return_value=(Status.actionable, Mock(matcher_matched=True)))),
-        Mock(evaluate_exclusion=Mock(return_value=(Status.actionable, Mock(matcher_matched=True)))),
+        Mock(matches=Mock(return_value=True)),
+        Mock(matches=Mock(return_value=True)),
     ]
 
     matched_action_detail = handler._handle(MOCK_PERSON, active_iteration, RuleType.redirect)
@@ -576,8 +573,8 @@ def test_handle_multiple_rules_same_priority_one_mismatch(
     ]
 
     mock_rule_calculator_class.side_effect = [
-        Mock(evaluate_exclusion=Mock(return_value=(Status.actionable, Mock(matcher_matched=True)))),
-        Mock(evaluate_exclusion=Mock(return_value=(Status.actionable, Mock(matcher_matched=False)))),
+        Mock(matches=Mock(return_value=True)),
+        Mock(matches=Mock(return_value=False)),
     ]
 
     matched_action_detail = handler._handle(MOCK_PERSON, active_iteration, rule_type)
@@ -664,8 +661,8 @@ def test_handle_different_priority_rules_highest_priority_wins(
     ]
 
     mock_rule_calculator_class.side_effect = [
-        Mock(evaluate_exclusion=Mock(return_value=(Status.actionable, Mock(matcher_matched=True)))),
-        Mock(evaluate_exclusion=Mock(return_value=(Status.actionable, Mock(matcher_matched=True)))),
+        Mock(matches=Mock(return_value=True)),
+        Mock(matches=Mock(return_value=True)),
     ]
 
     matched_action_detail = handler._handle(MOCK_PERSON, active_iteration, rule_type)
@@ -718,10 +715,7 @@ def test_handle_no_actions_mapper_entry_for_rule_comms_returns_default(handler:
             ],
             None,
         ]
-        mock_rule_calculator_class.return_value.evaluate_exclusion.return_value = (
-            Status.actionable,
-            Mock(matcher_matched=True),
-        )
+        mock_rule_calculator_class.return_value.matches.return_value = True
 
         matched_action_detail = handler._handle(MOCK_PERSON, active_iteration, rule_type)
 
@@ -759,10 +753,7 @@ def test_handle_no_default_comms_and_no_matching_rule(handler: ActionRuleHandler
             None,
         )
         mock_get_actions_from_comms.side_effect = [None, None]
-        mock_rule_calculator_class.return_value.evaluate_exclusion.return_value = (
-            Status.actionable,
-            Mock(matcher_matched=True),
-        )
+        mock_rule_calculator_class.return_value.matches.return_value = True
 
         matched_action_detail = handler._handle(MOCK_PERSON, active_iteration, rule_type)
 
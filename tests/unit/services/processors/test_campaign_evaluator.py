@@ -147,3 +147,20 @@ def test_campaign_grouping_is_not_affected_by_order_for_mixed_types(campaign_eva
     )
     assert_that(len(result_v_first), is_(1))
     assert_that(result_v_first[0][1].type, is_("V"))
+
+
+def test_ambiguous_latest_iteration_for_same_target_raises(campaign_evaluator):
+    yesterday = datetime.datetime.now(datetime.UTC).date() - datetime.timedelta(days=1)
+    campaigns = [
+        rule.CampaignConfigFactory.build(
+            target="RSV",
+            type="V",
+            id=campaign_id,
+            start_date=yesterday,
+            iterations=[rule.IterationFactory.build(iteration_date=yesterday)],
+        )
+        for campaign_id in ("RSV_1", "RSV_2")
+    ]
+
+    with pytest.raises(ValueError, match=r"Ambiguous result: '2' active iterations for target RSV"):
+        list(campaign_evaluator.get_campaign_with_latest_active_iteration_per_target(campaigns, ["RSV"], "ALL"))
@@ -1,7 +1,9 @@
 import hashlib
 import hmac
+from unittest.mock import MagicMock
 
-from eligibility_signposting_api.processors.hashing_service import _hash
+from eligibility_signposting_api.processors.hashing_service import HashingService, HashSecretName, _hash
+from eligibility_signposting_api.repos.secret_repo import CachedSecret
 
 HASH_DIGEST_LENGTH_SHA512 = 128  # sha512 produces 512 bits = 64 bytes = 128 hex characters
 
@@ -72,3 +74,24 @@ def test_hash_uses_string_representation_of_nhs_number():
     result_from_str = _hash(nhs_number_str, secret_value)
 
     assert result_from_int == result_from_str
+
+
+def test_refresh_secrets_reports_rotation():
+    secret_repo = MagicMock()
+    secret_repo.get_secret.side_effect = [
+        CachedSecret("v1", "old-secret", 0),
+        CachedSecret("v2", "new-secret", 1),
+        CachedSecret("v0", "older-secret", 0),
+        CachedSecret("v0", "older-secret", 0),
+    ]
+    service = HashingService(secret_repo=secret_repo, hash_secret_name=HashSecretName("my-secret"))
+
+    assert service.refresh_secrets() is True
+
+
+def test_refresh_secrets_reports_no_rotation():
+    secret_repo = MagicMock()
+    secret_repo.get_secret.return_value = CachedSecret("v1", "secret", 0)
+    service = HashingService(secret_repo=secret_repo, hash_secret_name=HashSecretName("my-secret"))
+
+    assert service.refresh_secrets() is False
@@ -4,7 +4,7 @@ import pytest
 from hamcrest import assert_that, empty, is_
 
 from eligibility_signposting_api.model.campaign_config import CohortLabel, IterationCohort, RuleType
-from eligibility_signposting_api.model.eligibility_status import CohortGroupResult, Reason, RuleName, Status
+from eligibility_signposting_api.model.eligibility_status import CohortGroupResult, RuleName, Status
 from eligibility_signposting_api.model.person import Person
 from eligibility_signposting_api.services.processors.person_data_reader import PersonDataReader
 from eligibility_signposting_api.services.processors.rule_processor import RuleProcessor
@@ -27,10 +27,7 @@ MOCK_PERSON_DATA = Person([{"ATTRIBUTE_TYPE": "PERSON", "AGE": "30"}])
 
 @patch("eligibility_signposting_api.services.processors.rule_processor.RuleCalculator")
 def test_evaluate_rules_priority_group_all_actionable(mock_rule_calculator_class, rule_processor):
-    mock_rule_calculator_class.return_value.evaluate_exclusion.return_value = (
-        Status.actionable,
-        Mock(spec=Reason, matcher_matched=False),
-    )
+    mock_rule_calculator_class.return_value.evaluate_status.return_value = (Status.actionable, False)
 
     rule1 = rule_builder.IterationRuleFactory.build(priority=1, type=RuleType.filter)
     rule2 = rule_builder.IterationRuleFactory.build(priority=1, type=RuleType.filter)
@@ -41,20 +38,20 @@ def test_evaluate_rules_priority_group_all_actionable(mock_rule_calculator_class
     assert_that(status, is_(Status.actionable))
     assert_that(reasons, is_([]))
     assert_that(is_rule_stop, is_(False))
-    assert_that(mock_rule_calculator_class.call_count, is_(2))
+    assert_that(mock_rule_calculator_class.call_count, is_(1))
+    mock_rule_calculator_class.return_value.build_reason.assert_not_called()
 
 
 @patch("eligibility_signposting_api.services.processors.rule_processor.RuleCalculator")
-def test_evaluate_rules_priority_group_one_not_eligible(mock_rule_calculator_class, rule_processor):
+def test_evaluate_rules_priority_group_all_not_eligible(mock_rule_calculator_class, rule_processor):
     mock_rule_calculator_class.side_effect = [
-        Mock(evaluate_exclusion=Mock(return_value=(Status.actionable, Mock(spec=Reason, matcher_matched=False)))),
         Mock(
-            evaluate_exclusion=Mock(
-                return_value=(
-                    Status.not_eligible,
-                    ReasonFactory.build(rule_name="ExclusionReason", matcher_matched=True),
-                )
-            )
+            evaluate_status=Mock(return_value=(Status.not_eligible, True)),
+            build_reason=Mock(return_value=ReasonFactory.build(rule_name="Reason1", matcher_matched=True)),
+        ),
+        Mock(
+            evaluate_status=Mock(return_value=(Status.not_eligible, True)),
+            build_reason=Mock(return_value=ReasonFactory.build(rule_name="Reason2", matcher_matched=True)),
         ),
     ]
 
@@ -64,23 +61,39 @@ def test_evaluate_rules_priority_group_one_not_eligible(mock_rule_calculator_cla
 
     status, reasons, is_rule_stop = rule_processor.evaluate_rules_priority_group(MOCK_PERSON_DATA, rules_group)
 
+    assert_that(status, is_(Status.not_eligible))
+    assert_that([reason.rule_name for reason in reasons], is_([RuleName("Reason1"), RuleName("Reason2")]))
+    assert_that(is_rule_stop, is_(False))
+
+
+@patch("eligibility_signposting_api.services.processors.rule_processor.RuleCalculator")
+def test_evaluate_rules_priority_group_stops_at_first_rule_not_excluding(mock_rule_calculator_class, rule_processor):
+    first = Mock(
+        evaluate_status=Mock(return_value=(Status.not_eligible, True)),
+        build_reason=Mock(return_value=ReasonFactory.build(rule_name="ExclusionReason", matcher_matched=True)),
+    )
+    mock_rule_calculator_class.side_effect = [
+        first,
+        Mock(evaluate_status=Mock(return_value=(Status.actionable, False))),
+    ]
+
+    rule1 = rule_builder.IterationRuleFactory.build(priority=1, type=RuleType.filter, name="Rule1")
+    rule2 = rule_builder.IterationRuleFactory.build(priority=1, type=RuleType.filter, name="Rule2")
+    rule3 = rule_builder.IterationRuleFactory.build(priority=1, type=RuleType.filter, name="Rule3")
+    rules_group = iter([rule1, rule2, rule3])
+
+    status, reasons, is_rule_stop = rule_processor.evaluate_rules_priority_group(MOCK_PERSON_DATA, rules_group)
+
     assert_that(status, is_(Status.actionable))
-    assert_that(len(reasons), is_(1))
-    assert_that(reasons[0].rule_name, is_(RuleName("ExclusionReason")))
+    assert_that(reasons, is_(empty()))
     assert_that(is_rule_stop, is_(False))
     assert_that(mock_rule_calculator_class.call_count, is_(2))
+    first.build_reason.assert_not_called()
 
 
 @patch("eligibility_signposting_api.services.processors.rule_processor.RuleCalculator")
 def test_evaluate_rules_priority_group_with_rule_stop(mock_rule_calculator_class, rule_processor):
-    mock_rule_calculator_class.side_effect = [
-        Mock(evaluate_exclusion=Mock(return_value=(Status.actionable, Mock(spec=Reason, matcher_matched=False)))),
-        Mock(
-            evaluate_exclusion=Mock(
-                return_value=(Status.not_eligible, ReasonFactory.build(rule_name="StopReason", matcher_matched=True))
-            )
-        ),
-    ]
+    mock_rule_calculator_class.side_effect = [Mock(evaluate_status=Mock(return_value=(Status.actionable, False)))]
 
     rule1 = rule_builder.IterationRuleFactory.build(priority=1, type=RuleType.suppression, rule_stop=False)
     rule2 = rule_builder.IterationRuleFactory.build(priority=1, type=RuleType.suppression, rule_stop=True)
@@ -89,7 +102,7 @@ def test_evaluate_rules_priority_group_with_rule_stop(mock_rule_calculator_class
     status, reasons, is_rule_stop = rule_processor.evaluate_rules_priority_group(MOCK_PERSON_DATA, rules_group)
 
     assert_that(status, is_(Status.actionable))
-    assert_that(len(reasons), is_(1))
+    assert_that(reasons, is_(empty()))
     assert_that(is_rule_stop, is_(True))
 
 
@@ -154,7 +167,7 @@ def test_general_filter_rule_should_not_evaluate_in_isolation_without_matching_s
 
 
 @patch.object(RuleProcessor, "evaluate_rules_priority_group")
-@patch.object(RuleProcessor, "_should_skip_rule_group", return_value=False)
+@patch.object(RuleProcessor, "should_skip_rule_group", return_value=False)
 def test_is_eligible_by_filter_rules_eligible(
     mock_should_skip_rule_group, mock_evaluate_rules_priority_group, rule_processor
 ):
@@ -174,7 +187,7 @@ def test_is_eligible_by_filter_rules_eligible(
 
 
 @patch.object(RuleProcessor, "evaluate_rules_priority_group")
-@patch.object(RuleProcessor, "_should_skip_rule_group", return_value=False)
+@patch.object(RuleProcessor, "should_skip_rule_group", return_value=False)
 def test_is_eligible_by_filter_rules_not_eligible(
     mock_should_skip_rule_group, mock_evaluate_rules_priority_group, rule_processor
 ):
@@ -198,7 +211,7 @@ def test_is_eligible_by_filter_rules_not_eligible(
 
 
 @patch.object(RuleProcessor, "evaluate_rules_priority_group")
-@patch.object(RuleProcessor, "_should_skip_rule_group", return_value=False)
+@patch.object(RuleProcessor, "should_skip_rule_group", return_value=False)
 def test_evaluate_suppression_rules_actionable(
     mock_should_skip_rule_group, mock_evaluate_rules_priority_group, rule_processor
 ):
@@ -221,7 +234,7 @@ def test_evaluate_suppression_rules_actionable(
 
 
 @patch.object(RuleProcessor, "evaluate_rules_priority_group")
-@patch.object(RuleProcessor, "_should_skip_rule_group", return_value=False)
+@patch.object(RuleProcessor, "should_skip_rule_group", return_value=False)
 def test_evaluate_suppression_rules_not_actionable(
     mock_should_skip_rule_group, mock_evaluate_rules_priority_group, rule_processor
 ):
@@ -247,7 +260,7 @@ def test_evaluate_suppression_rules_not_actionable(
 
 
 @patch.object(RuleProcessor, "evaluate_rules_priority_group")
-@patch.object(RuleProcessor, "_should_skip_rule_group", return_value=False)
+@patch.object(RuleProcessor, "should_skip_rule_group", return_value=False)
 def test_evaluate_suppression_rules_stops_on_rule_stop(
     mock_should_skip_rule_group, mock_evaluate_rules_priority_group, rule_processor
 ):
@@ -278,7 +291,7 @@ def test_evaluate_suppression_rules_stops_on_rule_stop(
 
 
 @patch.object(RuleProcessor, "evaluate_rules_priority_group")
-@patch.object(RuleProcessor, "_should_skip_rule_group", return_value=False)
+@patch.object(RuleProcessor, "should_skip_rule_group", return_value=False)
 def test_evaluate_suppression_rules_does_not_stop_on_rule_stop_when_status_is_actionable(
     mock_should_skip_rule_group, mock_evaluate_rules_priority_group, rule_processor
 ):
@@ -373,7 +386,7 @@ def test_rules_get_group_by_types_of_rules(rule_processor):
 
 
 @patch.object(RuleProcessor, "evaluate_rules_priority_group")
-@patch.object(RuleProcessor, "_should_skip_rule_group", return_value=False)
+@patch.object(RuleProcessor, "should_skip_rule_group", return_value=False)
 def test_is_eligible_by_filter_rules(mock_should_skip_rule_group, mock_evaluate_rules_priority_group, rule_processor):
     cohort = rule_builder.IterationCohortFactory.build(cohort_label="COHORT_A")
     cohort_results = {}
@@ -391,7 +404,7 @@ def test_is_eligible_by_filter_rules(mock_should_skip_rule_group, mock_evaluate_
 
 
 @patch.object(RuleProcessor, "evaluate_rules_priority_group")
-@patch.object(RuleProcessor, "_should_skip_rule_group", return_value=False)
+@patch.object(RuleProcessor, "should_skip_rule_group", return_value=False)
 def test_is_not_eligible_by_filter_rules(
     mock_should_skip_rule_group, mock_evaluate_rules_priority_group, rule_processor
 ):
@@ -425,7 +438,7 @@ def test_is_not_eligible_by_filter_rules(
 
 
 @patch.object(RuleProcessor, "evaluate_rules_priority_group")
-@patch.object(RuleProcessor, "_should_skip_rule_group", return_value=False)
+@patch.object(RuleProcessor, "should_skip_rule_group", return_value=False)
 def test_is_actionable_by_suppression_rules(
     mock_should_skip_rule_group, mock_evaluate_rules_priority_group, rule_processor
 ):
@@ -448,7 +461,7 @@ def test_is_actionable_by_suppression_rules(
 
 
 @patch.object(RuleProcessor, "evaluate_rules_priority_group")
-@patch.object(RuleProcessor, "_should_skip_rule_group", return_value=False)
+@patch.object(RuleProcessor, "should_skip_rule_group", return_value=False)
 def test_is_not_actionable_by_suppression_rules(
     mock_should_skip_rule_group, mock_evaluate_rules_priority_group, rule_processor
 ):
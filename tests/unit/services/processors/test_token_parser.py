@@ -66,3 +66,29 @@ class TestTokenParser:
         parsed = TokenParser.parse("[[PERSON.DATE_OF_BIRTH:SOME_FUNC(abc)]]")
         assert_that(parsed.function_name, is_(equal_to("SOME_FUNC")))
         assert_that(parsed.function_args, is_(equal_to("abc")))
+
+    def test_compile_splits_text_around_parsed_tokens(self):
+        template = TokenParser.compile("Hi [[PERSON.NAME]], you are [[PERSON.AGE]].")
+
+        assert_that(template.literals, is_(equal_to(("Hi ", ", you are ", "."))))
+        assert_that(
+            template.tokens,
+            is_(
+                equal_to(
+                    (
+                        ("[[PERSON.NAME]]", TokenParser.parse("[[PERSON.NAME]]")),
+                        ("[[PERSON.AGE]]", TokenParser.parse("[[PERSON.AGE]]")),
+                    )
+                )
+            ),
+        )
+        assert_that(template.render(["Ann", "30"]), is_(equal_to("Hi Ann, you are 30.")))
+
+    def test_compile_caches_templates_by_text(self):
+        assert_that(TokenParser.compile("Age [[PERSON.AGE]]"), is_(TokenParser.compile("Age [[PERSON.AGE]]")))
+
+    def test_compile_text_without_tokens(self):
+        template = TokenParser.compile("No tokens here")
+
+        assert_that(template.literals, is_(equal_to(("No tokens here",))))
+        assert_that(template.tokens, is_(equal_to(())))
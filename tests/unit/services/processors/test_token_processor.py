@@ -4,45 +4,43 @@ import pytest
 from hamcrest import assert_that, calling, equal_to, is_, raises
 
 from eligibility_signposting_api.model import eligibility_status
+from eligibility_signposting_api.model.campaign_config import CohortLabel, RuleName
 from eligibility_signposting_api.model.eligibility_status import (
+    ActionCode,
+    ActionDescription,
+    ActionType,
     CohortGroupResult,
-    Condition,
-    ConditionName,
+    IterationResult,
+    IterationResultSummary,
+    MatchedActionDetail,
     Reason,
     RulePriority,
     RuleText,
     RuleType,
     Status,
     StatusText,
+    SuggestedAction,
+    UrlLabel,
 )
 from eligibility_signposting_api.model.person import Person
 from eligibility_signposting_api.services.processors.token_parser import ParsedToken
 from eligibility_signposting_api.services.processors.token_processor import TokenProcessor
 
 
+def result_summary(status_text: str, cohort_description: str | None = None) -> IterationResultSummary:
+    cohort_result = CohortGroupResult("CohortCode", Status.actionable, [], cohort_description, [])
+    return IterationResultSummary(IterationResult(Status.actionable, StatusText(status_text), [cohort_result], []))
+
+
 class TestTokenProcessor:
     def test_simple_token_replacement(self):
         person = Person([{"ATTRIBUTE_TYPE": "PERSON", "AGE": "30"}])
 
-        condition = Condition(
-            condition_name=ConditionName("RSV"),
-            status=Status.actionable,
-            status_text=StatusText("Your age is [[PERSON.AGE]]."),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Your age is [[PERSON.AGE]].")
 
-        expected = Condition(
-            condition_name=ConditionName("RSV"),
-            status=Status.actionable,
-            status_text=StatusText("Your age is 30."),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        expected = result_summary("Your age is 30.")
 
-        actual = TokenProcessor.find_and_replace_tokens(person, condition)
+        actual = TokenProcessor.replace_result_tokens(person, summary)
 
         assert_that(actual, is_(equal_to(expected)))
 
@@ -74,109 +72,69 @@ class TestTokenProcessor:
             audit_rules=[],
         )
 
-        condition = Condition(
-            condition_name=ConditionName("ConditionName"),
-            status=Status.not_actionable,
-            status_text=StatusText("Everything is [[PERSON.QUALITY]]."),
-            cohort_results=[cohort_result],
-            suitability_rules=[],
-            actions=[],
+        summary = IterationResultSummary(
+            IterationResult(Status.not_actionable, StatusText("Everything is [[PERSON.QUALITY]]."), [cohort_result], [])
         )
 
-        actual = TokenProcessor.find_and_replace_tokens(person, condition)
+        actual = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(actual.cohort_results[0].description, is_(equal_to("Results for cohort 30.")))
-        assert_that(actual.cohort_results[0].reasons[1].rule_text, is_(equal_to("Rule 30 here.")))
-        assert_that(actual.status_text, is_(equal_to(StatusText("Everything is NICE."))))
+        assert_that(actual.iteration_result.cohort_results[0].description, is_(equal_to("Results for cohort 30.")))
+        assert_that(actual.iteration_result.cohort_results[0].reasons[1].rule_text, is_(equal_to("Rule 30 here.")))
+        assert_that(actual.iteration_result.status_text, is_(equal_to(StatusText("Everything is NICE."))))
 
     def test_invalid_token_on_person_attribute_should_raise_error(self):
         person = Person([{"ATTRIBUTE_TYPE": "PERSON", "AGE": "30"}])
 
-        condition = Condition(
-            condition_name=ConditionName("RSV"),
-            status=Status.actionable,
-            status_text=StatusText("Your age is [[PERSON.ICECREAM]]."),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Your age is [[PERSON.ICECREAM]].")
 
         expected_error = re.escape("Invalid attribute name 'ICECREAM' in token '[[PERSON.ICECREAM]]'.")
 
         assert_that(
-            calling(TokenProcessor.find_and_replace_tokens).with_args(person, condition),
+            calling(TokenProcessor.replace_result_tokens).with_args(person, summary),
             raises(ValueError, pattern=expected_error),
         )
 
     def test_invalid_token_should_raise_error(self):
         person = Person([{"ATTRIBUTE_TYPE": "PERSON", "AGE": "30"}])
 
-        condition = Condition(
-            condition_name=ConditionName("RSV"),
-            status=Status.actionable,
-            status_text=StatusText("Your favourite flavor is: [[ICECREAM.FLAVOR]]."),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Your favourite flavor is: [[ICECREAM.FLAVOR]].")
 
         expected_error = re.escape("Invalid attribute level 'ICECREAM' in token '[[ICECREAM.FLAVOR]]'.")
         assert_that(
-            calling(TokenProcessor.find_and_replace_tokens).with_args(person, condition),
+            calling(TokenProcessor.replace_result_tokens).with_args(person, summary),
             raises(ValueError, pattern=expected_error),
         )
 
     def test_invalid_token_on_target_attribute_should_raise_error(self):
         person = Person([{"ATTRIBUTE_TYPE": "RSV", "LAST_SUCCESSFUL_DATE": "20250101"}])
 
-        condition = Condition(
-            condition_name=ConditionName("Condition name is [[TARGET.RSV.ICECREAM]]"),
-            status=Status.actionable,
-            status_text=StatusText("Some status"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Some status", "Condition name is [[TARGET.RSV.ICECREAM]]")
 
         expected_error = re.escape("Invalid attribute name 'ICECREAM' in token '[[TARGET.RSV.ICECREAM]]'.")
         assert_that(
-            calling(TokenProcessor.find_and_replace_tokens).with_args(person, condition),
+            calling(TokenProcessor.replace_result_tokens).with_args(person, summary),
             raises(ValueError, pattern=expected_error),
         )
 
     def test_missing_target_attribute_and_invalid_token_should_raise_error(self):
         person = Person([{"ATTRIBUTE_TYPE": "PERSON", "AGE": "30"}])
 
-        condition = Condition(
-            condition_name=ConditionName("Condition name is [[TARGET.RSV.ICECREAM]]"),
-            status=Status.actionable,
-            status_text=StatusText("Some status"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Some status", "Condition name is [[TARGET.RSV.ICECREAM]]")
 
         expected_error = re.escape("Invalid attribute name 'ICECREAM' in token '[[TARGET.RSV.ICECREAM]]'.")
         assert_that(
-            calling(TokenProcessor.find_and_replace_tokens).with_args(person, condition),
+            calling(TokenProcessor.replace_result_tokens).with_args(person, summary),
             raises(ValueError, pattern=expected_error),
         )
 
     def test_missing_patient_vaccine_data_on_target_attribute_should_replace_with_empty(self):
         person = Person([{"ATTRIBUTE_TYPE": "PERSON", "AGE": "30"}])
 
-        condition = Condition(
-            condition_name=ConditionName("Last successful date: [[TARGET.RSV.LAST_SUCCESSFUL_DATE]]"),
-            status=Status.actionable,
-            status_text=StatusText("Some status"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Some status", "Last successful date: [[TARGET.RSV.LAST_SUCCESSFUL_DATE]]")
 
-        actual = TokenProcessor.find_and_replace_tokens(person, condition)
+        actual = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(actual.condition_name, is_(equal_to("Last successful date: ")))
+        assert_that(actual.iteration_result.cohort_results[0].description, is_(equal_to("Last successful date: ")))
 
     def test_not_allowed_target_conditions_token_should_raise_error(self):
         person = Person(
@@ -186,20 +144,13 @@ class TestTokenProcessor:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Last successful date: [[TARGET.YELLOW_FEVER.LAST_SUCCESSFUL_DATE]]"),
-            status=Status.actionable,
-            status_text=StatusText("Some status"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Some status", "Last successful date: [[TARGET.YELLOW_FEVER.LAST_SUCCESSFUL_DATE]]")
 
         expected_error = re.escape(
             "Invalid attribute name 'LAST_SUCCESSFUL_DATE' in token '[[TARGET.YELLOW_FEVER.LAST_SUCCESSFUL_DATE]]'."
         )
         assert_that(
-            calling(TokenProcessor.find_and_replace_tokens).with_args(person, condition),
+            calling(TokenProcessor.replace_result_tokens).with_args(person, summary),
             raises(ValueError, pattern=expected_error),
         )
 
@@ -212,30 +163,20 @@ class TestTokenProcessor:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName(
-                "You had your RSV vaccine on [[TARGET.RSV.LAST_SUCCESSFUL_DATE:DATE(%d %B %Y)]]"
-            ),
-            status=Status.actionable,
-            status_text=StatusText("You are from [[PERSON.POSTCODE]]."),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
+        summary = result_summary(
+            "You are from [[PERSON.POSTCODE]].",
+            "You had your RSV vaccine on [[TARGET.RSV.LAST_SUCCESSFUL_DATE:DATE(%d %B %Y)]]",
         )
 
-        expected = Condition(
-            condition_name=ConditionName("You had your RSV vaccine on "),
-            status=Status.actionable,
-            status_text=StatusText("You are from ."),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        expected = result_summary("You are from .", "You had your RSV vaccine on ")
 
-        actual = TokenProcessor.find_and_replace_tokens(person, condition)
+        actual = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(actual.status_text, is_(equal_to(expected.status_text)))
-        assert_that(actual.condition_name, is_(equal_to(expected.condition_name)))
+        assert_that(actual.iteration_result.status_text, is_(equal_to(expected.iteration_result.status_text)))
+        assert_that(
+            actual.iteration_result.cohort_results[0].description,
+            is_(equal_to(expected.iteration_result.cohort_results[0].description)),
+        )
 
     def test_valid_token_but_missing_attribute_in_multiple_vacc_data_to_replace(self):
         person = Person(
@@ -248,30 +189,19 @@ class TestTokenProcessor:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName(
-                "You had your COVID vaccine on [[TARGET.COVID.LAST_SUCCESSFUL_DATE:DATE(%d %B %Y)]]"
-            ),
-            status=Status.actionable,
-            status_text=StatusText("status"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
+        summary = result_summary(
+            "status", "You had your COVID vaccine on [[TARGET.COVID.LAST_SUCCESSFUL_DATE:DATE(%d %B %Y)]]"
         )
 
-        expected = Condition(
-            condition_name=ConditionName("You had your COVID vaccine on 01 January 2025"),
-            status=Status.actionable,
-            status_text=StatusText("status"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        expected = result_summary("status", "You had your COVID vaccine on 01 January 2025")
 
-        actual = TokenProcessor.find_and_replace_tokens(person, condition)
+        actual = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(actual.status_text, is_(equal_to(expected.status_text)))
-        assert_that(actual.condition_name, is_(equal_to(expected.condition_name)))
+        assert_that(actual.iteration_result.status_text, is_(equal_to(expected.iteration_result.status_text)))
+        assert_that(
+            actual.iteration_result.cohort_results[0].description,
+            is_(equal_to(expected.iteration_result.cohort_results[0].description)),
+        )
 
     def test_simple_string_with_multiple_tokens(self):
         person = Person(
@@ -280,28 +210,14 @@ class TestTokenProcessor:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("RSV"),
-            status=Status.actionable,
-            status_text=StatusText(
-                "You are a [[PERSON.QUALITY]] [[person.QUALITY]] "
-                "[[TARGET.RSV.LAST_SUCCESSFUL_DATE]] and your age is [[PERSON.AGE]]."
-            ),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
+        summary = result_summary(
+            "You are a [[PERSON.QUALITY]] [[person.QUALITY]] "
+            "[[TARGET.RSV.LAST_SUCCESSFUL_DATE]] and your age is [[PERSON.AGE]]."
         )
 
-        expected = Condition(
-            condition_name=ConditionName("RSV"),
-            status=Status.actionable,
-            status_text=StatusText("You are a NICE NICE  and your age is 30."),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        expected = result_summary("You are a NICE NICE  and your age is 30.")
 
-        actual = TokenProcessor.find_and_replace_tokens(person, condition)
+        actual = TokenProcessor.replace_result_tokens(person, summary)
 
         assert_that(actual, is_(equal_to(expected)))
 
@@ -314,30 +230,20 @@ class TestTokenProcessor:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName(
-                "You had your COVID vaccine on [[TARGET.COVID.LAST_SUCCESSFUL_DATE:DATE(%d %B %Y)]]"
-            ),
-            status=Status.actionable,
-            status_text=StatusText("Your birthday is on [[PERSON.DATE_OF_BIRTH:DATE(%-d %B %Y)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
+        summary = result_summary(
+            "Your birthday is on [[PERSON.DATE_OF_BIRTH:DATE(%-d %B %Y)]]",
+            "You had your COVID vaccine on [[TARGET.COVID.LAST_SUCCESSFUL_DATE:DATE(%d %B %Y)]]",
         )
 
-        expected = Condition(
-            condition_name=ConditionName("You had your COVID vaccine on 01 January 2025"),
-            status=Status.actionable,
-            status_text=StatusText("Your birthday is on 27 March 1990"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        expected = result_summary("Your birthday is on 27 March 1990", "You had your COVID vaccine on 01 January 2025")
 
-        actual = TokenProcessor.find_and_replace_tokens(person, condition)
+        actual = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(actual.condition_name, is_(equal_to(expected.condition_name)))
-        assert_that(actual.status_text, is_(equal_to(expected.status_text)))
+        assert_that(
+            actual.iteration_result.cohort_results[0].description,
+            is_(equal_to(expected.iteration_result.cohort_results[0].description)),
+        )
+        assert_that(actual.iteration_result.status_text, is_(equal_to(expected.iteration_result.status_text)))
 
     @pytest.mark.parametrize(
         "token_format",
@@ -350,17 +256,10 @@ class TestTokenProcessor:
     def test_valid_token_invalid_format_should_raise_error(self, token_format: str):
         person = Person([{"ATTRIBUTE_TYPE": "PERSON", "AGE": "30", "DATE_OF_BIRTH": "19900327"}])
 
-        condition = Condition(
-            condition_name=ConditionName("You had your RSV vaccine"),
-            status=Status.actionable,
-            status_text=StatusText(f"Your birthday is on [[PERSON.DATE_OF_BIRTH{token_format}]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary(f"Your birthday is on [[PERSON.DATE_OF_BIRTH{token_format}]]")
 
         assert_that(
-            calling(TokenProcessor.find_and_replace_tokens).with_args(person, condition),
+            calling(TokenProcessor.replace_result_tokens).with_args(person, summary),
             raises(ValueError, pattern=r"Invalid token format\."),
         )
 
@@ -377,17 +276,10 @@ class TestTokenProcessor:
         """Test that unknown function names raise ValueError with appropriate message."""
         person = Person([{"ATTRIBUTE_TYPE": "PERSON", "AGE": "30", "DATE_OF_BIRTH": "19900327"}])
 
-        condition = Condition(
-            condition_name=ConditionName("You had your RSV vaccine"),
-            status=Status.actionable,
-            status_text=StatusText(f"Your birthday is on [[PERSON.DATE_OF_BIRTH{token_format}]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary(f"Your birthday is on [[PERSON.DATE_OF_BIRTH{token_format}]]")
 
         assert_that(
-            calling(TokenProcessor.find_and_replace_tokens).with_args(person, condition),
+            calling(TokenProcessor.replace_result_tokens).with_args(person, summary),
             raises(ValueError, pattern=f"Unknown function '{func_name}'"),
         )
 
@@ -413,18 +305,11 @@ class TestTokenProcessor:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName(f"Date: [[TARGET.MMR.LAST_SUCCESSFUL_DATE{token_format}]]"),
-            status=Status.actionable,
-            status_text=StatusText("Some text"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Some text", f"Date: [[TARGET.MMR.LAST_SUCCESSFUL_DATE{token_format}]]")
 
-        actual = TokenProcessor.find_and_replace_tokens(person, condition)
+        actual = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(actual.condition_name, is_(equal_to(f"Date: {expected}")))
+        assert_that(actual.iteration_result.cohort_results[0].description, is_(equal_to(f"Date: {expected}")))
 
     @pytest.mark.parametrize(
         ("token", "expected"),
@@ -447,19 +332,14 @@ class TestTokenProcessor:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName(f"FLU vaccine on: {token}."),
-            status=Status.actionable,
-            status_text=StatusText(f"Your DOB is: {token}."),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary(f"Your DOB is: {token}.", f"FLU vaccine on: {token}.")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(result.status_text, is_(equal_to(f"Your DOB is: {expected}.")))
-        assert_that(result.condition_name, is_(equal_to(f"FLU vaccine on: {expected}.")))
+        assert_that(result.iteration_result.status_text, is_(equal_to(f"Your DOB is: {expected}.")))
+        assert_that(
+            result.iteration_result.cohort_results[0].description, is_(equal_to(f"FLU vaccine on: {expected}."))
+        )
 
 
 class TestCustomTargetAttributeNames:
@@ -473,21 +353,14 @@ class TestCustomTargetAttributeNames:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Test"),
-            status=Status.actionable,
-            status_text=StatusText(
-                "Next booking: [[TARGET.COVID.NEXT_BOOKING_AVAILABLE:ADD_DAYS(71, LAST_SUCCESSFUL_DATE)]]"
-            ),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
+        summary = result_summary(
+            "Next booking: [[TARGET.COVID.NEXT_BOOKING_AVAILABLE:ADD_DAYS(71, LAST_SUCCESSFUL_DATE)]]"
         )
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
         # 2026-01-28 + 71 days = 2026-04-09
-        assert_that(result.status_text, is_(equal_to("Next booking: 20260409")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("Next booking: 20260409")))
 
     def test_custom_target_attribute_with_add_days_and_formatting(self):
         """Test that custom target attributes work with both ADD_DAYS and DATE formatting."""
@@ -497,21 +370,14 @@ class TestCustomTargetAttributeNames:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Test"),
-            status=Status.actionable,
-            status_text=StatusText(
-                "Date: [[TARGET.COVID.NEXT_BOOKING_AVAILABLE:ADD_DAYS(71, LAST_SUCCESSFUL_DATE):DATE(%d %B %Y)]]"
-            ),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
+        summary = result_summary(
+            "Date: [[TARGET.COVID.NEXT_BOOKING_AVAILABLE:ADD_DAYS(71, LAST_SUCCESSFUL_DATE):DATE(%d %B %Y)]]"
         )
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
         # 2026-01-28 + 71 days = 2026-04-09, formatted as "09 April 2026"
-        assert_that(result.status_text, is_(equal_to("Date: 09 April 2026")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("Date: 09 April 2026")))
 
     def test_custom_target_attribute_returns_empty_when_condition_not_present(self):
         """Test that custom target attributes return empty string when condition data not present."""
@@ -522,21 +388,14 @@ class TestCustomTargetAttributeNames:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Test"),
-            status=Status.actionable,
-            status_text=StatusText(
-                "Next booking: [[TARGET.COVID.NEXT_BOOKING_AVAILABLE:ADD_DAYS(71, LAST_SUCCESSFUL_DATE)]]"
-            ),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
+        summary = result_summary(
+            "Next booking: [[TARGET.COVID.NEXT_BOOKING_AVAILABLE:ADD_DAYS(71, LAST_SUCCESSFUL_DATE)]]"
         )
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
         # Should return empty string when condition data is not present
-        assert_that(result.status_text, is_(equal_to("Next booking: ")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("Next booking: ")))
 
     def test_multiple_custom_target_attributes_with_different_functions(self):
         """Test multiple custom target attributes with different parameters."""
@@ -546,22 +405,15 @@ class TestCustomTargetAttributeNames:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Test"),
-            status=Status.actionable,
-            status_text=StatusText(
-                "First: [[TARGET.COVID.CUSTOM_FIELD_A:ADD_DAYS(30, LAST_SUCCESSFUL_DATE)]] "
-                "Second: [[TARGET.COVID.CUSTOM_FIELD_B:ADD_DAYS(60, LAST_SUCCESSFUL_DATE)]]"
-            ),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
+        summary = result_summary(
+            "First: [[TARGET.COVID.CUSTOM_FIELD_A:ADD_DAYS(30, LAST_SUCCESSFUL_DATE)]] "
+            "Second: [[TARGET.COVID.CUSTOM_FIELD_B:ADD_DAYS(60, LAST_SUCCESSFUL_DATE)]]"
         )
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
         # 2026-01-28 + 30 = 2026-02-27, + 60 = 2026-03-29
-        assert_that(result.status_text, is_(equal_to("First: 20260227 Second: 20260329")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("First: 20260227 Second: 20260329")))
 
     def test_custom_target_attribute_raises_error_for_invalid_condition(self):
         """Test that invalid condition names still raise errors even with custom target attributes."""
@@ -571,17 +423,10 @@ class TestCustomTargetAttributeNames:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Test"),
-            status=Status.actionable,
-            status_text=StatusText("Invalid: [[TARGET.INVALID_CONDITION.CUSTOM_FIELD:ADD_DAYS(30)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Invalid: [[TARGET.INVALID_CONDITION.CUSTOM_FIELD:ADD_DAYS(30)]]")
 
         assert_that(
-            calling(TokenProcessor.find_and_replace_tokens).with_args(person, condition),
+            calling(TokenProcessor.replace_result_tokens).with_args(person, summary),
             raises(ValueError, pattern="Invalid attribute name 'CUSTOM_FIELD'"),
         )
 
@@ -593,18 +438,11 @@ class TestCustomTargetAttributeNames:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Test"),
-            status=Status.actionable,
-            status_text=StatusText("Invalid: [[TARGET.COVID.CUSTOM_INVALID_FIELD]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Invalid: [[TARGET.COVID.CUSTOM_INVALID_FIELD]]")
 
         # Non-derived tokens should only allow ALLOWED_TARGET_ATTRIBUTES
         assert_that(
-            calling(TokenProcessor.find_and_replace_tokens).with_args(person, condition),
+            calling(TokenProcessor.replace_result_tokens).with_args(person, summary),
             raises(ValueError, pattern="Invalid attribute name 'CUSTOM_INVALID_FIELD'"),
         )
 
@@ -623,18 +461,11 @@ class TestCustomTargetAttributeNames:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Test"),
-            status=Status.actionable,
-            status_text=StatusText(f"test token: [[{token}]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary(f"test token: [[{token}]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(result.status_text, is_(equal_to(f"test token: {expected}")))
+        assert_that(result.iteration_result.status_text, is_(equal_to(f"test token: {expected}")))
 
     def test_person_level_attribute_with_add_days_without_explicit_source(self):
         """Test that ADD_DAYS works on PERSON-level attributes without explicit source."""
@@ -644,19 +475,12 @@ class TestCustomTargetAttributeNames:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Test"),
-            status=Status.actionable,
-            status_text=StatusText("Future date: [[PERSON.DATE_OF_BIRTH:ADD_DAYS(91)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Future date: [[PERSON.DATE_OF_BIRTH:ADD_DAYS(91)]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
         # 1990-03-27 + 91 days = 1990-06-26
-        assert_that(result.status_text, is_(equal_to("Future date: 19900626")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("Future date: 19900626")))
 
     def test_person_level_attribute_with_add_days_explicit_source(self):
         """Test that ADD_DAYS works on PERSON-level attributes with explicit source."""
@@ -666,19 +490,12 @@ class TestCustomTargetAttributeNames:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Test"),
-            status=Status.actionable,
-            status_text=StatusText("Future date: [[PERSON.DATE_OF_BIRTH:ADD_DAYS(91, DATE_OF_BIRTH)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Future date: [[PERSON.DATE_OF_BIRTH:ADD_DAYS(91, DATE_OF_BIRTH)]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
         # 1990-03-27 + 91 days = 1990-06-26
-        assert_that(result.status_text, is_(equal_to("Future date: 19900626")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("Future date: 19900626")))
 
     def test_derived_value_with_no_function_name_raises_error(self):
         """Test that derived tokens without function name raise ValueError."""
@@ -695,7 +512,7 @@ class TestCustomTargetAttributeNames:
         assert_that(
             calling(TokenProcessor.get_derived_value).with_args(
                 parsed_token=parsed_token,
-                person_data=[{"ATTRIBUTE_TYPE": "COVID", "LAST_SUCCESSFUL_DATE": "20250101"}],
+                person=Person([{"ATTRIBUTE_TYPE": "COVID", "LAST_SUCCESSFUL_DATE": "20250101"}]),
                 present_attributes={"COVID"},
                 token="[[TARGET.COVID.NEXT_DOSE_DUE:]]",  # Malformed token
             ),
@@ -716,7 +533,7 @@ class TestCustomTargetAttributeNames:
         assert_that(
             calling(TokenProcessor.get_derived_value).with_args(
                 parsed_token=parsed_token,
-                person_data=[{"ATTRIBUTE_TYPE": "COVID", "LAST_SUCCESSFUL_DATE": "20250101"}],
+                person=Person([{"ATTRIBUTE_TYPE": "COVID", "LAST_SUCCESSFUL_DATE": "20250101"}]),
                 present_attributes={"COVID"},
                 token="[[TARGET.COVID.NEXT_DOSE_DUE:UNKNOWN_FUNCTION(30)]]",
             ),
@@ -737,9 +554,81 @@ class TestCustomTargetAttributeNames:
         assert_that(
             calling(TokenProcessor.get_derived_value).with_args(
                 parsed_token=parsed_token,
-                person_data=[{"ATTRIBUTE_TYPE": "COVID", "LAST_SUCCESSFUL_DATE": "20250101"}],
+                person=Person([{"ATTRIBUTE_TYPE": "COVID", "LAST_SUCCESSFUL_DATE": "20250101"}]),
                 present_attributes={"COVID"},
                 token="[[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(invalid_arg)]]",
             ),
             raises(ValueError, pattern=r"Error calculating derived value for token.*Invalid days argument"),
         )
+
+    def test_replace_result_tokens_replaces_user_visible_text_without_changing_the_summary(self):
+        person = Person([{"ATTRIBUTE_TYPE": "PERSON", "AGE": "30", "QUALITY": "NICE"}])
+        reason = Reason(
+            RuleType.suppression,
+            eligibility_status.RuleName("Rule [[PERSON.AGE]]"),
+            eligibility_status.RuleCode("Code [[PERSON.AGE]]"),
+            RulePriority("1"),
+            RuleText("Rule [[PERSON.AGE]] here."),
+            matcher_matched=True,
+        )
+        cohort_result = CohortGroupResult(
+            cohort_code="CohortCode[[PERSON.AGE]]",
+            status=Status.not_actionable,
+            reasons=[reason],
+            description="Results for cohort [[PERSON.AGE]].",
+            audit_rules=[reason],
+        )
+        summary = IterationResultSummary(
+            IterationResult(
+                Status.not_actionable, StatusText("Everything is [[PERSON.QUALITY]]."), [cohort_result], []
+            ),
+            cohort_results={CohortLabel("cohort"): cohort_result},
+        )
+
+        actual = TokenProcessor.replace_result_tokens(person, summary)
+
+        assert_that(actual.iteration_result.status_text, is_(equal_to("Everything is NICE.")))
+        for actual_cohort_result in [actual.iteration_result.cohort_results[0], actual.cohort_results["cohort"]]:
+            assert_that(actual_cohort_result.description, is_(equal_to("Results for cohort 30.")))
+            assert_that(actual_cohort_result.reasons[0].rule_text, is_(equal_to("Rule 30 here.")))
+            assert_that(actual_cohort_result.audit_rules[0].rule_text, is_(equal_to("Rule 30 here.")))
+            assert_that(actual_cohort_result.cohort_code, is_(equal_to("CohortCode30")))
+            assert_that(actual_cohort_result.reasons[0].rule_name, is_(equal_to("Rule 30")))
+            assert_that(actual_cohort_result.reasons[0].rule_code, is_(equal_to("Code 30")))
+            assert_that(actual_cohort_result.audit_rules[0].rule_code, is_(equal_to("Code 30")))
+        assert_that(summary.iteration_result.status_text, is_(equal_to("Everything is [[PERSON.QUALITY]].")))
+        assert_that(cohort_result.description, is_(equal_to("Results for cohort [[PERSON.AGE]].")))
+        assert_that(reason.rule_text, is_(equal_to("Rule [[PERSON.AGE]] here.")))
+
+    def test_replace_action_tokens_replaces_user_visible_text_without_changing_the_action_detail(self):
+        person = Person([{"ATTRIBUTE_TYPE": "PERSON", "AGE": "30"}])
+        action = SuggestedAction(
+            action_type=ActionType("ButtonWithAuthLink[[PERSON.AGE]]"),
+            action_code=ActionCode("BookNBS[[PERSON.AGE]]"),
+            action_description=ActionDescription("You are [[PERSON.AGE]]."),
+            url_link=None,
+            url_label=UrlLabel("Book at [[PERSON.AGE]]"),
+        )
+        action_detail = MatchedActionDetail(
+            rule_name=RuleName("Rule [[PERSON.AGE]]"),
+            actions=[action],
+            status_text_override=StatusText("Aged [[PERSON.AGE]]"),
+        )
+
+        actual = TokenProcessor.replace_action_tokens(person, action_detail)
+
+        assert_that(actual.status_text_override, is_(equal_to("Aged 30")))
+        assert_that(actual.actions[0].action_description, is_(equal_to("You are 30.")))
+        assert_that(actual.actions[0].url_label, is_(equal_to("Book at 30")))
+        assert_that(actual.actions[0].action_type, is_(equal_to("ButtonWithAuthLink30")))
+        assert_that(actual.actions[0].action_code, is_(equal_to("BookNBS30")))
+        assert_that(actual.rule_name, is_(equal_to("Rule 30")))
+        assert_that(action.action_description, is_(equal_to("You are [[PERSON.AGE]].")))
+        assert_that(action_detail.status_text_override, is_(equal_to("Aged [[PERSON.AGE]]")))
+
+    def test_replace_action_tokens_keeps_missing_actions(self):
+        action_detail = MatchedActionDetail()
+
+        actual = TokenProcessor.replace_action_tokens(Person([{"ATTRIBUTE_TYPE": "PERSON"}]), action_detail)
+
+        assert_that(actual, is_(equal_to(action_detail)))
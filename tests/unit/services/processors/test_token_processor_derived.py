@@ -5,8 +5,9 @@ import re
 from hamcrest import assert_that, calling, equal_to, is_, raises
 
 from eligibility_signposting_api.model.eligibility_status import (
-    Condition,
-    ConditionName,
+    CohortGroupResult,
+    IterationResult,
+    IterationResultSummary,
     Status,
     StatusText,
 )
@@ -14,6 +15,11 @@ from eligibility_signposting_api.model.person import Person
 from eligibility_signposting_api.services.processors.token_processor import TokenProcessor
 
 
+def result_summary(status_text: str, cohort_description: str | None = None) -> IterationResultSummary:
+    cohort_result = CohortGroupResult("CohortCode", Status.actionable, [], cohort_description, [])
+    return IterationResultSummary(IterationResult(Status.actionable, StatusText(status_text), [cohort_result], []))
+
+
 class TestTokenProcessorDerivedValues:
     """Tests for TokenProcessor handling derived values."""
 
@@ -25,19 +31,12 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("COVID"),
-            status=Status.actionable,
-            status_text=StatusText("Next dose due: [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Next dose due: [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91)]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
         # 2025-01-01 + 91 days = 2025-04-02
-        assert_that(result.status_text, is_(equal_to("Next dose due: 20250402")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("Next dose due: 20250402")))
 
     def test_next_dose_due_with_date_format(self):
         """Test NEXT_DOSE_DUE with date formatting."""
@@ -47,18 +46,11 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("COVID"),
-            status=Status.actionable,
-            status_text=StatusText("You can book from [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91):DATE(%d %B %Y)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("You can book from [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91):DATE(%d %B %Y)]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(result.status_text, is_(equal_to("You can book from 02 April 2025")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("You can book from 02 April 2025")))
 
     def test_next_dose_due_different_days(self):
         """Test NEXT_DOSE_DUE with different number of days."""
@@ -68,19 +60,12 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("RSV"),
-            status=Status.actionable,
-            status_text=StatusText("Next dose: [[TARGET.RSV.NEXT_DOSE_DUE:ADD_DAYS(365):DATE(%d/%m/%Y)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Next dose: [[TARGET.RSV.NEXT_DOSE_DUE:ADD_DAYS(365):DATE(%d/%m/%Y)]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
         # 2025-06-01 + 365 days = 2026-06-01
-        assert_that(result.status_text, is_(equal_to("Next dose: 01/06/2026")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("Next dose: 01/06/2026")))
 
     def test_missing_vaccine_data_returns_empty(self):
         """Test that missing vaccine data returns empty string for derived values."""
@@ -90,18 +75,11 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Next COVID dose: [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91)]]"),
-            status=Status.actionable,
-            status_text=StatusText("status"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("status", "Next COVID dose: [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91)]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(result.condition_name, is_(equal_to("Next COVID dose: ")))
+        assert_that(result.iteration_result.cohort_results[0].description, is_(equal_to("Next COVID dose: ")))
 
     def test_missing_last_successful_date_returns_empty(self):
         """Test that missing source date returns empty string."""
@@ -111,18 +89,11 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("COVID"),
-            status=Status.actionable,
-            status_text=StatusText("Next dose: [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Next dose: [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91)]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(result.status_text, is_(equal_to("Next dose: ")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("Next dose: ")))
 
     def test_custom_target_without_mapping_returns_empty(self):
         """Test unknown target without source override returns empty string."""
@@ -132,18 +103,11 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("COVID"),
-            status=Status.actionable,
-            status_text=StatusText("Due: [[TARGET.COVID.DOSE_DUE:ADD_DAYS(91)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Due: [[TARGET.COVID.DOSE_DUE:ADD_DAYS(91)]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(result.status_text, is_(equal_to("Due: ")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("Due: ")))
 
     def test_custom_target_with_source_override_uses_override(self):
         """Test custom target with explicit source override derives date."""
@@ -153,18 +117,11 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("COVID"),
-            status=Status.actionable,
-            status_text=StatusText("Next dose: [[TARGET.COVID.DOSE_DUE:ADD_DAYS(30, CUSTOM_DATE)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Next dose: [[TARGET.COVID.DOSE_DUE:ADD_DAYS(30, CUSTOM_DATE)]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(result.status_text, is_(equal_to("Next dose: 20250131")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("Next dose: 20250131")))
 
     def test_mixed_regular_and_derived_tokens(self):
         """Test mixing regular tokens with derived value tokens."""
@@ -175,21 +132,15 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("COVID"),
-            status=Status.actionable,
-            status_text=StatusText(
-                "At age [[PERSON.AGE]], your next dose is from "
-                "[[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91):DATE(%d %B %Y)]]"
-            ),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
+        summary = result_summary(
+            "At age [[PERSON.AGE]], your next dose is from [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91):DATE(%d %B %Y)]]"
         )
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(result.status_text, is_(equal_to("At age 65, your next dose is from 02 April 2025")))
+        assert_that(
+            result.iteration_result.status_text, is_(equal_to("At age 65, your next dose is from 02 April 2025"))
+        )
 
     def test_unknown_function_raises_error(self):
         """Test that unknown function name raises ValueError."""
@@ -199,17 +150,10 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("COVID"),
-            status=Status.actionable,
-            status_text=StatusText("[[TARGET.COVID.SOMETHING:UNKNOWN_FUNC(123)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("[[TARGET.COVID.SOMETHING:UNKNOWN_FUNC(123)]]")
 
         assert_that(
-            calling(TokenProcessor.find_and_replace_tokens).with_args(person, condition),
+            calling(TokenProcessor.replace_result_tokens).with_args(person, summary),
             raises(ValueError, pattern="Unknown function 'UNKNOWN_FUNC'"),
         )
 
@@ -222,20 +166,13 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("Vaccines"),
-            status=Status.actionable,
-            status_text=StatusText(
-                "COVID: [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91)]], FLU: [[TARGET.FLU.NEXT_DOSE_DUE:ADD_DAYS(365)]]"
-            ),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
+        summary = result_summary(
+            "COVID: [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS(91)]], FLU: [[TARGET.FLU.NEXT_DOSE_DUE:ADD_DAYS(365)]]"
         )
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(result.status_text, is_(equal_to("COVID: 20250402, FLU: 20260601")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("COVID: 20250402, FLU: 20260601")))
 
     def test_derived_value_uses_default_days_without_args(self):
         """Test that empty function args uses default days from handler config."""
@@ -245,20 +182,13 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("COVID"),
-            status=Status.actionable,
-            status_text=StatusText("Next dose: [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS()]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("Next dose: [[TARGET.COVID.NEXT_DOSE_DUE:ADD_DAYS()]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
         # Should use the default 91 days configured in __init__.py
         # 2025-01-01 + 91 days = 2025-04-02
-        assert_that(result.status_text, is_(equal_to("Next dose: 20250402")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("Next dose: 20250402")))
 
     def test_case_insensitive_function_name(self):
         """Test that function names are case insensitive."""
@@ -268,18 +198,11 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("COVID"),
-            status=Status.actionable,
-            status_text=StatusText("[[TARGET.COVID.NEXT_DOSE_DUE:add_days(91)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("[[TARGET.COVID.NEXT_DOSE_DUE:add_days(91)]]")
 
-        result = TokenProcessor.find_and_replace_tokens(person, condition)
+        result = TokenProcessor.replace_result_tokens(person, summary)
 
-        assert_that(result.status_text, is_(equal_to("20250402")))
+        assert_that(result.iteration_result.status_text, is_(equal_to("20250402")))
 
     def test_not_allowed_condition_with_derived_raises_error(self):
         """Test that non-allowed conditions raise error for derived values."""
@@ -289,19 +212,12 @@ class TestTokenProcessorDerivedValues:
             ]
         )
 
-        condition = Condition(
-            condition_name=ConditionName("YELLOW_FEVER"),
-            status=Status.actionable,
-            status_text=StatusText("[[TARGET.YELLOW_FEVER.NEXT_DOSE_DUE:ADD_DAYS(91)]]"),
-            cohort_results=[],
-            suitability_rules=[],
-            actions=[],
-        )
+        summary = result_summary("[[TARGET.YELLOW_FEVER.NEXT_DOSE_DUE:ADD_DAYS(91)]]")
 
         expected_error = re.escape(
             "Invalid attribute name 'NEXT_DOSE_DUE' in token '[[TARGET.YELLOW_FEVER.NEXT_DOSE_DUE:ADD_DAYS(91)]]'."
         )
         assert_that(
-            calling(TokenProcessor.find_and_replace_tokens).with_args(person, condition),
+            calling(TokenProcessor.replace_result_tokens).with_args(person, summary),
             raises(ValueError, pattern=expected_error),
         )
@@ -3,12 +3,14 @@ from unittest.mock import MagicMock
 import pytest
 from hamcrest import assert_that, empty
 
-from eligibility_signposting_api.model.campaign_config import CampaignConfig, CampaignID
+from eligibility_signposting_api.model.campaign_config import CampaignID
+from eligibility_signposting_api.model.campaign_index import CampaignIndex
 from eligibility_signposting_api.model.eligibility_status import NHSNumber
 from eligibility_signposting_api.repos import CampaignRepo, NotFoundError, PersonRepo
 from eligibility_signposting_api.repos.consumer_mapping_repo import ConsumerMappingRepo
 from eligibility_signposting_api.services import EligibilityService, UnknownPersonError
 from eligibility_signposting_api.services.calculators.eligibility_calculator import EligibilityCalculatorFactory
+from tests.fixtures.builders.model import rule
 from tests.fixtures.matchers.eligibility import is_eligibility_status
 
 
@@ -73,9 +75,9 @@ def test_get_eligibility_status_filters_permitted_campaigns(service, mock_repos)
     mock_repos["person"].get_eligibility_data.return_value = person_data
 
     # Available campaigns in system
-    camp_a = MagicMock(spec=CampaignConfig, id=CampaignID("CAMP_A"))
-    camp_b = MagicMock(spec=CampaignConfig, id=CampaignID("CAMP_B"))
-    mock_repos["campaign"].get_campaign_configs.return_value = [camp_a, camp_b]
+    camp_a = rule.CampaignConfigFactory.build(id=CampaignID("CAMP_A"))
+    camp_b = rule.CampaignConfigFactory.build(id=CampaignID("CAMP_B"))
+    mock_repos["campaign"].get_campaign_index.return_value = CampaignIndex([camp_a, camp_b])
 
     # Consumer is only permitted to see CAMP_B
     mock_repos["consumer"].get_permitted_campaign_ids.return_value = [CampaignID("CAMP_B")]
@@ -90,7 +92,10 @@ def test_get_eligibility_status_filters_permitted_campaigns(service, mock_repos)
 
     # Then
     # Verify the factory was called ONLY with camp_b
-    mock_repos["factory"].get.assert_called_once_with(person_data, [camp_b])
+    mock_repos["factory"].get.assert_called_once()
+    (called_person_data, called_campaigns), _ = mock_repos["factory"].get.call_args
+    assert called_person_data == person_data
+    assert list(called_campaigns) == [camp_b]
     assert result == "eligible_result"
 
 
@@ -100,3 +105,31 @@ def test_raises_unknown_person_error_on_repo_not_found(service, mock_repos):
 
     with pytest.raises(UnknownPersonError):
         service.get_eligibility_status(NHSNumber("999"), "Y", [], "", "any")
+
+
+def test_get_eligibility_statuses_evaluates_everyone_against_the_same_campaigns(service, mock_repos):
+    # Given
+    person_a, person_b = MagicMock(), MagicMock()
+    mock_repos["person"].get_eligibility_data_batch.return_value = {
+        NHSNumber("1111111111"): person_a,
+        NHSNumber("2222222222"): None,
+        NHSNumber("3333333333"): person_b,
+    }
+    campaign = rule.CampaignConfigFactory.build(id=CampaignID("CAMP_A"))
+    mock_repos["campaign"].get_campaign_index.return_value = CampaignIndex([campaign])
+    mock_repos["consumer"].get_permitted_campaign_ids.return_value = frozenset({CampaignID("CAMP_A")})
+    mock_repos["factory"].get.return_value.get_eligibility_status.side_effect = ["result_a", "result_b"]
+
+    # When
+    results = list(
+        service.get_eligibility_statuses(
+            [NHSNumber("1111111111"), NHSNumber("2222222222"), NHSNumber("3333333333")], "Y", ["ALL"], "ALL", "c"
+        )
+    )
+
+    # Then
+    assert results == [("1111111111", "result_a"), ("2222222222", None), ("3333333333", "result_b")]
+    mock_repos["campaign"].get_campaign_index.assert_called_once_with("c")
+    permitted = [call.args[1] for call in mock_repos["factory"].get.call_args_list]
+    assert permitted[0] is permitted[1]
+    assert list(permitted[0]) == [campaign]
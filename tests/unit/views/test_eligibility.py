@@ -1,28 +1,30 @@
 import json
 import logging
-from datetime import UTC, datetime
 from http import HTTPStatus
 from unittest.mock import MagicMock, patch
-from uuid import uuid4
 
 import pytest
 from brunns.matchers.data import json_matching as is_json_that
 from brunns.matchers.werkzeug import is_werkzeug_response as is_response
-from flask import Flask
+from flask import Flask, g
 from flask.testing import FlaskClient
 from hamcrest import assert_that, contains_exactly, has_entries, has_length, is_, none
 from wireup.integration.flask import get_app_container
 
-from eligibility_signposting_api.audit.audit_service import AuditService
+from eligibility_signposting_api.audit.audit_models import AuditEvent
+from eligibility_signposting_api.audit.audit_service import AuditDeliveryError, AuditService
 from eligibility_signposting_api.model.eligibility_status import (
     ActionCode,
     ActionDescription,
     ActionType,
     CohortGroupResult,
     Condition,
+    ConditionName,
     EligibilityStatus,
     NHSNumber,
+    RuleType,
     Status,
+    StatusText,
     SuggestedAction,
     UrlLabel,
     UrlLink,
@@ -30,15 +32,16 @@ from eligibility_signposting_api.model.eligibility_status import (
 from eligibility_signposting_api.services import EligibilityService, UnknownPersonError
 from eligibility_signposting_api.views.eligibility import (
     _get_or_default_query_params,
-    build_actions,
-    build_eligibility_cohorts,
-    build_suitability_results,
+    build_eligibility_payload,
+    build_suggestion_payload,
 )
 from eligibility_signposting_api.views.response_model import eligibility_response
 from tests.fixtures.builders.model.eligibility import (
     CohortResultFactory,
     ConditionFactory,
     EligibilityStatusFactory,
+    ReasonFactory,
+    SuggestedActionFactory,
 )
 from tests.fixtures.matchers.eligibility import is_eligibility_cohort
 from tests.integration.conftest import UNIQUE_CONSUMER_HEADER
@@ -47,7 +50,10 @@ logger = logging.getLogger(__name__)
 
 
 class FakeAuditService:
-    def audit(self, audit_record):
+    def audit_event(self, audit_event):
+        pass
+
+    def request_finished(self):
         pass
 
 
@@ -269,6 +275,33 @@ def test_unexpected_error(app: Flask, client: FlaskClient):
         )
 
 
+class FailingAuditService(FakeAuditService):
+    def __init__(self):
+        self.requests_finished = 0
+
+    def request_finished(self):
+        self.requests_finished += 1
+        msg = "1 audit records could not be sent to kinesis"
+        raise AuditDeliveryError(msg)
+
+
+def test_audit_delivery_error_fails_the_request(app: Flask, client: FlaskClient):
+    # Given
+    headers = {"nhs-login-nhs-number": "9876543210", UNIQUE_CONSUMER_HEADER: "test_consumer_id"}
+    audit_service = FailingAuditService()
+
+    with (
+        get_app_container(app).override.service(EligibilityService, new=FakeEligibilityService()),
+        get_app_container(app).override.service(AuditService, new=audit_service),
+    ):
+        # When
+        response = client.get("/patient-check/9876543210", headers=headers)
+
+    # Then
+    assert_that(response, is_response().with_status_code(HTTPStatus.INTERNAL_SERVER_ERROR))
+    assert_that(audit_service.requests_finished, is_(1))
+
+
 @pytest.mark.parametrize(
     ("cohort_results", "expected_eligibility_cohorts", "test_comment"),
     [
@@ -314,7 +347,7 @@ def test_unexpected_error(app: Flask, client: FlaskClient):
         ),
     ],
 )
-def test_build_eligibility_cohorts_results_consider_only_cohorts_groups_that_has_description(
+def test_eligibility_cohorts_consider_only_cohorts_groups_that_has_description(
     cohort_results: list[CohortGroupResult], expected_eligibility_cohorts: list[tuple[str, str, str]], test_comment
 ):
     condition: Condition = ConditionFactory.build(
@@ -322,7 +355,10 @@ def test_build_eligibility_cohorts_results_consider_only_cohorts_groups_that_has
         cohort_results=cohort_results,
     )
 
-    results = build_eligibility_cohorts(condition)
+    results = [
+        eligibility_response.EligibilityCohort.model_validate(cohort)
+        for cohort in build_suggestion_payload(condition)["eligibilityCohorts"]
+    ]
 
     assert_that(
         results,
@@ -339,7 +375,7 @@ def test_build_eligibility_cohorts_results_consider_only_cohorts_groups_that_has
 def test_no_suitability_rules_for_actionable():
     condition = ConditionFactory.build(status=Status.actionable, cohort_results=[])
 
-    results = build_suitability_results(condition)
+    results = build_suggestion_payload(condition)["suitabilityRules"]
 
     assert_that(results, has_length(0))
 
@@ -397,122 +433,114 @@ def test_no_suitability_rules_for_actionable():
         ),
     ],
 )
-def test_build_actions(suggested_actions, expected):
-    results = build_actions(ConditionFactory.build(actions=suggested_actions))
+def test_actions(suggested_actions, expected):
+    suggestion = build_suggestion_payload(ConditionFactory.build(actions=suggested_actions))
     if expected is None:
-        assert_that(results, is_(none()))
+        assert_that(suggestion.get("actions"), is_(none()))
     else:
+        results = [eligibility_response.Action.model_validate(action) for action in suggestion["actions"]]
         assert_that(results, contains_exactly(*expected))
 
 
-def test_excludes_nulls_via_build_response(client: FlaskClient):
-    mocked_response = eligibility_response.EligibilityResponse(
-        responseId=uuid4(),
-        meta=eligibility_response.Meta(lastUpdated=eligibility_response.LastUpdated(datetime(2023, 1, 1, tzinfo=UTC))),
-        processedSuggestions=[
-            eligibility_response.ProcessedSuggestion(
-                condition=eligibility_response.ConditionName("ConditionA"),
-                status=eligibility_response.Status.actionable,
-                statusText=eligibility_response.StatusText("Go ahead"),
-                eligibilityCohorts=[],
-                suitabilityRules=[],
-                actions=[
-                    eligibility_response.Action(
-                        actionType=eligibility_response.ActionType("TYPE_A"),
-                        actionCode=eligibility_response.ActionCode("CODE123"),
-                        description=eligibility_response.Description(""),  # Should be an empty string
-                        urlLink=eligibility_response.UrlLink(""),  # Should be an empty string
-                        urlLabel=eligibility_response.UrlLabel(""),  # Should be an empty string
-                    )
-                ],
+def get_single_action(client: FlaskClient, action: SuggestedAction) -> dict:
+    eligibility_status = EligibilityStatus(
+        conditions=[
+            Condition(
+                condition_name=ConditionName("ConditionA"),
+                status=Status.actionable,
+                cohort_results=[],
+                suitability_rules=[],
+                status_text=StatusText("Go ahead"),
+                actions=[action],
             )
-        ],
+        ]
     )
 
     with (
         patch(
             "eligibility_signposting_api.views.eligibility.EligibilityService.get_eligibility_status",
-            return_value=MagicMock(),  # No effect
+            return_value=eligibility_status,
         ),
         patch(
-            "eligibility_signposting_api.views.eligibility.AuditService.audit",
+            "eligibility_signposting_api.views.eligibility.AuditService.audit_event",
             return_value=MagicMock(),  # No effect
         ),
-        patch(
-            "eligibility_signposting_api.views.eligibility.build_eligibility_response",
-            return_value=mocked_response,
-        ),
     ):
         response = client.get(
             "/patient-check/12345",
             headers={"nhs-login-nhs-number": str(12345), UNIQUE_CONSUMER_HEADER: "test_customer_id"},
         )
-        assert response.status_code == HTTPStatus.OK
+    assert response.status_code == HTTPStatus.OK
+
+    payload = json.loads(response.data)
+    return payload["processedSuggestions"][0]["actions"][0]
+
 
-        payload = json.loads(response.data)
-        suggestion = payload["processedSuggestions"][0]
-        action = suggestion["actions"][0]
+def test_excludes_nulls_via_build_response(client: FlaskClient):
+    action = get_single_action(
+        client,
+        SuggestedAction(
+            action_type=ActionType("TYPE_A"),
+            action_code=ActionCode("CODE123"),
+            action_description=None,
+            url_link=None,
+            url_label=None,
+        ),
+    )
 
-        assert action["actionType"] == "TYPE_A"
-        assert action["actionCode"] == "CODE123"
-        assert action["description"] == ""
-        assert action["urlLink"] == ""
-        assert action["urlLabel"] == ""
+    assert action["actionType"] == "TYPE_A"
+    assert action["actionCode"] == "CODE123"
+    assert action["description"] == ""
+    assert action["urlLink"] == ""
+    assert action["urlLabel"] == ""
 
 
 def test_build_response_include_values_that_are_not_null(client: FlaskClient):
-    mocked_response = eligibility_response.EligibilityResponse(
-        responseId=uuid4(),
-        meta=eligibility_response.Meta(lastUpdated=eligibility_response.LastUpdated(datetime(2023, 1, 1, tzinfo=UTC))),
-        processedSuggestions=[
-            eligibility_response.ProcessedSuggestion(
-                condition=eligibility_response.ConditionName("ConditionA"),
-                status=eligibility_response.Status.actionable,
-                statusText=eligibility_response.StatusText("Go ahead"),
-                eligibilityCohorts=[],
-                suitabilityRules=[],
-                actions=[
-                    eligibility_response.Action(
-                        actionType=eligibility_response.ActionType("TYPE_A"),
-                        actionCode=eligibility_response.ActionCode("CODE123"),
-                        description=eligibility_response.Description("Contact GP"),
-                        urlLink=eligibility_response.UrlLink("https://example.dummy/"),
-                        urlLabel=eligibility_response.UrlLabel("GP contact"),
-                    )
+    action = get_single_action(
+        client,
+        SuggestedAction(
+            action_type=ActionType("TYPE_A"),
+            action_code=ActionCode("CODE123"),
+            action_description=ActionDescription("Contact GP"),
+            url_link=UrlLink("https://example.dummy/"),
+            url_label=UrlLabel("GP contact"),
+        ),
+    )
+
+    assert action["actionType"] == "TYPE_A"
+    assert action["actionCode"] == "CODE123"
+    assert action["description"] == "Contact GP"
+    assert action["urlLink"] == "https://example.dummy/"
+    assert action["urlLabel"] == "GP contact"
+
+
+@pytest.mark.parametrize("status", list(Status))
+def test_payload_follows_the_response_model(app: Flask, status: Status):
+    eligibility_status = EligibilityStatusFactory.build(
+        conditions=[
+            ConditionFactory.build(
+                status=status,
+                cohort_results=[
+                    CohortResultFactory.build(status=status, description="Described"),
+                    CohortResultFactory.build(status=status, description=None),
+                    CohortResultFactory.build(status=Status.not_eligible, description="Other status"),
+                ],
+                suitability_rules=[
+                    ReasonFactory.build(rule_type=RuleType.suppression, rule_text="Explained"),
+                    ReasonFactory.build(rule_type=RuleType.suppression, rule_text=None),
                 ],
+                actions=actions,
             )
-        ],
+            for actions in [None, [], SuggestedActionFactory.batch(2)]
+        ]
     )
 
-    with (
-        patch(
-            "eligibility_signposting_api.views.eligibility.EligibilityService.get_eligibility_status",
-            return_value=MagicMock(),  # No effect
-        ),
-        patch(
-            "eligibility_signposting_api.views.eligibility.AuditService.audit",
-            return_value=MagicMock(),  # No effect
-        ),
-        patch(
-            "eligibility_signposting_api.views.eligibility.build_eligibility_response",
-            return_value=mocked_response,
-        ),
-    ):
-        response = client.get(
-            "/patient-check/12345",
-            headers={"nhs-login-nhs-number": str(12345), UNIQUE_CONSUMER_HEADER: "test_customer_id"},
-        )
-        assert response.status_code == HTTPStatus.OK
-
-        payload = json.loads(response.data)
-        suggestion = payload["processedSuggestions"][0]
-        action = suggestion["actions"][0]
+    with app.app_context():
+        g.audit_log = AuditEvent()
+        payload = build_eligibility_payload(eligibility_status)
 
-        assert action["actionType"] == "TYPE_A"
-        assert action["actionCode"] == "CODE123"
-        assert action["description"] == "Contact GP"
-        assert action["urlLink"] == "https://example.dummy/"
-        assert action["urlLabel"] == "GP contact"
+    response = eligibility_response.EligibilityResponse.model_validate(payload)
+    assert payload == response.model_dump(by_alias=True, mode="json", exclude_none=True)
 
 
 def test_get_or_default_query_params_with_no_args(app: Flask):
@@ -618,3 +646,80 @@ def test_consumer_id_is_passed_to_service(app: Flask, client: FlaskClient):
 
         # Check that 'specific_consumer_123' was the consumer_id passed
         assert args[4] == "specific_consumer_123"
+
+
+class RecordingAuditService:
+    def __init__(self):
+        self.records = []
+
+    def audit_event(self, audit_event):
+        self.records.append(audit_event.model_dump(by_alias=True))
+
+    def request_finished(self):
+        pass
+
+
+def test_batch_returns_results_in_order_with_unknown_people(app: Flask, client: FlaskClient):
+    # Given
+    mock_service = MagicMock(spec=EligibilityService)
+    mock_service.get_eligibility_statuses.return_value = iter(
+        [
+            (NHSNumber("1111111111"), EligibilityStatusFactory.build()),
+            (NHSNumber("2222222222"), None),
+        ]
+    )
+    audit_service = RecordingAuditService()
+
+    with (
+        get_app_container(app).override.service(EligibilityService, new=mock_service),
+        get_app_container(app).override.service(AuditService, new=audit_service),
+    ):
+        # When
+        response = client.post(
+            "/patient-check/_batch?category=VACCINATIONS",
+            json={"nhsNumbers": ["1111111111", "2222222222", "1111111111"]},
+            headers={UNIQUE_CONSUMER_HEADER: "test_consumer_id"},
+        )
+
+    # Then
+    assert_that(
+        response,
+        is_response()
+        .with_status_code(HTTPStatus.OK)
+        .and_json(
+            has_entries(
+                results=contains_exactly(
+                    has_entries(nhsNumber="1111111111", eligibility=has_entries(processedSuggestions=has_length(2))),
+                    has_entries(nhsNumber="2222222222", diagnostics=is_(str)),
+                )
+            )
+        ),
+    )
+    args, _kwargs = mock_service.get_eligibility_statuses.call_args
+    assert args[0] == ["1111111111", "2222222222"]
+    assert args[3] == "VACCINATIONS"
+    assert [record["request"]["nhsNumber"] for record in audit_service.records] == ["1111111111"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        {"nhsNumbers": []},
+        {"nhsNumbers": "1111111111"},
+        {"nhsNumbers": [1111111111]},
+        {"nhsNumbers": ["1111111111"] * 101},
+    ],
+)
+def test_batch_rejects_invalid_body(client: FlaskClient, body):
+    response = client.post("/patient-check/_batch", json=body, headers={UNIQUE_CONSUMER_HEADER: "test_consumer_id"})
+
+    assert_that(response, is_response().with_status_code(HTTPStatus.BAD_REQUEST))
+
+
+def test_batch_rejects_nhs_login_requests(client: FlaskClient):
+    headers = {"nhs-login-nhs-number": "1111111111", UNIQUE_CONSUMER_HEADER: "test_consumer_id"}
+
+    response = client.post("/patient-check/_batch", json={"nhsNumbers": ["1111111111"]}, headers=headers)
+
+    assert_that(response, is_response().with_status_code(HTTPStatus.FORBIDDEN))